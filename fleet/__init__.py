@@ -14,7 +14,8 @@
 
 """Fleet Python SDK - Environment-based AI agent interactions."""
 
-from typing import Any, Optional, List
+import importlib
+from typing import TYPE_CHECKING, Any, Optional, List
 
 from .exceptions import (
     FleetError,
@@ -24,60 +25,125 @@ from .exceptions import (
     FleetInstanceLimitError,
     FleetConfigurationError,
 )
-from .client import Fleet, SyncEnv, Session
-from ._async.client import AsyncFleet, AsyncEnv, AsyncSession
-from .models import InstanceResponse, Environment, Run
-from .instance.models import Resource, ResetResponse
-
-# Import sync verifiers with explicit naming
-from .verifiers import (
-    verifier as verifier_sync,
-    SyncVerifierFunction,
-    DatabaseSnapshot,
-    IgnoreConfig,
-    SnapshotDiff,
-    TASK_FAILED_SCORE,
-    TASK_SUCCESSFUL_SCORE,
-    execute_verifier_local,
-    LocalEnvironment,
-    diff_dbs,
-)
-
-# Import async verifiers (default verifier is async for modern usage)
-from ._async.verifiers import (
-    verifier,
-    AsyncVerifierFunction,
-)
-
-# Import async tasks (default tasks are async for modern usage)
-from ._async.tasks import (
-    Task,
-    load_tasks as load_tasks_async,
-    load_tasks_from_file as load_tasks_from_file_async,
-    import_task as import_task_async,
-    import_tasks as import_tasks_async,
-    get_task as get_task_async,
-)
 
-# Import sync task functions
-from .tasks import (
-    load_tasks,
-    load_tasks_from_file,
-    import_task,
-    import_tasks,
-    get_task,
-)
-
-# Import shared types
-from .types import VerifierFunction
-
-# Import judge data classes
-from .judge import Rubric, Criterion, File, Image, JudgeResult
+if TYPE_CHECKING:
+    from .client import Fleet, SyncEnv, Session
+    from ._async.client import AsyncFleet, AsyncEnv, AsyncSession
+    from .models import InstanceResponse, Environment, Run
+    from .instance.models import Resource, ResetResponse
+    from .verifiers import (
+        verifier as verifier_sync,
+        SyncVerifierFunction,
+        DatabaseSnapshot,
+        DiffValidationError,
+        ExpectExactlyError,
+        IgnoreConfig,
+        SnapshotDiff,
+        TASK_FAILED_SCORE,
+        TASK_SUCCESSFUL_SCORE,
+        execute_verifier_local,
+        LocalEnvironment,
+        diff_dbs,
+    )
+    from ._async.verifiers import verifier, AsyncVerifierFunction
+    from ._async.tasks import (
+        Task,
+        load_tasks as load_tasks_async,
+        load_tasks_from_file as load_tasks_from_file_async,
+        import_task as import_task_async,
+        import_tasks as import_tasks_async,
+        get_task as get_task_async,
+    )
+    from .tasks import (
+        load_tasks,
+        load_tasks_from_file,
+        import_task,
+        import_tasks,
+        get_task,
+    )
+    from .types import VerifierFunction
+    from .judge import Rubric, Criterion, File, Image, JudgeResult
+    from . import env
+
+# Public names are resolved on first access (PEP 562) so that `import fleet`,
+# or importing a light submodule such as `fleet.verifiers.db`, does not pull
+# in httpx, pydantic models and both client stacks up front.
+# Maps attribute name -> (module relative to this package, attribute or None
+# for the module itself).
+_LAZY_ATTRS = {
+    # Core classes
+    "Fleet": (".client", "Fleet"),
+    "SyncEnv": (".client", "SyncEnv"),
+    "Session": (".client", "Session"),
+    "AsyncFleet": ("._async.client", "AsyncFleet"),
+    "AsyncEnv": ("._async.client", "AsyncEnv"),
+    "AsyncSession": ("._async.client", "AsyncSession"),
+    # Models
+    "InstanceResponse": (".models", "InstanceResponse"),
+    "Environment": (".models", "Environment"),
+    "Run": (".models", "Run"),
+    "Resource": (".instance.models", "Resource"),
+    "ResetResponse": (".instance.models", "ResetResponse"),
+    # Sync verifiers with explicit naming
+    "verifier_sync": (".verifiers", "verifier"),
+    "SyncVerifierFunction": (".verifiers", "SyncVerifierFunction"),
+    "DatabaseSnapshot": (".verifiers", "DatabaseSnapshot"),
+    "DiffValidationError": (".verifiers", "DiffValidationError"),
+    "ExpectExactlyError": (".verifiers", "ExpectExactlyError"),
+    "IgnoreConfig": (".verifiers", "IgnoreConfig"),
+    "SnapshotDiff": (".verifiers", "SnapshotDiff"),
+    "TASK_FAILED_SCORE": (".verifiers", "TASK_FAILED_SCORE"),
+    "TASK_SUCCESSFUL_SCORE": (".verifiers", "TASK_SUCCESSFUL_SCORE"),
+    "execute_verifier_local": (".verifiers", "execute_verifier_local"),
+    "LocalEnvironment": (".verifiers", "LocalEnvironment"),
+    "diff_dbs": (".verifiers", "diff_dbs"),
+    # Async verifiers (default verifier is async for modern usage)
+    "verifier": ("._async.verifiers", "verifier"),
+    "AsyncVerifierFunction": ("._async.verifiers", "AsyncVerifierFunction"),
+    # Async tasks (default tasks are async for modern usage)
+    "Task": ("._async.tasks", "Task"),
+    "load_tasks_async": ("._async.tasks", "load_tasks"),
+    "load_tasks_from_file_async": ("._async.tasks", "load_tasks_from_file"),
+    "import_task_async": ("._async.tasks", "import_task"),
+    "import_tasks_async": ("._async.tasks", "import_tasks"),
+    "get_task_async": ("._async.tasks", "get_task"),
+    # Sync task functions
+    "load_tasks": (".tasks", "load_tasks"),
+    "load_tasks_from_file": (".tasks", "load_tasks_from_file"),
+    "import_task": (".tasks", "import_task"),
+    "import_tasks": (".tasks", "import_tasks"),
+    "get_task": (".tasks", "get_task"),
+    # Shared types
+    "VerifierFunction": (".types", "VerifierFunction"),
+    # Judge data classes
+    "Rubric": (".judge", "Rubric"),
+    "Criterion": (".judge", "Criterion"),
+    "File": (".judge", "File"),
+    "Image": (".judge", "Image"),
+    "JudgeResult": (".judge", "JudgeResult"),
+    # Module-level env attribute for convenient access
+    "env": (".env", None),
+    # Global client modules backing configure()/get_client()/session()
+    "_global_client": (".global_client", None),
+    "_async_global_client": ("._async.global_client", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Create a module-level env attribute for convenient access
-from . import env
-from . import global_client as _global_client
-from ._async import global_client as _async_global_client
 
 __version__ = "0.2.124"
 
@@ -113,6 +179,8 @@ __all__ = [
     "AsyncVerifierFunction",
     "SyncVerifierFunction",
     "DatabaseSnapshot",
+    "DiffValidationError",
+    "ExpectExactlyError",
     "IgnoreConfig",
     "SnapshotDiff",
     "TASK_FAILED_SCORE",
@@ -168,6 +236,9 @@ def configure(
         from .config import DEFAULT_TIMEOUT as _TO
 
         timeout = _TO
+    from . import global_client as _global_client
+    from ._async import global_client as _async_global_client
+
     _global_client.configure(
         api_key=api_key, base_url=base_url, max_retries=max_retries, timeout=timeout
     )
@@ -176,13 +247,18 @@ def configure(
     )
 
 
-def get_client() -> Fleet:
+def get_client() -> "Fleet":
     """Get the global sync client."""
+    from . import global_client as _global_client
+
     return _global_client.get_client()
 
 
 def reset_client():
     """Reset both sync and async global clients."""
+    from . import global_client as _global_client
+    from ._async import global_client as _async_global_client
+
     _global_client.reset_client()
     _async_global_client.reset_client()
 
@@ -194,7 +270,7 @@ def session(
     model: Optional[str] = None,
     task_key: Optional[str] = None,
     instance_id: Optional[str] = None,
-) -> Session:
+) -> "Session":
     """Start a new session for logging agent interactions (sync).
 
     This returns a Session object. The session is created on the backend
@@ -216,6 +292,8 @@ def session(
         session.log(history, response)
         session.complete()
     """
+    from . import global_client as _global_client
+
     client = _global_client.get_client()
     return client.start_session(
         session_id=session_id,
@@ -234,7 +312,7 @@ def session_async(
     model: Optional[str] = None,
     task_key: Optional[str] = None,
     instance_id: Optional[str] = None,
-) -> AsyncSession:
+) -> "AsyncSession":
     """Start a new session for logging agent interactions (async).
 
     This returns an AsyncSession object. The session is created on the backend
@@ -256,6 +334,8 @@ def session_async(
         await session.log(history, response)
         await session.complete()
     """
+    from ._async import global_client as _async_global_client
+
     client = _async_global_client.get_client()
     return client.start_session(
         session_id=session_id,
@@ -280,6 +360,8 @@ def job(name: Optional[str] = None) -> str:
         job_id = fleet.job("my-agent-run")
         session = fleet.session(job_id=job_id, ...)
     """
+    from . import global_client as _global_client
+
     client = _global_client.get_client()
     return client.trace_job(name=name)
 
@@ -297,5 +379,7 @@ async def job_async(name: Optional[str] = None) -> str:
         job_id = await fleet.job_async("my-agent-run")
         session = await fleet.session_async(job_id=job_id, ...)
     """
+    from ._async import global_client as _async_global_client
+
     client = _async_global_client.get_client()
     return await client.trace_job(name=name)
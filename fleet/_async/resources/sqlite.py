@@ -18,11 +18,14 @@ if TYPE_CHECKING:
 
 # Import types from verifiers module
 from fleet.verifiers.db import (
+    DiffValidationError,
     IgnoreConfig,
     _get_row_identifier,
     _format_row_for_error,
     _values_equivalent,
-    validate_diff_expect_exactly,
+    _raise_collected_errors,
+    _row_error,
+    assert_diff_expect_exactly,
 )
 
 
@@ -459,11 +462,15 @@ class AsyncSnapshotDiff:
 
             for table in added_tables:
                 if not self.ignore_config.should_ignore_table(table):
-                    raise AssertionError(f"Unexpected table added: {table}")
+                    raise _row_error(
+                        "table_added", table, None, f"Unexpected table added: {table}"
+                    )
 
             for table in removed_tables:
                 if not self.ignore_config.should_ignore_table(table):
-                    raise AssertionError(f"Unexpected table removed: {table}")
+                    raise _row_error(
+                        "table_removed", table, None, f"Unexpected table removed: {table}"
+                    )
 
             # Prepare tables to check
             tables_to_check = []
@@ -512,7 +519,16 @@ class AsyncSnapshotDiff:
                             f"Unexpected change in table '{table}': "
                             f"row count changed from {before_count} to {after_count}"
                         )
-                        errors.append(AssertionError(error_msg))
+                        errors.append(
+                            _row_error(
+                                "row_count",
+                                table,
+                                None,
+                                error_msg,
+                                before=before_count,
+                                after=after_count,
+                            )
+                        )
                     elif before_count > 0 and before_count <= 1000:
                         # Mark for detailed verification
                         tables_needing_verification.append(table)
@@ -525,7 +541,7 @@ class AsyncSnapshotDiff:
 
             # Check if any errors occurred during count checking
             if errors:
-                raise errors[0]
+                _raise_collected_errors(errors)
 
             # Now verify small tables for data changes (also in parallel)
             if tables_needing_verification:
@@ -542,7 +558,7 @@ class AsyncSnapshotDiff:
 
                 # Check if any errors occurred during verification
                 if verification_errors:
-                    raise verification_errors[0]
+                    _raise_collected_errors(verification_errors)
 
             return self
 
@@ -574,13 +590,18 @@ class AsyncSnapshotDiff:
 
         # Quick check: if column counts differ, there's a schema change
         if before_response.columns != after_response.columns:
-            raise AssertionError(f"Schema changed in table '{table}'")
+            raise _row_error("schema", table, None, f"Schema changed in table '{table}'")
 
         # Compare row by row
         if len(before_response.rows) != len(after_response.rows):
-            raise AssertionError(
+            raise _row_error(
+                "row_count",
+                table,
+                None,
                 f"Row count mismatch in table '{table}': "
-                f"{len(before_response.rows)} vs {len(after_response.rows)}"
+                f"{len(before_response.rows)} vs {len(after_response.rows)}",
+                before=len(before_response.rows),
+                after=len(after_response.rows),
             )
 
         for i, (before_row, after_row) in enumerate(
@@ -598,9 +619,15 @@ class AsyncSnapshotDiff:
                     before_dict.get(field), after_dict.get(field)
                 ):
                     pk_val = before_dict.get(pk_columns[0]) if pk_columns else i
-                    raise AssertionError(
+                    raise _row_error(
+                        "modification",
+                        table,
+                        pk_val,
                         f"Unexpected change in table '{table}', row {pk_val}, "
-                        f"field '{field}': {repr(before_dict.get(field))} -> {repr(after_dict.get(field))}"
+                        f"field '{field}': {repr(before_dict.get(field))} -> {repr(after_dict.get(field))}",
+                        field,
+                        before_dict.get(field),
+                        after_dict.get(field),
                     )
 
     def _is_field_change_allowed(
@@ -685,18 +712,36 @@ class AsyncSnapshotDiff:
                                     f"row {pk}, field '{field}': "
                                     f"{repr(before_val)} -> {repr(after_val)}"
                                 )
-                                errors.append(AssertionError(error_msg))
+                                errors.append(
+                                    _row_error(
+                                        "modification",
+                                        table,
+                                        pk,
+                                        error_msg,
+                                        field,
+                                        before_val,
+                                        after_val,
+                                    )
+                                )
                                 return  # Stop checking this row
                 elif not before_row and after_row:
                     # Added row
                     if not self._is_row_change_allowed(table_changes, pk, "__added__"):
                         error_msg = f"Unexpected row added in table '{table}': {pk}"
-                        errors.append(AssertionError(error_msg))
+                        errors.append(
+                            _row_error(
+                                "insertion", table, pk, error_msg, after="__added__"
+                            )
+                        )
                 elif before_row and not after_row:
                     # Removed row
                     if not self._is_row_change_allowed(table_changes, pk, "__removed__"):
                         error_msg = f"Unexpected row removed from table '{table}': {pk}"
-                        errors.append(AssertionError(error_msg))
+                        errors.append(
+                            _row_error(
+                                "deletion", table, pk, error_msg, after="__removed__"
+                            )
+                        )
             except Exception as e:
                 errors.append(e)
 
@@ -726,7 +771,7 @@ class AsyncSnapshotDiff:
 
         # Check for errors from row checks
         if errors:
-            raise errors[0]
+            _raise_collected_errors(errors)
 
         # Now check tables not mentioned in allowed_changes to ensure no changes
         all_tables = set(await self.before.tables()) | set(await self.after.tables())
@@ -764,7 +809,16 @@ class AsyncSnapshotDiff:
                         f"Unexpected change in table '{table}': "
                         f"row count changed from {before_count} to {after_count}"
                     )
-                    errors.append(AssertionError(error_msg))
+                    errors.append(
+                        _row_error(
+                            "row_count",
+                            table,
+                            None,
+                            error_msg,
+                            before=before_count,
+                            after=after_count,
+                        )
+                    )
             except Exception as e:
                 errors.append(e)
 
@@ -774,7 +828,7 @@ class AsyncSnapshotDiff:
 
         # Final error check
         if errors:
-            raise errors[0]
+            _raise_collected_errors(errors)
 
         return self
 
@@ -783,25 +837,24 @@ class AsyncSnapshotDiff:
     ):
         """Validate a collected diff against allowed changes."""
 
+        # Index the specs by (table, pk, field) once so each change only consults
+        # its own specs. PKs are compared as strings to tolerate int/str mismatches.
+        specs_by_field: Dict[Tuple[str, str, Optional[str]], List[Dict[str, Any]]] = {}
+        for allowed in allowed_changes:
+            allowed_pk = allowed.get("pk")
+            if allowed_pk is not None:
+                specs_by_field.setdefault(
+                    (allowed["table"], str(allowed_pk), allowed.get("field")), []
+                ).append(allowed)
+
         def _is_change_allowed(
             table: str, row_id: Any, field: Optional[str], after_value: Any
         ) -> bool:
             """Check if a change is in the allowed list using semantic comparison."""
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                # Handle type conversion for primary key comparison
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and allowed.get("field") == field
-                    and _values_equivalent(allowed.get("after"), after_value)
-                ):
-                    return True
-            return False
+            return any(
+                _values_equivalent(allowed.get("after"), after_value)
+                for allowed in specs_by_field.get((table, str(row_id), field), [])
+            )
 
         # Collect all unexpected changes
         unexpected_changes = []
@@ -904,7 +957,7 @@ class AsyncSnapshotDiff:
             else:
                 error_lines.append("  (No changes were allowed)")
 
-            raise AssertionError("\n".join(error_lines))
+            raise DiffValidationError("\n".join(error_lines), unexpected_changes)
 
         return self
 
@@ -938,21 +991,22 @@ class AsyncSnapshotDiff:
                     spec_map[field_name] = (True, expected_value)
             return spec_map
 
+        # Index the specs by (table, pk) once; each checked pk then finds its
+        # specs directly. PKs are compared as strings to tolerate int/str mismatches.
+        specs_by_pk: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for allowed in allowed_changes:
+            specs_by_pk.setdefault(
+                (allowed["table"], str(allowed.get("pk"))), []
+            ).append(allowed)
+
         def _get_all_specs_for_pk(table: str, pk: Any) -> List[Dict[str, Any]]:
             """Get all specs for a given table/pk (for legacy multi-field specs)."""
-            specs = []
-            for allowed in allowed_changes:
-                if (
-                    allowed["table"] == table
-                    and str(allowed.get("pk")) == str(pk)
-                ):
-                    specs.append(allowed)
-            return specs
+            return specs_by_pk.get((table, str(pk)), [])
 
         def _validate_insert_row(
             table: str, pk: Any, row_data: Dict[str, Any], specs: List[Dict[str, Any]]
-        ) -> Optional[str]:
-            """Validate an inserted row against specs. Returns error message or None."""
+        ) -> Optional[DiffValidationError]:
+            """Validate an inserted row against specs. Returns the error or None."""
             # Check for type: "insert" spec with fields
             for spec in specs:
                 if spec.get("type") == "insert":
@@ -966,12 +1020,24 @@ class AsyncSnapshotDiff:
                             if self.ignore_config.should_ignore_field(table, field_name):
                                 continue
                             if field_name not in spec_map:
-                                return f"Field '{field_name}' not in insert spec for table '{table}' pk={pk}"
+                                return _row_error(
+                                    "insertion",
+                                    table,
+                                    pk,
+                                    f"Field '{field_name}' not in insert spec for table '{table}' pk={pk}",
+                                    field_name,
+                                    after=field_value,
+                                )
                             should_check, expected_value = spec_map[field_name]
                             if should_check and not _values_equivalent(expected_value, field_value):
-                                return (
+                                return _row_error(
+                                    "insertion",
+                                    table,
+                                    pk,
                                     f"Insert mismatch in table '{table}' pk={pk}, "
-                                    f"field '{field_name}': expected {repr(expected_value)}, got {repr(field_value)}"
+                                    f"field '{field_name}': expected {repr(expected_value)}, got {repr(field_value)}",
+                                    field_name,
+                                    after=field_value,
                                 )
                     # type: "insert" found (with or without fields) - allowed
                     return None
@@ -981,12 +1047,18 @@ class AsyncSnapshotDiff:
                 if spec.get("fields") is None and spec.get("after") == "__added__":
                     return None
 
-            return f"Unexpected row added in table '{table}': pk={pk}"
+            return _row_error(
+                "insertion",
+                table,
+                pk,
+                f"Unexpected row added in table '{table}': pk={pk}",
+                after="__added__",
+            )
 
         def _validate_delete_row(
             table: str, pk: Any, row_data: Dict[str, Any], specs: List[Dict[str, Any]]
-        ) -> Optional[str]:
-            """Validate a deleted row against specs. Returns error message or None."""
+        ) -> Optional[DiffValidationError]:
+            """Validate a deleted row against specs. Returns the error or None."""
             # Check for type: "delete" spec with optional fields
             for spec in specs:
                 if spec.get("type") == "delete":
@@ -996,11 +1068,22 @@ class AsyncSnapshotDiff:
                         spec_map = _parse_fields_spec(fields_spec)
                         for field_name, (should_check, expected_value) in spec_map.items():
                             if field_name not in row_data:
-                                return f"Field '{field_name}' in delete spec not found in row for table '{table}' pk={pk}"
+                                return _row_error(
+                                    "deletion",
+                                    table,
+                                    pk,
+                                    f"Field '{field_name}' in delete spec not found in row for table '{table}' pk={pk}",
+                                    field_name,
+                                )
                             if should_check and not _values_equivalent(expected_value, row_data[field_name]):
-                                return (
+                                return _row_error(
+                                    "deletion",
+                                    table,
+                                    pk,
                                     f"Delete mismatch in table '{table}' pk={pk}, "
-                                    f"field '{field_name}': expected {repr(expected_value)}, got {repr(row_data[field_name])}"
+                                    f"field '{field_name}': expected {repr(expected_value)}, got {repr(row_data[field_name])}",
+                                    field_name,
+                                    before=row_data[field_name],
                                 )
                     # type: "delete" found (with or without fields) - allowed
                     return None
@@ -1010,7 +1093,13 @@ class AsyncSnapshotDiff:
                 if spec.get("fields") is None and spec.get("after") == "__removed__":
                     return None
 
-            return f"Unexpected row removed from table '{table}': pk={pk}"
+            return _row_error(
+                "deletion",
+                table,
+                pk,
+                f"Unexpected row removed from table '{table}': pk={pk}",
+                after="__removed__",
+            )
 
         def _validate_modify_row(
             table: str,
@@ -1018,8 +1107,8 @@ class AsyncSnapshotDiff:
             before_row: Dict[str, Any],
             after_row: Dict[str, Any],
             specs: List[Dict[str, Any]],
-        ) -> Optional[str]:
-            """Validate a modified row against specs. Returns error message or None."""
+        ) -> Optional[DiffValidationError]:
+            """Validate a modified row against specs. Returns the error or None."""
             # Collect actual changes
             changed_fields: Dict[str, Dict[str, Any]] = {}
             for field in set(before_row.keys()) | set(after_row.keys()):
@@ -1058,17 +1147,29 @@ class AsyncSnapshotDiff:
                             after_val = vals["after"]
                             if field_name not in spec_map:
                                 if no_other_changes:
-                                    return (
+                                    return _row_error(
+                                        "modification",
+                                        table,
+                                        pk,
                                         f"Unexpected field change in table '{table}' pk={pk}: "
-                                        f"field '{field_name}' not in resulting_fields"
+                                        f"field '{field_name}' not in resulting_fields",
+                                        field_name,
+                                        vals["before"],
+                                        after_val,
                                     )
                                 # no_other_changes=False: ignore this field
                             else:
                                 should_check, expected_value = spec_map[field_name]
                                 if should_check and not _values_equivalent(expected_value, after_val):
-                                    return (
+                                    return _row_error(
+                                        "modification",
+                                        table,
+                                        pk,
                                         f"Modify mismatch in table '{table}' pk={pk}, "
-                                        f"field '{field_name}': expected {repr(expected_value)}, got {repr(after_val)}"
+                                        f"field '{field_name}': expected {repr(expected_value)}, got {repr(after_val)}",
+                                        field_name,
+                                        vals["before"],
+                                        after_val,
                                     )
                         return None  # Validation passed
                     else:
@@ -1087,9 +1188,15 @@ class AsyncSnapshotDiff:
                         field_allowed = True
                         break
                 if not field_allowed:
-                    return (
+                    return _row_error(
+                        "modification",
+                        table,
+                        pk,
                         f"Unexpected change in table '{table}' pk={pk}, "
-                        f"field '{field_name}': {repr(vals['before'])} -> {repr(after_val)}"
+                        f"field '{field_name}': {repr(vals['before'])} -> {repr(after_val)}",
+                        field_name,
+                        vals["before"],
+                        after_val,
                     )
 
             return None
@@ -1139,17 +1246,17 @@ class AsyncSnapshotDiff:
                     # Modified row
                     error = _validate_modify_row(table, pk, before_row, after_row, specs)
                     if error:
-                        errors.append(AssertionError(error))
+                        errors.append(error)
                 elif not before_row and after_row:
                     # Added row
                     error = _validate_insert_row(table, pk, after_row, specs)
                     if error:
-                        errors.append(AssertionError(error))
+                        errors.append(error)
                 elif before_row and not after_row:
                     # Removed row
                     error = _validate_delete_row(table, pk, before_row, specs)
                     if error:
-                        errors.append(AssertionError(error))
+                        errors.append(error)
 
             except Exception as e:
                 errors.append(e)
@@ -1175,7 +1282,7 @@ class AsyncSnapshotDiff:
 
         # Check for errors from row checks
         if errors:
-            raise errors[0]
+            _raise_collected_errors(errors)
 
         # Now check tables not mentioned in allowed_changes to ensure no changes
         all_tables = set(await self.before.tables()) | set(await self.after.tables())
@@ -1213,7 +1320,16 @@ class AsyncSnapshotDiff:
                         f"Unexpected change in table '{table}': "
                         f"row count changed from {before_count} to {after_count}"
                     )
-                    errors.append(AssertionError(error_msg))
+                    errors.append(
+                        _row_error(
+                            "row_count",
+                            table,
+                            None,
+                            error_msg,
+                            before=before_count,
+                            after=after_count,
+                        )
+                    )
             except Exception as e:
                 errors.append(e)
 
@@ -1224,7 +1340,7 @@ class AsyncSnapshotDiff:
 
         # Final error check
         if errors:
-            raise errors[0]
+            _raise_collected_errors(errors)
 
         return self
 
@@ -1258,29 +1374,31 @@ class AsyncSnapshotDiff:
         For deletions with "fields", all specified fields are validated against the deleted row.
         """
 
+        # Index the specs by (table, pk) once so each changed row only consults
+        # its own specs. PKs are compared as strings to tolerate int/str mismatches.
+        specs_by_row: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for allowed in allowed_changes:
+            allowed_pk = allowed.get("pk")
+            if allowed_pk is not None:
+                specs_by_row.setdefault((allowed["table"], str(allowed_pk)), []).append(
+                    allowed
+                )
+
+        def _specs_for_row(table: str, row_id: Any) -> List[Dict[str, Any]]:
+            return specs_by_row.get((table, str(row_id)), [])
+
         def _is_change_allowed(
             table: str, row_id: Any, field: Optional[str], after_value: Any
         ) -> bool:
             """Check if a change is in the allowed list using semantic comparison."""
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                # Handle type conversion for primary key comparison
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-
+            for allowed in _specs_for_row(table, row_id):
                 # For whole-row specs, check "fields": None; for field-level, check "field"
                 field_match = (
                     ("fields" in allowed and allowed.get("fields") is None)
                     if field is None
                     else allowed.get("field") == field
                 )
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and field_match
-                    and _values_equivalent(allowed.get("after"), after_value)
-                ):
+                if field_match and _values_equivalent(allowed.get("after"), after_value):
                     return True
             return False
 
@@ -1296,17 +1414,8 @@ class AsyncSnapshotDiff:
                 
             Note: For "modify" type, use _get_modify_spec instead.
             """
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and allowed.get("type") == change_type
-                    and "fields" in allowed
-                ):
+            for allowed in _specs_for_row(table, row_id):
+                if allowed.get("type") == change_type and "fields" in allowed:
                     return allowed["fields"]
             return None
 
@@ -1319,33 +1428,17 @@ class AsyncSnapshotDiff:
             
             Returns None if no modify spec found.
             """
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and allowed.get("type") == "modify"
-                ):
+            for allowed in _specs_for_row(table, row_id):
+                if allowed.get("type") == "modify":
                     return allowed
             return None
 
         def _is_type_allowed(table: str, row_id: Any, change_type: str) -> bool:
             """Check if a change type is allowed for the given table/row (with or without fields)."""
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and allowed.get("type") == change_type
-                ):
-                    return True
-            return False
+            return any(
+                allowed.get("type") == change_type
+                for allowed in _specs_for_row(table, row_id)
+            )
 
         def _parse_fields_spec(
             fields_spec: List[Tuple[str, Any]]
@@ -1730,7 +1823,7 @@ class AsyncSnapshotDiff:
             else:
                 error_lines.append("  (No changes were allowed)")
 
-            raise AssertionError("\n".join(error_lines))
+            raise DiffValidationError("\n".join(error_lines), unexpected_changes)
 
         return self
 
@@ -1840,7 +1933,8 @@ class AsyncSnapshotDiff:
             self for method chaining
 
         Raises:
-            AssertionError: If there are unexpected changes OR if expected changes are missing
+            ExpectExactlyError (an AssertionError): If there are unexpected changes OR
+                if expected changes are missing
             ValueError: If specs are missing required fields or have invalid format
         """
         # Get the diff (using HTTP if available, otherwise local)
@@ -1874,12 +1968,7 @@ class AsyncSnapshotDiff:
             diff = await self._collect()
 
         # Use shared validation logic
-        success, error_msg, _ = validate_diff_expect_exactly(
-            diff, expected_changes, self.ignore_config
-        )
-
-        if not success:
-            raise AssertionError(error_msg)
+        assert_diff_expect_exactly(diff, expected_changes, self.ignore_config)
 
         return self
 
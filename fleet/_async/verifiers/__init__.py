@@ -1,6 +1,12 @@
 """Fleet verifiers module - database snapshot validation utilities and verifier decorator."""
 
-from fleet.verifiers.db import DatabaseSnapshot, IgnoreConfig, SnapshotDiff
+from fleet.verifiers.db import (
+    DatabaseSnapshot,
+    DiffValidationError,
+    ExpectExactlyError,
+    IgnoreConfig,
+    SnapshotDiff,
+)
 from fleet.verifiers.code import TASK_SUCCESSFUL_SCORE, TASK_FAILED_SCORE
 from .verifier import (
     verifier,
@@ -9,6 +15,8 @@ from .verifier import (
 
 __all__ = [
     "DatabaseSnapshot",
+    "DiffValidationError",
+    "ExpectExactlyError",
     "IgnoreConfig",
     "SnapshotDiff",
     "TASK_SUCCESSFUL_SCORE",
@@ -0,0 +1,4 @@
+# fleet.instance.client imports the resource modules, which import
+# fleet.instance.models back. Load the instance package first so the cycle is
+# always entered from that side, whichever module is imported directly.
+from .. import instance as _instance  # noqa: F401
@@ -1,6 +1,12 @@
 """Fleet verifiers module - database snapshot validation utilities and verifier decorator."""
 
-from .db import DatabaseSnapshot, IgnoreConfig, SnapshotDiff
+from .db import (
+    DatabaseSnapshot,
+    DiffValidationError,
+    ExpectExactlyError,
+    IgnoreConfig,
+    SnapshotDiff,
+)
 from .code import TASK_SUCCESSFUL_SCORE, TASK_FAILED_SCORE
 from .verifier import (
     verifier,
@@ -10,6 +16,8 @@ from .local_executor import execute_verifier_local, LocalEnvironment, diff_dbs
 
 __all__ = [
     "DatabaseSnapshot",
+    "DiffValidationError",
+    "ExpectExactlyError",
     "IgnoreConfig",
     "SnapshotDiff",
     "TASK_SUCCESSFUL_SCORE",
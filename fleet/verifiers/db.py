@@ -18,6 +18,8 @@ from datetime import datetime
 from typing import Any
 import json
 
+from .sql_differ import SQLiteDiffer, _connect
+
 
 ################################################################################
 #  Low‑level helpers
@@ -101,6 +103,28 @@ def validate_diff_expect_exactly(
         - error_message: Error message if validation failed, None otherwise
         - matched_specs: List of (table, pk, type) tuples that matched
     """
+    try:
+        matched_specs = assert_diff_expect_exactly(diff, expected_changes, ignore_config)
+    except ExpectExactlyError as e:
+        return False, str(e), e.matched_specs
+    return True, None, matched_specs
+
+
+def assert_diff_expect_exactly(
+    diff: Dict[str, Any],
+    expected_changes: List[Dict[str, Any]],
+    ignore_config: Any = None,
+) -> List[Tuple[str, str, str]]:
+    """
+    Like validate_diff_expect_exactly, but raise instead of returning a status.
+
+    Returns:
+        List of (table, pk, type) tuples that matched
+
+    Raises:
+        ExpectExactlyError: If there are unexpected, missing or mismatched changes
+        ValueError: If specs are missing required fields or have invalid format
+    """
     # Validate all specs have required fields
     for i, spec in enumerate(expected_changes):
         if "type" not in spec:
@@ -297,43 +321,43 @@ def validate_diff_expect_exactly(
                 # Spec without resulting_fields - just check it exists
                 matched_specs.append(spec_key)
 
-    # Check for missing expected changes (specs that weren't matched)
+    # Check for missing expected changes (specs that weren't matched).
+    # Specs already in field_mismatches were partially matched but had wrong
+    # values, so they are reported there rather than as missing.
+    seen_keys = set(matched_specs)
+    seen_keys.update(
+        (fm["table"], str(fm["pk"]), fm["type"]) for fm in field_mismatches
+    )
     for spec in expected_changes:
         spec_key = (spec.get("table"), str(spec.get("pk")), spec.get("type"))
-        if spec_key not in matched_specs:
-            # Check if it's already in field_mismatches (partially matched but wrong values)
-            already_reported = any(
-                fm["table"] == spec.get("table") and
-                str(fm["pk"]) == str(spec.get("pk")) and
-                fm["type"] == spec.get("type")
-                for fm in field_mismatches
-            )
-            if not already_reported:
-                missing_changes.append({
-                    "type": spec.get("type"),
-                    "table": spec.get("table"),
-                    "pk": spec.get("pk"),
-                    "spec": spec,
-                })
-
-    # Detect near-matches (potential wrong-row scenarios)
+        if spec_key not in seen_keys:
+            missing_changes.append({
+                "type": spec.get("type"),
+                "table": spec.get("table"),
+                "pk": spec.get("pk"),
+                "spec": spec,
+            })
+
+    # Detect near-matches (potential wrong-row scenarios): an unexpected and a
+    # missing change with the same table and operation type but different pks.
+    missing_by_kind: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for mc in missing_changes:
+        missing_by_kind.setdefault((mc["table"], mc["type"]), []).append(mc)
     for uc in unexpected_changes:
-        for mc in missing_changes:
-            if uc["table"] == mc["table"] and uc["type"] == mc["type"]:
-                # Same table and operation type, different pk - might be wrong row
-                near_matches.append({
-                    "unexpected": uc,
-                    "missing": mc,
-                    "actual_pk": uc["pk"],
-                    "expected_pk": mc["pk"],
-                    "operation": uc["type"],
-                })
+        for mc in missing_by_kind.get((uc["table"], uc["type"]), []):
+            near_matches.append({
+                "unexpected": uc,
+                "missing": mc,
+                "actual_pk": uc["pk"],
+                "expected_pk": mc["pk"],
+                "operation": uc["type"],
+            })
 
     # Build error message if there are any errors
     total_errors = len(field_mismatches) + len(unexpected_changes) + len(missing_changes)
 
     if total_errors == 0:
-        return True, None, matched_specs
+        return matched_specs
 
     # Format error message
     error_msg = _format_expect_exactly_error(
@@ -345,7 +369,13 @@ def validate_diff_expect_exactly(
         total_errors=total_errors,
     )
 
-    return False, error_msg, matched_specs
+    raise ExpectExactlyError(
+        error_msg,
+        wrong_fields=field_mismatches,
+        unexpected=unexpected_changes,
+        missing=missing_changes,
+        matched_specs=matched_specs,
+    )
 
 
 def _format_expect_exactly_error(
@@ -667,7 +697,7 @@ class QueryBuilder:
             return self._cached_rows
 
         sql, params = self._compile()
-        conn = sqlite3.connect(self._snapshot.db_path)
+        conn = _connect(self._snapshot.db_path)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         cur.execute(sql, params)
@@ -685,7 +715,7 @@ class QueryBuilder:
             None
         )  # remove limit since counting overrides
         sql, params = qb._compile()
-        conn = sqlite3.connect(self._snapshot.db_path)
+        conn = _connect(self._snapshot.db_path)
         cur = conn.cursor()
         cur.execute(sql, params)
         val = cur.fetchone()[0] or 0
@@ -790,6 +820,145 @@ class QueryBuilder:
 ################################################################################
 
 
+class DiffValidationError(AssertionError):
+    """Raised when a snapshot diff contains changes the allowed specs don't cover.
+
+    Subclasses AssertionError so existing callers keep working; ``errors`` holds
+    one record (type, table, row_id, field, ...) per rejected row, or per table
+    for row-count and schema changes.
+    """
+
+    def __init__(self, message: str, errors: List[Dict[str, Any]]):
+        super().__init__(message)
+        self.errors = errors
+
+
+# expect_exactly spec types -> the change types used in DiffValidationError records
+_CHANGE_TYPES = {"insert": "insertion", "delete": "deletion", "modify": "modification"}
+
+
+class ExpectExactlyError(DiffValidationError):
+    """Raised by expect_exactly when the diff differs from the expected changes.
+
+    The records are split by category: ``wrong_fields`` (a spec matched the row
+    but field values differ), ``unexpected`` (no spec for the change) and
+    ``missing`` (a spec whose change never happened). Each has the spec's type
+    (insert/delete/modify), table and pk. ``errors`` holds all three lists in
+    report order, in the DiffValidationError shape: type is insertion, deletion
+    or modification, the pk is under row_id, and spec_type and category keep the
+    spec's type and the list the record came from.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        wrong_fields: List[Dict[str, Any]],
+        unexpected: List[Dict[str, Any]],
+        missing: List[Dict[str, Any]],
+        matched_specs: List[Tuple[str, str, str]],
+    ):
+        super().__init__(
+            message,
+            [
+                {
+                    **record,
+                    "type": _CHANGE_TYPES.get(record["type"], record["type"]),
+                    "row_id": record["pk"],
+                    "field": None,
+                    "spec_type": record["type"],
+                    "category": category,
+                }
+                for category, records in (
+                    ("wrong_fields", wrong_fields),
+                    ("unexpected", unexpected),
+                    ("missing", missing),
+                )
+                for record in records
+            ],
+        )
+        self.wrong_fields = wrong_fields
+        self.unexpected = unexpected
+        self.missing = missing
+        self.matched_specs = matched_specs
+
+
+def _row_error(
+    change_type: str,
+    table: str,
+    row_id: Any,
+    message: str,
+    field: Optional[str] = None,
+    before: Any = None,
+    after: Any = None,
+) -> DiffValidationError:
+    """Build a single-record DiffValidationError for one rejected row or table."""
+    return DiffValidationError(
+        message,
+        [
+            {
+                "type": change_type,
+                "table": table,
+                "row_id": row_id,
+                "field": field,
+                "before": before,
+                "after": after,
+            }
+        ],
+    )
+
+
+def _raise_collected_errors(errors: List[Exception]) -> None:
+    """Raise the first collected error, carrying the records of every rejected row.
+
+    Errors other than DiffValidationError (e.g. a failed query) are raised as is.
+    """
+    first = errors[0]
+    if not isinstance(first, DiffValidationError):
+        raise first
+    records = [
+        record
+        for error in errors
+        if isinstance(error, DiffValidationError)
+        for record in error.errors
+    ]
+    raise DiffValidationError(str(first), records)
+
+
+def _diff_report_records(table: str, report: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Unexpected-change records for every row in one table's diff report."""
+    records: List[Dict[str, Any]] = []
+    for row in report.get("modified_rows", []):
+        for field, vals in row["changes"].items():
+            records.append(
+                {
+                    "type": "modification",
+                    "table": table,
+                    "row_id": row["row_id"],
+                    "field": field,
+                    "before": vals.get("before"),
+                    "after": vals["after"],
+                    "full_row": row,
+                }
+            )
+    for change_type, key, marker in (
+        ("insertion", "added_rows", "__added__"),
+        ("deletion", "removed_rows", "__removed__"),
+    ):
+        for row in report.get(key, []):
+            records.append(
+                {
+                    "type": change_type,
+                    "table": table,
+                    "row_id": row["row_id"],
+                    "field": None,
+                    "after": marker,
+                    "full_row": row,
+                }
+            )
+    return records
+
+
 class IgnoreConfig:
     """Configuration for ignoring specific tables, fields, or combinations during diff operations."""
 
@@ -869,8 +1038,6 @@ class SnapshotDiff:
         after: DatabaseSnapshot,
         ignore_config: Optional[IgnoreConfig] = None,
     ):
-        from .sql_differ import SQLiteDiffer  # local import to avoid circularity
-
         self.before = before
         self.after = after
         self.ignore_config = ignore_config or IgnoreConfig()
@@ -900,7 +1067,7 @@ class SnapshotDiff:
 
     def _query_row(self, db_path: str, table: str, pk_columns: List[str], pk: Any) -> Optional[Dict[str, Any]]:
         """Query a single row by primary key from a SQLite database."""
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         conn.row_factory = sqlite3.Row
         try:
             if len(pk_columns) == 1:
@@ -924,7 +1091,7 @@ class SnapshotDiff:
 
     def _get_row_count(self, db_path: str, table: str) -> int:
         """Get row count for a table."""
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         try:
             cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
             return cursor.fetchone()[0]
@@ -950,7 +1117,7 @@ class SnapshotDiff:
                 changes_by_table[table] = []
             changes_by_table[table].append(change)
 
-        errors: List[Exception] = []
+        errors: List[DiffValidationError] = []
 
         # Check each specified row
         for table, table_changes in changes_by_table.items():
@@ -988,10 +1155,16 @@ class SnapshotDiff:
                                     break
                             if not allowed:
                                 errors.append(
-                                    AssertionError(
+                                    _row_error(
+                                        "modification",
+                                        table,
+                                        pk,
                                         f"Unexpected change in table '{table}', "
                                         f"row {pk}, field '{field}': "
-                                        f"{repr(before_val)} -> {repr(after_val)}"
+                                        f"{repr(before_val)} -> {repr(after_val)}",
+                                        field,
+                                        before_val,
+                                        after_val,
                                     )
                                 )
                                 break  # Stop checking this row
@@ -1008,7 +1181,13 @@ class SnapshotDiff:
                             break
                     if not allowed:
                         errors.append(
-                            AssertionError(f"Unexpected row added in table '{table}': {pk}")
+                            _row_error(
+                                "insertion",
+                                table,
+                                pk,
+                                f"Unexpected row added in table '{table}': {pk}",
+                                after="__added__",
+                            )
                         )
                 elif before_row and not after_row:
                     # Removed row - check if allowed
@@ -1023,11 +1202,17 @@ class SnapshotDiff:
                             break
                     if not allowed:
                         errors.append(
-                            AssertionError(f"Unexpected row removed from table '{table}': {pk}")
+                            _row_error(
+                                "deletion",
+                                table,
+                                pk,
+                                f"Unexpected row removed from table '{table}': {pk}",
+                                after="__removed__",
+                            )
                         )
 
         if errors:
-            raise errors[0]
+            _raise_collected_errors(errors)
 
         # Check tables not mentioned in allowed_changes for row count changes
         all_tables = set(self.before.tables()) | set(self.after.tables())
@@ -1040,14 +1225,19 @@ class SnapshotDiff:
             after_count = self._get_row_count(self.after.db_path, table)
             if before_count != after_count:
                 errors.append(
-                    AssertionError(
+                    _row_error(
+                        "row_count",
+                        table,
+                        None,
                         f"Unexpected change in table '{table}': "
-                        f"row count changed from {before_count} to {after_count}"
+                        f"row count changed from {before_count} to {after_count}",
+                        before=before_count,
+                        after=after_count,
                     )
                 )
 
         if errors:
-            raise errors[0]
+            _raise_collected_errors(errors)
 
         return self
 
@@ -1075,19 +1265,20 @@ class SnapshotDiff:
                     spec_map[field_name] = (True, expected_value)
             return spec_map
 
+        # Index the specs by (table, pk) once; each checked pk then finds its
+        # specs directly. PKs are compared as strings to tolerate int/str mismatches.
+        specs_by_pk: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for allowed in allowed_changes:
+            specs_by_pk.setdefault(
+                (allowed["table"], str(allowed.get("pk"))), []
+            ).append(allowed)
+
         def _get_all_specs_for_pk(table: str, pk: Any) -> List[Dict[str, Any]]:
-            specs = []
-            for allowed in allowed_changes:
-                if (
-                    allowed["table"] == table
-                    and str(allowed.get("pk")) == str(pk)
-                ):
-                    specs.append(allowed)
-            return specs
+            return specs_by_pk.get((table, str(pk)), [])
 
         def _validate_insert_row(
             table: str, pk: Any, row_data: Dict[str, Any], specs: List[Dict[str, Any]]
-        ) -> Optional[str]:
+        ) -> Optional[DiffValidationError]:
             for spec in specs:
                 if spec.get("type") == "insert":
                     fields_spec = spec.get("fields")
@@ -1099,22 +1290,40 @@ class SnapshotDiff:
                             if self.ignore_config.should_ignore_field(table, field_name):
                                 continue
                             if field_name not in spec_map:
-                                return f"Field '{field_name}' not in insert spec for table '{table}' pk={pk}"
+                                return _row_error(
+                                    "insertion",
+                                    table,
+                                    pk,
+                                    f"Field '{field_name}' not in insert spec for table '{table}' pk={pk}",
+                                    field_name,
+                                    after=field_value,
+                                )
                             should_check, expected_value = spec_map[field_name]
                             if should_check and not _values_equivalent(expected_value, field_value):
-                                return (
+                                return _row_error(
+                                    "insertion",
+                                    table,
+                                    pk,
                                     f"Insert mismatch in table '{table}' pk={pk}, "
-                                    f"field '{field_name}': expected {repr(expected_value)}, got {repr(field_value)}"
+                                    f"field '{field_name}': expected {repr(expected_value)}, got {repr(field_value)}",
+                                    field_name,
+                                    after=field_value,
                                 )
                     return None
             for spec in specs:
                 if spec.get("fields") is None and spec.get("after") == "__added__":
                     return None
-            return f"Unexpected row added in table '{table}': pk={pk}"
+            return _row_error(
+                "insertion",
+                table,
+                pk,
+                f"Unexpected row added in table '{table}': pk={pk}",
+                after="__added__",
+            )
 
         def _validate_delete_row(
             table: str, pk: Any, row_data: Dict[str, Any], specs: List[Dict[str, Any]]
-        ) -> Optional[str]:
+        ) -> Optional[DiffValidationError]:
             for spec in specs:
                 if spec.get("type") == "delete":
                     fields_spec = spec.get("fields")
@@ -1122,17 +1331,34 @@ class SnapshotDiff:
                         spec_map = _parse_fields_spec(fields_spec)
                         for field_name, (should_check, expected_value) in spec_map.items():
                             if field_name not in row_data:
-                                return f"Field '{field_name}' in delete spec not found in row for table '{table}' pk={pk}"
+                                return _row_error(
+                                    "deletion",
+                                    table,
+                                    pk,
+                                    f"Field '{field_name}' in delete spec not found in row for table '{table}' pk={pk}",
+                                    field_name,
+                                )
                             if should_check and not _values_equivalent(expected_value, row_data[field_name]):
-                                return (
+                                return _row_error(
+                                    "deletion",
+                                    table,
+                                    pk,
                                     f"Delete mismatch in table '{table}' pk={pk}, "
-                                    f"field '{field_name}': expected {repr(expected_value)}, got {repr(row_data[field_name])}"
+                                    f"field '{field_name}': expected {repr(expected_value)}, got {repr(row_data[field_name])}",
+                                    field_name,
+                                    before=row_data[field_name],
                                 )
                     return None
             for spec in specs:
                 if spec.get("fields") is None and spec.get("after") == "__removed__":
                     return None
-            return f"Unexpected row removed from table '{table}': pk={pk}"
+            return _row_error(
+                "deletion",
+                table,
+                pk,
+                f"Unexpected row removed from table '{table}': pk={pk}",
+                after="__removed__",
+            )
 
         def _validate_modify_row(
             table: str,
@@ -1140,7 +1366,7 @@ class SnapshotDiff:
             before_row: Dict[str, Any],
             after_row: Dict[str, Any],
             specs: List[Dict[str, Any]],
-        ) -> Optional[str]:
+        ) -> Optional[DiffValidationError]:
             changed_fields: Dict[str, Dict[str, Any]] = {}
             for field in set(before_row.keys()) | set(after_row.keys()):
                 if self.ignore_config.should_ignore_field(table, field):
@@ -1171,16 +1397,28 @@ class SnapshotDiff:
                             after_val = vals["after"]
                             if field_name not in spec_map:
                                 if no_other_changes:
-                                    return (
+                                    return _row_error(
+                                        "modification",
+                                        table,
+                                        pk,
                                         f"Unexpected field change in table '{table}' pk={pk}: "
-                                        f"field '{field_name}' not in resulting_fields"
+                                        f"field '{field_name}' not in resulting_fields",
+                                        field_name,
+                                        vals["before"],
+                                        after_val,
                                     )
                             else:
                                 should_check, expected_value = spec_map[field_name]
                                 if should_check and not _values_equivalent(expected_value, after_val):
-                                    return (
+                                    return _row_error(
+                                        "modification",
+                                        table,
+                                        pk,
                                         f"Modify mismatch in table '{table}' pk={pk}, "
-                                        f"field '{field_name}': expected {repr(expected_value)}, got {repr(after_val)}"
+                                        f"field '{field_name}': expected {repr(expected_value)}, got {repr(after_val)}",
+                                        field_name,
+                                        vals["before"],
+                                        after_val,
                                     )
                         return None
                     else:
@@ -1197,9 +1435,15 @@ class SnapshotDiff:
                         field_allowed = True
                         break
                 if not field_allowed:
-                    return (
+                    return _row_error(
+                        "modification",
+                        table,
+                        pk,
                         f"Unexpected change in table '{table}' pk={pk}, "
-                        f"field '{field_name}': {repr(vals['before'])} -> {repr(after_val)}"
+                        f"field '{field_name}': {repr(vals['before'])} -> {repr(after_val)}",
+                        field_name,
+                        vals["before"],
+                        after_val,
                     )
             return None
 
@@ -1211,7 +1455,7 @@ class SnapshotDiff:
                 changes_by_table[table] = []
             changes_by_table[table].append(change)
 
-        errors: List[Exception] = []
+        errors: List[DiffValidationError] = []
 
         # Check each specified row
         for table, table_changes in changes_by_table.items():
@@ -1229,18 +1473,18 @@ class SnapshotDiff:
                 if before_row and after_row:
                     error = _validate_modify_row(table, pk, before_row, after_row, specs)
                     if error:
-                        errors.append(AssertionError(error))
+                        errors.append(error)
                 elif not before_row and after_row:
                     error = _validate_insert_row(table, pk, after_row, specs)
                     if error:
-                        errors.append(AssertionError(error))
+                        errors.append(error)
                 elif before_row and not after_row:
                     error = _validate_delete_row(table, pk, before_row, specs)
                     if error:
-                        errors.append(AssertionError(error))
+                        errors.append(error)
 
         if errors:
-            raise errors[0]
+            _raise_collected_errors(errors)
 
         # Check tables not mentioned in allowed_changes for row count changes
         all_tables = set(self.before.tables()) | set(self.after.tables())
@@ -1253,14 +1497,19 @@ class SnapshotDiff:
             after_count = self._get_row_count(self.after.db_path, table)
             if before_count != after_count:
                 errors.append(
-                    AssertionError(
+                    _row_error(
+                        "row_count",
+                        table,
+                        None,
                         f"Unexpected change in table '{table}': "
-                        f"row count changed from {before_count} to {after_count}"
+                        f"row count changed from {before_count} to {after_count}",
+                        before=before_count,
+                        after=after_count,
                     )
                 )
 
         if errors:
-            raise errors[0]
+            _raise_collected_errors(errors)
 
         return self
 
@@ -1281,8 +1530,9 @@ class SnapshotDiff:
                     + len(report.get("modified_rows", []))
                 )
                 if total > 0:
-                    raise AssertionError(
-                        f"Expected no changes but found {total} change(s) in table '{tbl}'"
+                    raise DiffValidationError(
+                        f"Expected no changes but found {total} change(s) in table '{tbl}'",
+                        _diff_report_records(tbl, report),
                     )
             return self
 
@@ -1299,26 +1549,24 @@ class SnapshotDiff:
     ):
         """Validate a collected diff against allowed changes (full-diff fallback)."""
 
+        # Index the specs by (table, pk, field) once so each change only consults
+        # its own specs. PKs are compared as strings to tolerate int/str mismatches.
+        specs_by_field: Dict[Tuple[str, str, Optional[str]], List[Dict[str, Any]]] = {}
+        for allowed in allowed_changes:
+            allowed_pk = allowed.get("pk")
+            if allowed_pk is not None:
+                specs_by_field.setdefault(
+                    (allowed["table"], str(allowed_pk), allowed.get("field")), []
+                ).append(allowed)
+
         def _is_change_allowed(
             table: str, row_id: str, field: Optional[str], after_value: Any
         ) -> bool:
             """Check if a change is in the allowed list using semantic comparison."""
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                # Handle type conversion for primary key comparison
-                # Convert both to strings for comparison to handle int/string mismatches
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and allowed.get("field") == field
-                    and _values_equivalent(allowed.get("after"), after_value)
-                ):
-                    return True
-            return False
+            return any(
+                _values_equivalent(allowed.get("after"), after_value)
+                for allowed in specs_by_field.get((table, str(row_id), field), [])
+            )
 
         # Collect all unexpected changes for detailed reporting
         unexpected_changes = []
@@ -1433,7 +1681,7 @@ class SnapshotDiff:
             else:
                 error_lines.append("  (No changes were allowed)")
 
-            raise AssertionError("\n".join(error_lines))
+            raise DiffValidationError("\n".join(error_lines), unexpected_changes)
 
         return self
 
@@ -1480,8 +1728,9 @@ class SnapshotDiff:
                     + len(report.get("modified_rows", []))
                 )
                 if total > 0:
-                    raise AssertionError(
-                        f"Expected no changes but found {total} change(s) in table '{tbl}'"
+                    raise DiffValidationError(
+                        f"Expected no changes but found {total} change(s) in table '{tbl}'",
+                        _diff_report_records(tbl, report),
                     )
             return self
 
@@ -1492,30 +1741,31 @@ class SnapshotDiff:
         # Fall back to full diff for complex cases
         diff = self._collect()
 
+        # Index the specs by (table, pk) once so each changed row only consults
+        # its own specs. PKs are compared as strings to tolerate int/str mismatches.
+        specs_by_row: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for allowed in allowed_changes:
+            allowed_pk = allowed.get("pk")
+            if allowed_pk is not None:
+                specs_by_row.setdefault((allowed["table"], str(allowed_pk)), []).append(
+                    allowed
+                )
+
+        def _specs_for_row(table: str, row_id: Any) -> List[Dict[str, Any]]:
+            return specs_by_row.get((table, str(row_id)), [])
+
         def _is_change_allowed(
             table: str, row_id: str, field: Optional[str], after_value: Any
         ) -> bool:
             """Check if a change is in the allowed list using semantic comparison."""
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                # Handle type conversion for primary key comparison
-                # Convert both to strings for comparison to handle int/string mismatches
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-
+            for allowed in _specs_for_row(table, row_id):
                 # For whole-row specs, check "fields": None; for field-level, check "field"
                 field_match = (
                     ("fields" in allowed and allowed.get("fields") is None)
                     if field is None
                     else allowed.get("field") == field
                 )
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and field_match
-                    and _values_equivalent(allowed.get("after"), after_value)
-                ):
+                if field_match and _values_equivalent(allowed.get("after"), after_value):
                     return True
             return False
 
@@ -1529,17 +1779,8 @@ class SnapshotDiff:
                 
             Note: For "modify" type, use _get_modify_spec instead.
             """
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and allowed.get("type") == change_type
-                    and "fields" in allowed
-                ):
+            for allowed in _specs_for_row(table, row_id):
+                if allowed.get("type") == change_type and "fields" in allowed:
                     return allowed["fields"]
             return None
 
@@ -1552,29 +1793,17 @@ class SnapshotDiff:
             
             Returns None if no modify spec found.
             """
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-                if (
-                    allowed["table"] == table
-                    and pk_match
-                    and allowed.get("type") == "modify"
-                ):
+            for allowed in _specs_for_row(table, row_id):
+                if allowed.get("type") == "modify":
                     return allowed
             return None
 
         def _is_type_allowed(table: str, row_id: str, change_type: str) -> bool:
             """Check if a change type is allowed for the given table/row (with or without fields)."""
-            for allowed in allowed_changes:
-                allowed_pk = allowed.get("pk")
-                pk_match = (
-                    str(allowed_pk) == str(row_id) if allowed_pk is not None else False
-                )
-                if allowed["table"] == table and pk_match and allowed.get("type") == change_type:
-                    return True
-            return False
+            return any(
+                allowed.get("type") == change_type
+                for allowed in _specs_for_row(table, row_id)
+            )
 
         def _parse_fields_spec(fields_spec: List[tuple]) -> Dict[str, tuple]:
             """Parse a fields spec into a mapping of field_name -> (should_check_value, expected_value)."""
@@ -1959,7 +2188,7 @@ class SnapshotDiff:
             else:
                 error_lines.append("  (No changes were allowed)")
 
-            raise AssertionError("\n".join(error_lines))
+            raise DiffValidationError("\n".join(error_lines), unexpected_changes)
 
         return self
 
@@ -1995,18 +2224,14 @@ class SnapshotDiff:
             self for method chaining
 
         Raises:
-            AssertionError: If there are unexpected changes OR if expected changes are missing
+            ExpectExactlyError (an AssertionError): If there are unexpected changes OR
+                if expected changes are missing
             ValueError: If specs are missing required fields or have invalid format
         """
         diff = self._collect()
 
         # Use shared validation logic
-        success, error_msg, _ = validate_diff_expect_exactly(
-            diff, expected_changes, self.ignore_config
-        )
-
-        if not success:
-            raise AssertionError(error_msg)
+        assert_diff_expect_exactly(diff, expected_changes, self.ignore_config)
 
         return self
 
@@ -2058,7 +2283,7 @@ class DatabaseSnapshot:
 
     # Metadata -------------------------------------------------------------
     def tables(self) -> List[str]:
-        conn = sqlite3.connect(self.db_path)
+        conn = _connect(self.db_path)
         cur = conn.cursor()
         cur.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
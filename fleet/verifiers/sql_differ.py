@@ -1,6 +1,20 @@
+import re
 import sqlite3
 from typing import Any, Optional, List, Dict, Tuple
 
+# String literals, quoted identifiers and comments in a CREATE TABLE statement;
+# blanked out before looking for the COLLATE keyword.
+_SQL_LITERALS_AND_COMMENTS = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|\[[^\]]*\]|--[^\n]*|/\*.*?(?:\*/|$)",
+    re.DOTALL,
+)
+_COLLATE_KEYWORD = re.compile(r"\bCOLLATE\b", re.IGNORECASE)
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open a snapshot database, in URI mode for shared memory databases."""
+    return sqlite3.connect(db_path, uri="mode=memory" in db_path)
+
 
 class SQLiteDiffer:
     def __init__(self, before_db: str, after_db: str):
@@ -9,7 +23,7 @@ class SQLiteDiffer:
 
     def get_table_schema(self, db_path: str, table_name: str) -> List[str]:
         """Get column names for a table"""
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         cursor = conn.cursor()
         cursor.execute(f"PRAGMA table_info({table_name})")
         columns = [row[1] for row in cursor.fetchall()]
@@ -18,7 +32,7 @@ class SQLiteDiffer:
 
     def get_primary_key_columns(self, db_path: str, table_name: str) -> List[str]:
         """Get all primary key columns for a table, ordered by their position"""
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         cursor = conn.cursor()
         cursor.execute(f"PRAGMA table_info({table_name})")
 
@@ -36,7 +50,7 @@ class SQLiteDiffer:
 
     def get_all_tables(self, db_path: str) -> List[str]:
         """Get all table names from database"""
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         cursor = conn.cursor()
         cursor.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
@@ -45,6 +59,22 @@ class SQLiteDiffer:
         conn.close()
         return tables
 
+    def _resolve_primary_key_columns(
+        self, table_name: str, db_path: Optional[str] = None
+    ) -> List[str]:
+        """Declared primary key columns, falling back to "id" and then "rowid"."""
+        db_path = db_path or self.before_db
+        primary_key_columns = self.get_primary_key_columns(db_path, table_name)
+
+        # Fallback strategies if no primary key found
+        if not primary_key_columns:
+            columns = self.get_table_schema(db_path, table_name)
+            if "id" in columns:
+                primary_key_columns = ["id"]
+            else:
+                primary_key_columns = ["rowid"]
+        return primary_key_columns
+
     def get_table_data(
         self,
         db_path: str,
@@ -52,21 +82,13 @@ class SQLiteDiffer:
         primary_key_columns: Optional[List[str]] = None,
     ) -> Tuple[Dict[Any, dict], List[str]]:
         """Get table data indexed by primary key (single column or composite)"""
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         # If no primary key specified, try to detect it
         if primary_key_columns is None:
-            primary_key_columns = self.get_primary_key_columns(db_path, table_name)
-
-            # Fallback strategies if no primary key found
-            if not primary_key_columns:
-                columns = self.get_table_schema(db_path, table_name)
-                if "id" in columns:
-                    primary_key_columns = ["id"]
-                else:
-                    primary_key_columns = ["rowid"]
+            primary_key_columns = self._resolve_primary_key_columns(table_name, db_path)
 
         cursor.execute(f"SELECT rowid, * FROM {table_name}")
         rows = cursor.fetchall()
@@ -112,16 +134,114 @@ class SQLiteDiffer:
 
         return changes
 
+    def get_changed_table_data(
+        self, table_name: str, primary_key_columns: List[str]
+    ) -> Optional[Tuple[Dict[Any, dict], Dict[Any, dict], int]]:
+        """Get only the rows that differ between the two databases.
+
+        The after database is attached to a before connection and each side is
+        reduced with EXCEPT, so identical rows never reach Python. Returns
+        (before_rows, after_rows, unchanged_count) with rows indexed by primary
+        key like get_table_data, or None when the fast path does not apply: the
+        column lists differ, the key columns are not a declared primary key (or
+        rowid) and so may not be unique, or a column declares a COLLATE that would
+        make EXCEPT treat differing values as equal.
+        """
+        columns = self.get_table_schema(self.before_db, table_name)
+        if not columns or columns != self.get_table_schema(self.after_db, table_name):
+            return None
+        if self._declares_collation(table_name):
+            return None
+        if primary_key_columns != ["rowid"] and primary_key_columns != (
+            self.get_primary_key_columns(self.before_db, table_name)
+        ):
+            return None
+
+        table = '"' + table_name.replace('"', '""') + '"'
+        key_filter = " AND ".join(
+            '"' + col.replace('"', '""') + '" IS NOT NULL'
+            for col in primary_key_columns
+            if col != "rowid"
+        )
+
+        # ATTACH only parses a URI if the main connection was opened in URI mode
+        conn = sqlite3.connect(
+            self.before_db,
+            uri=any("mode=memory" in path for path in (self.before_db, self.after_db)),
+        )
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("ATTACH DATABASE ? AS after_db", (self.after_db,))
+            before_rows = conn.execute(
+                f"SELECT rowid, * FROM main.{table} "
+                f"EXCEPT SELECT rowid, * FROM after_db.{table}"
+            ).fetchall()
+            after_rows = conn.execute(
+                f"SELECT rowid, * FROM after_db.{table} "
+                f"EXCEPT SELECT rowid, * FROM main.{table}"
+            ).fetchall()
+            keyed_count = conn.execute(
+                f"SELECT COUNT(*) FROM main.{table}"
+                + (f" WHERE {key_filter}" if key_filter else "")
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+        before_data = self._index_rows(before_rows, primary_key_columns)
+        after_data = self._index_rows(after_rows, primary_key_columns)
+        return before_data, after_data, keyed_count - len(before_data)
+
+    def _declares_collation(self, table_name: str) -> bool:
+        """Whether either side's CREATE TABLE statement uses the COLLATE keyword.
+
+        String literals, quoted identifiers and comments are skipped, so defaults
+        or column names that merely contain the word do not count. A COLLATE in a
+        CHECK expression still does, which only costs the fast path.
+        """
+        for db_path in (self.before_db, self.after_db):
+            conn = _connect(db_path)
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
+                (table_name,),
+            ).fetchone()
+            conn.close()
+            if row and row[0]:
+                sql = _SQL_LITERALS_AND_COMMENTS.sub(" ", row[0])
+                if _COLLATE_KEYWORD.search(sql):
+                    return True
+        return False
+
+    def _index_rows(
+        self, rows: List[sqlite3.Row], primary_key_columns: List[str]
+    ) -> Dict[Any, dict]:
+        """Index rows by primary key value (single value or tuple for composite keys)."""
+        data = {}
+        for row in rows:
+            row_dict = dict(row)
+            if len(primary_key_columns) == 1:
+                pk_value = row_dict.get(primary_key_columns[0])
+            else:
+                pk_value = tuple(row_dict.get(col) for col in primary_key_columns)
+            if pk_value is not None and (
+                not isinstance(pk_value, tuple) or all(v is not None for v in pk_value)
+            ):
+                data[pk_value] = row_dict
+        return data
+
     def diff_table(
         self, table_name: str, primary_key_columns: Optional[List[str]] = None
     ) -> dict:
         """Create comprehensive diff of a table"""
-        before_data, detected_pk = self.get_table_data(
-            self.before_db, table_name, primary_key_columns
-        )
-        after_data, _ = self.get_table_data(
-            self.after_db, table_name, primary_key_columns or detected_pk
+        pk_columns = primary_key_columns or self._resolve_primary_key_columns(
+            table_name
         )
+        changed = self.get_changed_table_data(table_name, pk_columns)
+        if changed is not None:
+            before_data, after_data, unchanged_count = changed
+        else:
+            before_data, _ = self.get_table_data(self.before_db, table_name, pk_columns)
+            after_data, _ = self.get_table_data(self.after_db, table_name, pk_columns)
+            unchanged_count = 0
 
         before_keys = set(before_data.keys())
         after_keys = set(after_data.keys())
@@ -133,11 +253,11 @@ class SQLiteDiffer:
 
         result = {
             "table_name": table_name,
-            "primary_key": primary_key_columns or detected_pk,
+            "primary_key": pk_columns,
             "added_rows": [],
             "removed_rows": [],
             "modified_rows": [],
-            "unchanged_count": 0,
+            "unchanged_count": unchanged_count,
             "total_changes": 0,
         }
 
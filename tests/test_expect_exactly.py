@@ -10,15 +10,20 @@ This file contains:
 2. Mock-based tests - isolated tests for error message formatting
 """
 
+import copy
+import logging
 import sqlite3
-import tempfile
-import os
 import pytest
+from types import SimpleNamespace
 from typing import Dict, Any, List, Optional
-from unittest.mock import MagicMock
 
-from fleet.verifiers.db import DatabaseSnapshot, IgnoreConfig
-from fleet.resources.sqlite import SyncSnapshotDiff, SyncDatabaseSnapshot
+from fleet.verifiers.db import (
+    DatabaseSnapshot,
+    DiffValidationError,
+    ExpectExactlyError,
+    IgnoreConfig,
+)
+from fleet.resources.sqlite import SyncSnapshotDiff
 
 
 # ============================================================================
@@ -26,6 +31,16 @@ from fleet.resources.sqlite import SyncSnapshotDiff, SyncDatabaseSnapshot
 # ============================================================================
 
 
+class _StubSnapshot:
+    """Minimal stand-in for SyncDatabaseSnapshot; MockSnapshotDiff never queries it."""
+
+    def __init__(self, resource: Any = None):
+        self.resource = resource
+
+    def tables(self) -> List[str]:
+        return []
+
+
 class MockSnapshotDiff(SyncSnapshotDiff):
     """
     A mock SyncSnapshotDiff that uses pre-defined diff data instead of
@@ -36,15 +51,10 @@ class MockSnapshotDiff(SyncSnapshotDiff):
     """
 
     def __init__(self, diff_data: Dict[str, Any], ignore_config: Optional[IgnoreConfig] = None):
-        # Create minimal mock snapshots
-        mock_before = MagicMock(spec=SyncDatabaseSnapshot)
-        mock_after = MagicMock(spec=SyncDatabaseSnapshot)
-
-        # Mock the resource for HTTP mode detection (we want local mode for tests)
-        mock_resource = MagicMock()
-        mock_resource.client = None  # No HTTP client = local mode
-        mock_resource._mode = "local"
-        mock_after.resource = mock_resource
+        # Create minimal stub snapshots
+        mock_before = _StubSnapshot()
+        # No HTTP client = local mode
+        mock_after = _StubSnapshot(SimpleNamespace(client=None, _mode="local"))
 
         # Call parent init
         super().__init__(mock_before, mock_after, ignore_config)
@@ -66,290 +76,208 @@ class MockSnapshotDiff(SyncSnapshotDiff):
 # ============================================================================
 
 
-def test_field_level_specs_for_added_row():
-    """Test that bulk field specs work for row additions in expect_exactly"""
-
-    # Create two temporary databases
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        # Setup before database
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
-
-        # Setup after database - add a new row
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
-        conn.commit()
-        conn.close()
-
-        # Create snapshots
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Bulk field specs should work for added rows in v2
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "users",
-                    "pk": 2,
-                    "type": "insert",
-                    "fields": [("id", 2), ("name", "Bob"), ("status", "inactive")],
-                },
-            ]
-        )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_field_level_specs_with_wrong_values():
-    """Test that wrong values are detected in expect_exactly"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
+@pytest.fixture
+def db_paths(tmp_path):
+    """Paths for a before/after pair of SQLite files, removed along with tmp_path."""
+    return str(tmp_path / "before.db"), str(tmp_path / "after.db")
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Should fail because status value is wrong
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "Bob"),
-                            ("status", "WRONG_VALUE"),
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
 
+def test_field_level_specs_for_added_row(db_paths):
+    """Test that bulk field specs work for row additions in expect_exactly"""
 
-def test_modification_with_bulk_fields_spec():
+    before_db, after_db = db_paths
+
+    # Setup before database
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.commit()
+    conn.close()
+
+    # Setup after database - add a new row
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
+    conn.commit()
+    conn.close()
+
+    # Create snapshots
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Bulk field specs should work for added rows in v2
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 2,
+                "type": "insert",
+                "fields": [("id", 2), ("name", "Bob"), ("status", "inactive")],
+            },
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def added_bob_diff(tmp_path_factory):
+    """One shared diff in which users row 2 (Bob, inactive) was inserted."""
+    tmp_path = tmp_path_factory.mktemp("added_bob")
+    before_db = str(tmp_path / "before.db")
+    after_db = str(tmp_path / "after.db")
+
+    conn = sqlite3.connect(before_db)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)")
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)")
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
+    conn.commit()
+    conn.close()
+
+    return DatabaseSnapshot(before_db).diff(DatabaseSnapshot(after_db))
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        pytest.param(
+            [("id", 2), ("name", "Bob"), ("status", "WRONG_VALUE")],
+            id="wrong-value",
+        ),
+        pytest.param(
+            # Missing status field - should fail
+            [("id", 2), ("name", "Bob")],
+            id="missing-field",
+        ),
+    ],
+)
+def test_added_row_fields_spec_mismatch_fails(added_bob_diff, fields):
+    """Test that wrong or missing fields in an insert spec are detected in expect_exactly"""
+
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
+        added_bob_diff.expect_exactly(
+            [{"table": "users", "pk": 2, "type": "insert", "fields": fields}]
+        )
+
+
+def test_modification_with_bulk_fields_spec(db_paths):
     """Test that bulk field specs work for row modifications in expect_exactly"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, role TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', 'user')")
-        conn.commit()
-        conn.close()
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, role TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', 'user')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, role TEXT)"
+    )
+    # Both name and status changed
+    conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive', 'user')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Bulk field specs for modifications - specify all changed fields
+    # no_other_changes=True ensures no other fields changed
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 1,
+                "type": "modify",
+                "resulting_fields": [("name", "Alice Updated"), ("status", "inactive")],
+                "no_other_changes": True,
+            },
+        ]
+    )
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, role TEXT)"
-        )
-        # Both name and status changed
-        conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive', 'user')")
-        conn.commit()
-        conn.close()
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+def test_modification_with_bulk_fields_spec_wrong_value(db_paths):
+    """Test that wrong values in modification bulk field specs are detected"""
 
-        # Bulk field specs for modifications - specify all changed fields
-        # no_other_changes=True ensures no other fields changed
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Should fail because status value is wrong
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
         before.diff(after).expect_exactly(
             [
                 {
                     "table": "users",
                     "pk": 1,
                     "type": "modify",
-                    "resulting_fields": [("name", "Alice Updated"), ("status", "inactive")],
+                    "resulting_fields": [
+                        ("name", "Alice Updated"),
+                        ("status", "WRONG_VALUE"),  # Wrong!
+                    ],
                     "no_other_changes": True,
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_modification_with_bulk_fields_spec_wrong_value():
-    """Test that wrong values in modification bulk field specs are detected"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Should fail because status value is wrong
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 1,
-                        "type": "modify",
-                        "resulting_fields": [
-                            ("name", "Alice Updated"),
-                            ("status", "WRONG_VALUE"),  # Wrong!
-                        ],
-                        "no_other_changes": True,
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
 
-def test_modification_with_bulk_fields_spec_missing_field():
+def test_modification_with_bulk_fields_spec_missing_field(db_paths):
     """Test that missing fields in modification bulk field specs are detected when no_other_changes=True"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        # Both name and status changed
-        conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Should fail because status change is not in resulting_fields and no_other_changes=True
-        with pytest.raises(AssertionError) as exc_info:
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 1,
-                        "type": "modify",
-                        "resulting_fields": [
-                            ("name", "Alice Updated"),
-                            # status is missing - should fail with no_other_changes=True
-                        ],
-                        "no_other_changes": True,
-                    },
-                ]
-            )
-
-        assert "status" in str(exc_info.value)
-        assert "not specified in resulting_fields" in str(exc_info.value)
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_modification_no_other_changes_false_allows_extra_changes():
-    """Test that no_other_changes=False allows other fields to change without checking them"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        # All three fields changed: name, status, updated_at
-        conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive', '2024-01-15')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # With no_other_changes=False, we only need to specify the fields we care about
-        # status and updated_at changed but we don't check them
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    # Both name and status changed
+    conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Should fail because status change is not in resulting_fields and no_other_changes=True
+    with pytest.raises(AssertionError) as exc_info:
         before.diff(after).expect_exactly(
             [
                 {
@@ -358,53 +286,118 @@ def test_modification_no_other_changes_false_allows_extra_changes():
                     "type": "modify",
                     "resulting_fields": [
                         ("name", "Alice Updated"),
-                        # status and updated_at not specified - that's OK with no_other_changes=False
+                        # status is missing - should fail with no_other_changes=True
                     ],
-                    "no_other_changes": False,  # Allows other changes
+                    "no_other_changes": True,
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    assert "status" in str(exc_info.value)
+    assert "not specified in resulting_fields" in str(exc_info.value)
+
+
+def test_modification_no_other_changes_false_allows_extra_changes(db_paths):
+    """Test that no_other_changes=False allows other fields to change without checking them"""
+
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    # All three fields changed: name, status, updated_at
+    conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive', '2024-01-15')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # With no_other_changes=False, we only need to specify the fields we care about
+    # status and updated_at changed but we don't check them
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 1,
+                "type": "modify",
+                "resulting_fields": [
+                    ("name", "Alice Updated"),
+                    # status and updated_at not specified - that's OK with no_other_changes=False
+                ],
+                "no_other_changes": False,  # Allows other changes
+            },
+        ]
+    )
 
 
-def test_modification_no_other_changes_true_with_ellipsis():
+def test_modification_no_other_changes_true_with_ellipsis(db_paths):
     """
     Test that no_other_changes=True and specifying fields with ... means only the specified
     fields are checked, and all other fields must remain unchanged (even if ... is used as the value).
     """
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        # Initial table and row
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
-        conn.commit()
-        conn.close()
-
-        # After: only 'name' changes (others should remain exactly the same)
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute(
-            "INSERT INTO users VALUES (1, 'Alice Updated', 'active', '2024-01-01')"
-        )
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Specify to check only name with ..., others must remain the same (enforced by no_other_changes=True)
+    before_db, after_db = db_paths
+
+    # Initial table and row
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
+    conn.commit()
+    conn.close()
+
+    # After: only 'name' changes (others should remain exactly the same)
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO users VALUES (1, 'Alice Updated', 'active', '2024-01-01')"
+    )
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Specify to check only name with ..., others must remain the same (enforced by no_other_changes=True)
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 1,
+                "type": "modify",
+                "resulting_fields": [
+                    ("name", ...),  # Only check that field changed, but not checking its value
+                ],
+                "no_other_changes": True,
+            },
+        ]
+    )
+
+    # Now, test that a change to a non-listed field triggers an error
+    # We'll modify status, which is not covered by 'resulting_fields'
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "DELETE FROM users WHERE id=1"
+    )
+    conn.execute(
+        "INSERT INTO users VALUES (1, 'Alice Updated', 'inactive', '2024-01-01')"
+    )
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(AssertionError):
         before.diff(after).expect_exactly(
             [
                 {
@@ -412,174 +405,40 @@ def test_modification_no_other_changes_true_with_ellipsis():
                     "pk": 1,
                     "type": "modify",
                     "resulting_fields": [
-                        ("name", ...),  # Only check that field changed, but not checking its value
+                        ("name", ...),  # Only allow name to change, not status
                     ],
                     "no_other_changes": True,
                 },
             ]
         )
 
-        # Now, test that a change to a non-listed field triggers an error
-        # We'll modify status, which is not covered by 'resulting_fields'
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "DELETE FROM users WHERE id=1"
-        )
-        conn.execute(
-            "INSERT INTO users VALUES (1, 'Alice Updated', 'inactive', '2024-01-01')"
-        )
-        conn.commit()
-        conn.close()
-
-        with pytest.raises(AssertionError):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 1,
-                        "type": "modify",
-                        "resulting_fields": [
-                            ("name", ...),  # Only allow name to change, not status
-                        ],
-                        "no_other_changes": True,
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
 
-
-def test_modification_no_other_changes_false_still_validates_specified():
+def test_modification_no_other_changes_false_still_validates_specified(db_paths):
     """Test that no_other_changes=False still validates the fields that ARE specified"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Should fail because name value is wrong, even with no_other_changes=False
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 1,
-                        "type": "modify",
-                        "resulting_fields": [
-                            ("name", "WRONG VALUE"),  # This is wrong
-                        ],
-                        "no_other_changes": False,  # Allows status to change unvalidated
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_modification_missing_no_other_changes_raises_error():
-    """Test that missing no_other_changes field raises a ValueError"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Should fail because no_other_changes is missing
-        with pytest.raises(ValueError, match="missing required 'no_other_changes'"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 1,
-                        "type": "modify",
-                        "resulting_fields": [
-                            ("name", "Alice Updated"),
-                            ("status", "inactive"),
-                        ],
-                        # no_other_changes is MISSING - should raise ValueError
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_modification_with_bulk_fields_spec_ellipsis():
-    """Test that Ellipsis works in modification bulk field specs to skip value check"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        # All three fields changed
-        conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive', '2024-01-15')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Using Ellipsis to skip value check for updated_at
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Should fail because name value is wrong, even with no_other_changes=False
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
         before.diff(after).expect_exactly(
             [
                 {
@@ -587,386 +446,497 @@ def test_modification_with_bulk_fields_spec_ellipsis():
                     "pk": 1,
                     "type": "modify",
                     "resulting_fields": [
-                        ("name", "Alice Updated"),
-                        ("status", "inactive"),
-                        ("updated_at", ...),  # Don't check value
+                        ("name", "WRONG VALUE"),  # This is wrong
                     ],
-                    "no_other_changes": True,
+                    "no_other_changes": False,  # Allows status to change unvalidated
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
 
+def test_modification_missing_no_other_changes_raises_error(db_paths):
+    """Test that missing no_other_changes field raises a ValueError"""
 
-@pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_multiple_table_changes_with_mixed_specs():
-    """Test complex scenario with multiple tables and mixed bulk field/whole-row specs in expect_exactly"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        # Setup before database with multiple tables
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, role TEXT)"
-        )
-        conn.execute(
-            "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'alice@test.com', 'admin')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'bob@test.com', 'user')")
-        conn.execute("INSERT INTO orders VALUES (1, 1, 100.0, 'pending')")
-        conn.commit()
-        conn.close()
-
-        # Setup after database with complex changes
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, role TEXT)"
-        )
-        conn.execute(
-            "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'alice@test.com', 'admin')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'bob@test.com', 'user')")
-        conn.execute(
-            "INSERT INTO users VALUES (3, 'Charlie', 'charlie@test.com', 'user')"
-        )
-        conn.execute("INSERT INTO orders VALUES (1, 1, 100.0, 'completed')")
-        conn.execute("INSERT INTO orders VALUES (2, 2, 50.0, 'pending')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Mixed specs: bulk fields for new user, bulk fields for modification, and whole-row for new order
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Should fail because no_other_changes is missing
+    with pytest.raises(ValueError, match="missing required 'no_other_changes'"):
         before.diff(after).expect_exactly(
             [
-                # Bulk field specs for new user
                 {
                     "table": "users",
-                    "pk": 3,
-                    "type": "insert",
-                    "fields": [
-                        ("id", 3),
-                        ("name", "Charlie"),
-                        ("email", "charlie@test.com"),
-                        ("role", "user"),
-                    ],
-                },
-                # Bulk field specs for order status modification (using new format)
-                {
-                    "table": "orders",
                     "pk": 1,
                     "type": "modify",
-                    "resulting_fields": [("status", "completed")],
-                    "no_other_changes": True,
+                    "resulting_fields": [
+                        ("name", "Alice Updated"),
+                        ("status", "inactive"),
+                    ],
+                    # no_other_changes is MISSING - should raise ValueError
                 },
-                # Whole-row spec for new order (legacy)
-                {"table": "orders", "pk": 2, "fields": None, "after": "__added__"},
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
 
+def test_modification_with_bulk_fields_spec_ellipsis(db_paths):
+    """Test that Ellipsis works in modification bulk field specs to skip value check"""
 
-# test_partial_field_specs_with_unexpected_changes removed - uses legacy single-field spec format
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    # All three fields changed
+    conn.execute("INSERT INTO users VALUES (1, 'Alice Updated', 'inactive', '2024-01-15')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Using Ellipsis to skip value check for updated_at
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 1,
+                "type": "modify",
+                "resulting_fields": [
+                    ("name", "Alice Updated"),
+                    ("status", "inactive"),
+                    ("updated_at", ...),  # Don't check value
+                ],
+                "no_other_changes": True,
+            },
+        ]
+    )
 
 
-def test_numeric_type_conversion_in_specs():
-    """Test that numeric type conversions work correctly in bulk field specs with expect_exactly"""
+@pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
+def test_multiple_table_changes_with_mixed_specs(db_paths):
+    """Test complex scenario with multiple tables and mixed bulk field/whole-row specs in expect_exactly"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
+    before_db, after_db = db_paths
+
+    # Setup before database with multiple tables
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, role TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'alice@test.com', 'admin')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'bob@test.com', 'user')")
+    conn.execute("INSERT INTO orders VALUES (1, 1, 100.0, 'pending')")
+    conn.commit()
+    conn.close()
+
+    # Setup after database with complex changes
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, role TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'alice@test.com', 'admin')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'bob@test.com', 'user')")
+    conn.execute(
+        "INSERT INTO users VALUES (3, 'Charlie', 'charlie@test.com', 'user')"
+    )
+    conn.execute("INSERT INTO orders VALUES (1, 1, 100.0, 'completed')")
+    conn.execute("INSERT INTO orders VALUES (2, 2, 50.0, 'pending')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Mixed specs: bulk fields for new user, bulk fields for modification, and whole-row for new order
+    before.diff(after).expect_exactly(
+        [
+            # Bulk field specs for new user
+            {
+                "table": "users",
+                "pk": 3,
+                "type": "insert",
+                "fields": [
+                    ("id", 3),
+                    ("name", "Charlie"),
+                    ("email", "charlie@test.com"),
+                    ("role", "user"),
+                ],
+            },
+            # Bulk field specs for order status modification (using new format)
+            {
+                "table": "orders",
+                "pk": 1,
+                "type": "modify",
+                "resulting_fields": [("status", "completed")],
+                "no_other_changes": True,
+            },
+            # Whole-row spec for new order (legacy)
+            {"table": "orders", "pk": 2, "fields": None, "after": "__added__"},
+        ]
+    )
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE metrics (id INTEGER PRIMARY KEY, value REAL, count INTEGER)"
-        )
-        conn.execute("INSERT INTO metrics VALUES (1, 3.14, 42)")
-        conn.commit()
-        conn.close()
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE metrics (id INTEGER PRIMARY KEY, value REAL, count INTEGER)"
-        )
-        conn.execute("INSERT INTO metrics VALUES (1, 3.14, 42)")
-        conn.execute("INSERT INTO metrics VALUES (2, 2.71, 17)")
-        conn.commit()
-        conn.close()
+# test_partial_field_specs_with_unexpected_changes removed - uses legacy single-field spec format
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
 
-        # Test string vs integer comparison for primary key
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "metrics",
-                    "pk": "2",
-                    "type": "insert",
-                    "fields": [("id", 2), ("value", 2.71), ("count", 17)],
-                },
-            ]
-        )
+def test_numeric_type_conversion_in_specs(db_paths):
+    """Test that numeric type conversions work correctly in bulk field specs with expect_exactly"""
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE metrics (id INTEGER PRIMARY KEY, value REAL, count INTEGER)"
+    )
+    conn.execute("INSERT INTO metrics VALUES (1, 3.14, 42)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE metrics (id INTEGER PRIMARY KEY, value REAL, count INTEGER)"
+    )
+    conn.execute("INSERT INTO metrics VALUES (1, 3.14, 42)")
+    conn.execute("INSERT INTO metrics VALUES (2, 2.71, 17)")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Test string vs integer comparison for primary key
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "metrics",
+                "pk": "2",
+                "type": "insert",
+                "fields": [("id", 2), ("value", 2.71), ("count", 17)],
+            },
+        ]
+    )
 
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_deletion_with_field_level_specs():
+def test_deletion_with_field_level_specs(db_paths):
     """Test that bulk field specs work for row deletions in expect_exactly"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE inventory (id INTEGER PRIMARY KEY, item TEXT, quantity INTEGER, location TEXT)"
-        )
-        conn.execute("INSERT INTO inventory VALUES (1, 'Widget A', 10, 'Warehouse 1')")
-        conn.execute("INSERT INTO inventory VALUES (2, 'Widget B', 5, 'Warehouse 2')")
-        conn.execute("INSERT INTO inventory VALUES (3, 'Widget C', 15, 'Warehouse 1')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE inventory (id INTEGER PRIMARY KEY, item TEXT, quantity INTEGER, location TEXT)"
-        )
-        conn.execute("INSERT INTO inventory VALUES (1, 'Widget A', 10, 'Warehouse 1')")
-        conn.execute("INSERT INTO inventory VALUES (3, 'Widget C', 15, 'Warehouse 1')")
-        conn.commit()
-        conn.close()
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE inventory (id INTEGER PRIMARY KEY, item TEXT, quantity INTEGER, location TEXT)"
+    )
+    conn.execute("INSERT INTO inventory VALUES (1, 'Widget A', 10, 'Warehouse 1')")
+    conn.execute("INSERT INTO inventory VALUES (2, 'Widget B', 5, 'Warehouse 2')")
+    conn.execute("INSERT INTO inventory VALUES (3, 'Widget C', 15, 'Warehouse 1')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE inventory (id INTEGER PRIMARY KEY, item TEXT, quantity INTEGER, location TEXT)"
+    )
+    conn.execute("INSERT INTO inventory VALUES (1, 'Widget A', 10, 'Warehouse 1')")
+    conn.execute("INSERT INTO inventory VALUES (3, 'Widget C', 15, 'Warehouse 1')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Bulk field specs for deleted row (with "type": "delete")
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "inventory",
+                "pk": 2,
+                "type": "delete",
+                "fields": [
+                    ("id", 2),
+                    ("item", "Widget B"),
+                    ("quantity", 5),
+                    ("location", "Warehouse 2"),
+                ],
+            },
+            # also do a whole-row check (legacy)
+            {
+                "table": "inventory",
+                "pk": 2,
+                "fields": None,
+                "after": "__removed__",
+            },
+        ]
+    )
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
 
-        # Bulk field specs for deleted row (with "type": "delete")
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "inventory",
-                    "pk": 2,
-                    "type": "delete",
-                    "fields": [
-                        ("id", 2),
-                        ("item", "Widget B"),
-                        ("quantity", 5),
-                        ("location", "Warehouse 2"),
-                    ],
-                },
-                # also do a whole-row check (legacy)
-                {
-                    "table": "inventory",
-                    "pk": 2,
-                    "fields": None,
-                    "after": "__removed__",
-                },
-            ]
-        )
+def test_mixed_data_types_and_null_values(db_paths):
+    """Test bulk field specs with mixed data types and null values in expect_exactly"""
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_mixed_data_types_and_null_values():
-    """Test bulk field specs with mixed data types and null values in expect_exactly"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE mixed_data (id INTEGER PRIMARY KEY, text_val TEXT, num_val REAL, bool_val INTEGER, null_val TEXT)"
-        )
-        conn.execute("INSERT INTO mixed_data VALUES (1, 'test', 42.5, 1, NULL)")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE mixed_data (id INTEGER PRIMARY KEY, text_val TEXT, num_val REAL, bool_val INTEGER, null_val TEXT)"
-        )
-        conn.execute("INSERT INTO mixed_data VALUES (1, 'test', 42.5, 1, NULL)")
-        conn.execute("INSERT INTO mixed_data VALUES (2, NULL, 0.0, 0, 'not_null')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Test various data types and null handling
-        # ("text_val", None) checks that the value is SQL NULL
-        # ("field", ...) means don't check the value
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "mixed_data",
-                    "pk": 2,
-                    "type": "insert",
-                    "fields": [
-                        ("id", 2),
-                        ("text_val", None),  # Check that value IS NULL
-                        ("num_val", 0.0),
-                        ("bool_val", 0),
-                        ("null_val", "not_null"),
-                    ],
-                },
-            ]
-        )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE mixed_data (id INTEGER PRIMARY KEY, text_val TEXT, num_val REAL, bool_val INTEGER, null_val TEXT)"
+    )
+    conn.execute("INSERT INTO mixed_data VALUES (1, 'test', 42.5, 1, NULL)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE mixed_data (id INTEGER PRIMARY KEY, text_val TEXT, num_val REAL, bool_val INTEGER, null_val TEXT)"
+    )
+    conn.execute("INSERT INTO mixed_data VALUES (1, 'test', 42.5, 1, NULL)")
+    conn.execute("INSERT INTO mixed_data VALUES (2, NULL, 0.0, 0, 'not_null')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Test various data types and null handling
+    # ("text_val", None) checks that the value is SQL NULL
+    # ("field", ...) means don't check the value
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "mixed_data",
+                "pk": 2,
+                "type": "insert",
+                "fields": [
+                    ("id", 2),
+                    ("text_val", None),  # Check that value IS NULL
+                    ("num_val", 0.0),
+                    ("bool_val", 0),
+                    ("null_val", "not_null"),
+                ],
+            },
+        ]
+    )
 
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_whole_row_spec_backward_compat():
+def test_whole_row_spec_backward_compat(db_paths):
     """Test that whole-row specs still work (backward compatibility)"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
-        conn.commit()
-        conn.close()
+    before_db, after_db = db_paths
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.commit()
+    conn.close()
 
-        # Whole-row spec should still work
-        before.diff(after).expect_exactly(
-            [{"table": "users", "pk": 2, "fields": None, "after": "__added__"}]
-        )
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
+    conn.commit()
+    conn.close()
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
 
+    # Whole-row spec should still work
+    before.diff(after).expect_exactly(
+        [{"table": "users", "pk": 2, "fields": None, "after": "__added__"}]
+    )
 
-def test_missing_field_specs():
-    """Test that missing fields in bulk field specs are detected in expect_exactly"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
+# test_modified_row_with_unauthorized_field_change removed - uses legacy single-field spec format
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Should fail because status field is missing from the fields spec
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "Bob"),
-                            # Missing status field - should fail
-                        ],
-                    },
-                ]
-            )
+def test_fields_spec_basic(db_paths):
+    """Test that bulk fields spec works correctly for added rows in expect_exactly"""
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Test: All fields specified with exact values - should pass
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 2,
+                "type": "insert",
+                "fields": [
+                    ("id", 2),
+                    ("name", "Bob"),
+                    ("status", "inactive"),
+                    ("updated_at", "2024-01-02"),
+                ],
+            },
+        ]
+    )
 
 
-# test_modified_row_with_unauthorized_field_change removed - uses legacy single-field spec format
+def test_fields_spec_with_ellipsis_means_dont_check(db_paths):
+    """Test that Ellipsis (...) in a 2-tuple means 'don't check this field's value'"""
 
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Test: Using Ellipsis means don't check the value - should pass
+    # even though updated_at is '2024-01-02'
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 2,
+                "type": "insert",
+                "fields": [
+                    ("id", 2),
+                    ("name", "Bob"),
+                    ("status", "inactive"),
+                    ("updated_at", ...),  # Don't check this value
+                ],
+            },
+        ]
+    )
 
-def test_fields_spec_basic():
-    """Test that bulk fields spec works correctly for added rows in expect_exactly"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
+def test_fields_spec_with_none_checks_for_null(db_paths):
+    """Test that None in a 2-tuple means 'check that field is SQL NULL'"""
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
-        conn.commit()
-        conn.close()
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, deleted_at TEXT)"
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, deleted_at TEXT)"
+    )
+    # deleted_at is NULL
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'active', NULL)")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Test: Using None means check that value is SQL NULL - should pass
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 2,
+                "type": "insert",
+                "fields": [
+                    ("id", 2),
+                    ("name", "Bob"),
+                    ("status", "active"),
+                    ("deleted_at", None),  # Check that this IS NULL
+                ],
+            },
+        ]
+    )
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active', '2024-01-01')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
-        conn.commit()
-        conn.close()
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+def test_fields_spec_with_none_fails_when_not_null(db_paths):
+    """Test that None check fails when field is not actually NULL"""
 
-        # Test: All fields specified with exact values - should pass
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, deleted_at TEXT)"
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, deleted_at TEXT)"
+    )
+    # deleted_at is NOT NULL - has a value
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'active', '2024-01-15')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Test: Using None to check for NULL, but field is NOT NULL - should fail
+    with pytest.raises(AssertionError) as exc_info:
         before.diff(after).expect_exactly(
             [
                 {
@@ -976,47 +946,42 @@ def test_fields_spec_basic():
                     "fields": [
                         ("id", 2),
                         ("name", "Bob"),
-                        ("status", "inactive"),
-                        ("updated_at", "2024-01-02"),
+                        ("status", "active"),
+                        ("deleted_at", None),  # Expect NULL, but actual is '2024-01-15'
                     ],
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    assert "deleted_at" in str(exc_info.value)
+    assert "None" in str(exc_info.value)  # Expected NULL shown in table
 
 
-def test_fields_spec_with_ellipsis_means_dont_check():
-    """Test that Ellipsis (...) in a 2-tuple means 'don't check this field's value'"""
+def test_fields_spec_1_tuple_raises_error(db_paths):
+    """Test that a 1-tuple raises an error (use Ellipsis instead)"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
+    before_db, after_db = db_paths
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.commit()
-        conn.close()
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.commit()
+    conn.close()
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
-        conn.commit()
-        conn.close()
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
+    conn.commit()
+    conn.close()
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
 
-        # Test: Using Ellipsis means don't check the value - should pass
-        # even though updated_at is '2024-01-02'
+    # Test: 1-tuple is no longer supported - should raise ValueError
+    with pytest.raises(ValueError, match="Invalid field spec"):
         before.diff(after).expect_exactly(
             [
                 {
@@ -1026,47 +991,39 @@ def test_fields_spec_with_ellipsis_means_dont_check():
                     "fields": [
                         ("id", 2),
                         ("name", "Bob"),
-                        ("status", "inactive"),
-                        ("updated_at", ...),  # Don't check this value
+                        ("status",),  # 1-tuple: NOT SUPPORTED - use ("status", ...) instead
+                        ("updated_at",),
                     ],
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
 
+def test_fields_spec_missing_field_fails(db_paths):
+    """Test that missing a field in the fields spec causes validation to fail"""
 
-def test_fields_spec_with_none_checks_for_null():
-    """Test that None in a 2-tuple means 'check that field is SQL NULL'"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
+    before_db, after_db = db_paths
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, deleted_at TEXT)"
-        )
-        conn.commit()
-        conn.close()
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.commit()
+    conn.close()
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, deleted_at TEXT)"
-        )
-        # deleted_at is NULL
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'active', NULL)")
-        conn.commit()
-        conn.close()
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
+    conn.commit()
+    conn.close()
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
 
-        # Test: Using None means check that value is SQL NULL - should pass
+    # Test: Missing 'status' field should cause validation to fail
+    with pytest.raises(AssertionError) as exc_info:
         before.diff(after).expect_exactly(
             [
                 {
@@ -1076,260 +1033,43 @@ def test_fields_spec_with_none_checks_for_null():
                     "fields": [
                         ("id", 2),
                         ("name", "Bob"),
-                        ("status", "active"),
-                        ("deleted_at", None),  # Check that this IS NULL
+                        # status is MISSING - should fail
+                        ("updated_at", ...),  # Don't check this value
                     ],
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_fields_spec_with_none_fails_when_not_null():
-    """Test that None check fails when field is not actually NULL"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, deleted_at TEXT)"
-        )
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, deleted_at TEXT)"
-        )
-        # deleted_at is NOT NULL - has a value
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'active', '2024-01-15')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Test: Using None to check for NULL, but field is NOT NULL - should fail
-        with pytest.raises(AssertionError) as exc_info:
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "Bob"),
-                            ("status", "active"),
-                            ("deleted_at", None),  # Expect NULL, but actual is '2024-01-15'
-                        ],
-                    },
-                ]
-            )
-
-        assert "deleted_at" in str(exc_info.value)
-        assert "None" in str(exc_info.value)  # Expected NULL shown in table
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_fields_spec_1_tuple_raises_error():
-    """Test that a 1-tuple raises an error (use Ellipsis instead)"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Test: 1-tuple is no longer supported - should raise ValueError
-        with pytest.raises(ValueError, match="Invalid field spec"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "Bob"),
-                            ("status",),  # 1-tuple: NOT SUPPORTED - use ("status", ...) instead
-                            ("updated_at",),
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    assert "status" in str(exc_info.value)
+    assert "not specified in expected fields" in str(exc_info.value)
 
 
-def test_fields_spec_missing_field_fails():
-    """Test that missing a field in the fields spec causes validation to fail"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Test: Missing 'status' field should cause validation to fail
-        with pytest.raises(AssertionError) as exc_info:
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "Bob"),
-                            # status is MISSING - should fail
-                            ("updated_at", ...),  # Don't check this value
-                        ],
-                    },
-                ]
-            )
-
-        assert "status" in str(exc_info.value)
-        assert "not specified in expected fields" in str(exc_info.value)
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_fields_spec_wrong_value_fails():
+def test_fields_spec_wrong_value_fails(db_paths):
     """Test that wrong field value in fields spec causes validation to fail"""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Test: Wrong value for 'status' should fail
-        with pytest.raises(AssertionError) as exc_info:
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "Bob"),
-                            ("status", "active"),  # Wrong value - row has 'inactive'
-                            ("updated_at", ...),  # Don't check this value
-                        ],
-                    },
-                ]
-            )
-
-        assert "status" in str(exc_info.value)
-        assert "'active'" in str(exc_info.value)  # Expected value shown in table
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_fields_spec_with_ignore_config():
-    """Test that ignore_config works correctly with bulk fields spec"""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.commit()
-        conn.close()
+    before_db, after_db = db_paths
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
-        conn.commit()
-        conn.close()
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.commit()
+    conn.close()
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
+    conn.commit()
+    conn.close()
 
-        # Ignore the updated_at field globally
-        ignore_config = IgnoreConfig(table_fields={"users": {"updated_at"}})
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
 
-        # Test: With ignore_config, we don't need to specify updated_at
-        before.diff(after, ignore_config).expect_exactly(
+    # Test: Wrong value for 'status' should fail
+    with pytest.raises(AssertionError) as exc_info:
+        before.diff(after).expect_exactly(
             [
                 {
                     "table": "users",
@@ -1338,16 +1078,59 @@ def test_fields_spec_with_ignore_config():
                     "fields": [
                         ("id", 2),
                         ("name", "Bob"),
-                        ("status", "inactive"),
-                        # updated_at is ignored, so we don't need to specify it
+                        ("status", "active"),  # Wrong value - row has 'inactive'
+                        ("updated_at", ...),  # Don't check this value
                     ],
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    assert "status" in str(exc_info.value)
+    assert "'active'" in str(exc_info.value)  # Expected value shown in table
+
+
+def test_fields_spec_with_ignore_config(db_paths):
+    """Test that ignore_config works correctly with bulk fields spec"""
+
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive', '2024-01-02')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Ignore the updated_at field globally
+    ignore_config = IgnoreConfig(table_fields={"users": {"updated_at"}})
+
+    # Test: With ignore_config, we don't need to specify updated_at
+    before.diff(after, ignore_config).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 2,
+                "type": "insert",
+                "fields": [
+                    ("id", 2),
+                    ("name", "Bob"),
+                    ("status", "inactive"),
+                    # updated_at is ignored, so we don't need to specify it
+                ],
+            },
+        ]
+    )
 
 
 # ============================================================================
@@ -1358,7 +1141,7 @@ def test_fields_spec_with_ignore_config():
 
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_security_whole_row_spec_allows_any_values():
+def test_security_whole_row_spec_allows_any_values(db_paths):
     """
     expect_only with whole-row specs allows ANY field values.
 
@@ -1367,44 +1150,36 @@ def test_security_whole_row_spec_allows_any_values():
     Use expect_exactly with field-level specs for stricter validation.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT, active INTEGER)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'user', 1)")
-        conn.commit()
-        conn.close()
+    before_db, after_db = db_paths
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT, active INTEGER)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'user', 1)")
-        # User added with admin role
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'admin', 1)")
-        conn.commit()
-        conn.close()
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT, active INTEGER)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'user', 1)")
+    conn.commit()
+    conn.close()
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT, active INTEGER)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'user', 1)")
+    # User added with admin role
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'admin', 1)")
+    conn.commit()
+    conn.close()
 
-        # expect_only with whole-row spec passes - doesn't check field values
-        before.diff(after).expect_exactly(
-            [{"table": "users", "pk": 2, "fields": None, "after": "__added__"}]
-        )
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    # expect_only with whole-row spec passes - doesn't check field values
+    before.diff(after).expect_exactly(
+        [{"table": "users", "pk": 2, "fields": None, "after": "__added__"}]
+    )
 
 
-def test_security_field_level_specs_catch_wrong_role():
+def test_security_field_level_specs_catch_wrong_role(db_paths):
     """
     expect_exactly with bulk field specs catches unauthorized values.
 
@@ -1412,245 +1187,213 @@ def test_security_field_level_specs_catch_wrong_role():
     expect_exactly will catch it.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT, active INTEGER)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'user', 1)")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT, active INTEGER)"
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT, active INTEGER)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'user', 1)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT, active INTEGER)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'user', 1)")
+    # User added with admin role
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'admin', 1)")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # expect_exactly correctly FAILS because role is 'admin' not 'user'
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
+        before.diff(after).expect_exactly(
+            [
+                {
+                    "table": "users",
+                    "pk": 2,
+                    "type": "insert",
+                    "fields": [
+                        ("id", 2),
+                        ("name", "Bob"),
+                        ("role", "user"),  # Expected 'user', but actual is 'admin'
+                        ("active", 1),
+                    ],
+                },
+            ]
         )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'user', 1)")
-        # User added with admin role
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'admin', 1)")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # expect_exactly correctly FAILS because role is 'admin' not 'user'
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "Bob"),
-                            ("role", "user"),  # Expected 'user', but actual is 'admin'
-                            ("active", 1),
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
 
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_financial_data_validation():
+def test_financial_data_validation(db_paths):
     """
     Demonstrates difference between expect_only and expect_exactly for financial data.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL, discount REAL)"
-        )
-        conn.execute("INSERT INTO orders VALUES (1, 100, 50.00, 0.0)")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL, discount REAL)"
-        )
-        conn.execute("INSERT INTO orders VALUES (1, 100, 50.00, 0.0)")
-        # Order with 100% discount
-        conn.execute("INSERT INTO orders VALUES (2, 200, 1000.00, 1000.00)")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # expect_only with whole-row spec passes - doesn't check discount value
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL, discount REAL)"
+    )
+    conn.execute("INSERT INTO orders VALUES (1, 100, 50.00, 0.0)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL, discount REAL)"
+    )
+    conn.execute("INSERT INTO orders VALUES (1, 100, 50.00, 0.0)")
+    # Order with 100% discount
+    conn.execute("INSERT INTO orders VALUES (2, 200, 1000.00, 1000.00)")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # expect_only with whole-row spec passes - doesn't check discount value
+    before.diff(after).expect_exactly(
+        [{"table": "orders", "pk": 2, "fields": None, "after": "__added__"}]
+    )
+
+    # expect_exactly with bulk field specs catches unexpected discount
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
         before.diff(after).expect_exactly(
-            [{"table": "orders", "pk": 2, "fields": None, "after": "__added__"}]
+            [
+                {
+                    "table": "orders",
+                    "pk": 2,
+                    "type": "insert",
+                    "fields": [
+                        ("id", 2),
+                        ("user_id", 200),
+                        ("amount", 1000.00),
+                        ("discount", 0.0),  # Expected no discount, but actual is 1000.00
+                    ],
+                },
+            ]
         )
 
-        # expect_exactly with bulk field specs catches unexpected discount
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "orders",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("user_id", 200),
-                            ("amount", 1000.00),
-                            ("discount", 0.0),  # Expected no discount, but actual is 1000.00
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_permissions_validation():
+def test_permissions_validation(db_paths):
     """
     Demonstrates difference between expect_only and expect_exactly for permissions.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE permissions (id INTEGER PRIMARY KEY, user_id INTEGER, resource TEXT, can_read INTEGER, can_write INTEGER, can_delete INTEGER)"
-        )
-        conn.execute("INSERT INTO permissions VALUES (1, 100, 'documents', 1, 0, 0)")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE permissions (id INTEGER PRIMARY KEY, user_id INTEGER, resource TEXT, can_read INTEGER, can_write INTEGER, can_delete INTEGER)"
-        )
-        conn.execute("INSERT INTO permissions VALUES (1, 100, 'documents', 1, 0, 0)")
-        # Grant full permissions including delete
-        conn.execute("INSERT INTO permissions VALUES (2, 200, 'admin_panel', 1, 1, 1)")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # expect_only with whole-row spec passes - doesn't check permission values
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE permissions (id INTEGER PRIMARY KEY, user_id INTEGER, resource TEXT, can_read INTEGER, can_write INTEGER, can_delete INTEGER)"
+    )
+    conn.execute("INSERT INTO permissions VALUES (1, 100, 'documents', 1, 0, 0)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE permissions (id INTEGER PRIMARY KEY, user_id INTEGER, resource TEXT, can_read INTEGER, can_write INTEGER, can_delete INTEGER)"
+    )
+    conn.execute("INSERT INTO permissions VALUES (1, 100, 'documents', 1, 0, 0)")
+    # Grant full permissions including delete
+    conn.execute("INSERT INTO permissions VALUES (2, 200, 'admin_panel', 1, 1, 1)")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # expect_only with whole-row spec passes - doesn't check permission values
+    before.diff(after).expect_exactly(
+        [{"table": "permissions", "pk": 2, "fields": None, "after": "__added__"}]
+    )
+
+    # expect_exactly with bulk field specs catches unexpected delete permission
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
         before.diff(after).expect_exactly(
-            [{"table": "permissions", "pk": 2, "fields": None, "after": "__added__"}]
+            [
+                {
+                    "table": "permissions",
+                    "pk": 2,
+                    "type": "insert",
+                    "fields": [
+                        ("id", 2),
+                        ("user_id", 200),
+                        ("resource", "admin_panel"),
+                        ("can_read", 1),
+                        ("can_write", 1),
+                        ("can_delete", 0),  # Expected NO delete, but actual is 1
+                    ],
+                },
+            ]
         )
 
-        # expect_exactly with bulk field specs catches unexpected delete permission
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "permissions",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("user_id", 200),
-                            ("resource", "admin_panel"),
-                            ("can_read", 1),
-                            ("can_write", 1),
-                            ("can_delete", 0),  # Expected NO delete, but actual is 1
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_json_field_validation():
+def test_json_field_validation(db_paths):
     """
     Demonstrates difference between expect_only and expect_exactly for JSON/text fields.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE configs (id INTEGER PRIMARY KEY, name TEXT, settings TEXT)"
-        )
-        conn.execute(
-            "INSERT INTO configs VALUES (1, 'app_config', '{\"debug\": false}')"
-        )
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE configs (id INTEGER PRIMARY KEY, name TEXT, settings TEXT)"
-        )
-        conn.execute(
-            "INSERT INTO configs VALUES (1, 'app_config', '{\"debug\": false}')"
-        )
-        # Config with different settings
-        conn.execute(
-            'INSERT INTO configs VALUES (2, \'user_config\', \'{"debug": true, "extra": "value"}\')'
-        )
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # expect_only with whole-row spec passes - doesn't check settings value
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE configs (id INTEGER PRIMARY KEY, name TEXT, settings TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO configs VALUES (1, 'app_config', '{\"debug\": false}')"
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE configs (id INTEGER PRIMARY KEY, name TEXT, settings TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO configs VALUES (1, 'app_config', '{\"debug\": false}')"
+    )
+    # Config with different settings
+    conn.execute(
+        'INSERT INTO configs VALUES (2, \'user_config\', \'{"debug": true, "extra": "value"}\')'
+    )
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # expect_only with whole-row spec passes - doesn't check settings value
+    before.diff(after).expect_exactly(
+        [{"table": "configs", "pk": 2, "fields": None, "after": "__added__"}]
+    )
+
+    # expect_exactly with bulk field specs catches unexpected settings
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
         before.diff(after).expect_exactly(
-            [{"table": "configs", "pk": 2, "fields": None, "after": "__added__"}]
+            [
+                {
+                    "table": "configs",
+                    "pk": 2,
+                    "type": "insert",
+                    "fields": [
+                        ("id", 2),
+                        ("name", "user_config"),
+                        ("settings", '{"debug": false}'),  # Wrong value
+                    ],
+                },
+            ]
         )
 
-        # expect_exactly with bulk field specs catches unexpected settings
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "configs",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "user_config"),
-                            ("settings", '{"debug": false}'),  # Wrong value
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
 
 # ============================================================================
 # Tests showing expect_only vs expect_exactly behavior with conflicting specs
@@ -1658,242 +1401,210 @@ def test_json_field_validation():
 
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_expect_only_ignores_field_specs_with_whole_row():
+def test_expect_only_ignores_field_specs_with_whole_row(db_paths):
     """
     expect_only with whole-row spec ignores any additional field specs.
     expect_exactly with bulk field specs validates field values.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price REAL, stock INTEGER)"
-        )
-        conn.execute("INSERT INTO products VALUES (1, 'Widget', 10.0, 100)")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price REAL, stock INTEGER)"
-        )
-        conn.execute("INSERT INTO products VALUES (1, 'Widget', 10.0, 100)")
-        # Add product with price=999.99 and stock=1
-        conn.execute("INSERT INTO products VALUES (2, 'Gadget', 999.99, 1)")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # expect_only with whole-row spec passes - ignores field specs
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price REAL, stock INTEGER)"
+    )
+    conn.execute("INSERT INTO products VALUES (1, 'Widget', 10.0, 100)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price REAL, stock INTEGER)"
+    )
+    conn.execute("INSERT INTO products VALUES (1, 'Widget', 10.0, 100)")
+    # Add product with price=999.99 and stock=1
+    conn.execute("INSERT INTO products VALUES (2, 'Gadget', 999.99, 1)")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # expect_only with whole-row spec passes - ignores field specs
+    before.diff(after).expect_exactly(
+        [{"table": "products", "pk": 2, "fields": None, "after": "__added__"}]
+    )
+
+    # expect_exactly with wrong field values fails
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
         before.diff(after).expect_exactly(
-            [{"table": "products", "pk": 2, "fields": None, "after": "__added__"}]
+            [
+                {
+                    "table": "products",
+                    "pk": 2,
+                    "type": "insert",
+                    "fields": [
+                        ("id", 2),
+                        ("name", "Gadget"),
+                        ("price", 50.0),  # WRONG! Actually 999.99
+                        ("stock", 500),  # WRONG! Actually 1
+                    ],
+                },
+            ]
         )
 
-        # expect_exactly with wrong field values fails
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "products",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("name", "Gadget"),
-                            ("price", 50.0),  # WRONG! Actually 999.99
-                            ("stock", 500),  # WRONG! Actually 1
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_expect_exactly_validates_field_values():
+def test_expect_exactly_validates_field_values(db_paths):
     """
     expect_exactly validates field values for added rows.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE accounts (id INTEGER PRIMARY KEY, username TEXT, role TEXT, balance REAL)"
-        )
-        conn.execute("INSERT INTO accounts VALUES (1, 'alice', 'user', 100.0)")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE accounts (id INTEGER PRIMARY KEY, username TEXT, role TEXT, balance REAL)"
-        )
-        conn.execute("INSERT INTO accounts VALUES (1, 'alice', 'user', 100.0)")
-        # Actual: role=admin, balance=1000000.0
-        conn.execute("INSERT INTO accounts VALUES (2, 'bob', 'admin', 1000000.0)")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # expect_only with whole-row spec passes
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE accounts (id INTEGER PRIMARY KEY, username TEXT, role TEXT, balance REAL)"
+    )
+    conn.execute("INSERT INTO accounts VALUES (1, 'alice', 'user', 100.0)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE accounts (id INTEGER PRIMARY KEY, username TEXT, role TEXT, balance REAL)"
+    )
+    conn.execute("INSERT INTO accounts VALUES (1, 'alice', 'user', 100.0)")
+    # Actual: role=admin, balance=1000000.0
+    conn.execute("INSERT INTO accounts VALUES (2, 'bob', 'admin', 1000000.0)")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # expect_only with whole-row spec passes
+    before.diff(after).expect_exactly(
+        [{"table": "accounts", "pk": 2, "fields": None, "after": "__added__"}]
+    )
+
+    # expect_exactly with wrong field values fails
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
         before.diff(after).expect_exactly(
-            [{"table": "accounts", "pk": 2, "fields": None, "after": "__added__"}]
+            [
+                {
+                    "table": "accounts",
+                    "pk": 2,
+                    "type": "insert",
+                    "fields": [
+                        ("id", 2),
+                        ("username", "bob"),
+                        ("role", "user"),  # Actually "admin"!
+                        ("balance", 0.0),  # Actually 1000000.0!
+                    ],
+                },
+            ]
         )
 
-        # expect_exactly with wrong field values fails
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "accounts",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 2),
-                            ("username", "bob"),
-                            ("role", "user"),  # Actually "admin"!
-                            ("balance", 0.0),  # Actually 1000000.0!
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_expect_exactly_validates_is_public():
+def test_expect_exactly_validates_is_public(db_paths):
     """
     expect_exactly validates field values including boolean-like fields.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE settings (id INTEGER PRIMARY KEY, key TEXT, value TEXT, is_public INTEGER)"
-        )
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE settings (id INTEGER PRIMARY KEY, key TEXT, value TEXT, is_public INTEGER)"
-        )
-        # Add a setting with is_public=1
-        conn.execute(
-            "INSERT INTO settings VALUES (1, 'api_key', 'secret123', 1)"
-        )
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # expect_only with whole-row spec passes
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE settings (id INTEGER PRIMARY KEY, key TEXT, value TEXT, is_public INTEGER)"
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE settings (id INTEGER PRIMARY KEY, key TEXT, value TEXT, is_public INTEGER)"
+    )
+    # Add a setting with is_public=1
+    conn.execute(
+        "INSERT INTO settings VALUES (1, 'api_key', 'secret123', 1)"
+    )
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # expect_only with whole-row spec passes
+    before.diff(after).expect_exactly(
+        [{"table": "settings", "pk": 1, "fields": None, "after": "__added__"}]
+    )
+
+    # expect_exactly with wrong is_public value fails
+    with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
         before.diff(after).expect_exactly(
-            [{"table": "settings", "pk": 1, "fields": None, "after": "__added__"}]
+            [
+                {
+                    "table": "settings",
+                    "pk": 1,
+                    "type": "insert",
+                    "fields": [
+                        ("id", 1),
+                        ("key", "api_key"),
+                        ("value", "secret123"),
+                        ("is_public", 0),  # Says private, but actually public!
+                    ],
+                },
+            ]
         )
 
-        # expect_exactly with wrong is_public value fails
-        with pytest.raises(AssertionError, match="VERIFICATION FAILED"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "settings",
-                        "pk": 1,
-                        "type": "insert",
-                        "fields": [
-                            ("id", 1),
-                            ("key", "api_key"),
-                            ("value", "secret123"),
-                            ("is_public", 0),  # Says private, but actually public!
-                        ],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
 
 @pytest.mark.skip(reason="Uses legacy spec format not supported by expect_exactly")
-def test_deletion_with_bulk_fields_spec():
+def test_deletion_with_bulk_fields_spec(db_paths):
     """
     expect_exactly validates field values for deleted rows using bulk field specs with 'type': 'delete',
     and without fields.
     """
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE sessions (id INTEGER PRIMARY KEY, user_id INTEGER, active INTEGER, admin_session INTEGER)"
-        )
-        conn.execute("INSERT INTO sessions VALUES (1, 100, 1, 0)")
-        conn.execute("INSERT INTO sessions VALUES (2, 101, 1, 1)")  # Admin session!
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE sessions (id INTEGER PRIMARY KEY, user_id INTEGER, active INTEGER, admin_session INTEGER)"
-        )
-        conn.execute("INSERT INTO sessions VALUES (1, 100, 1, 0)")
-        # Session 2 (admin session) is deleted
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # expect_only with whole-row spec passes
-        before.diff(after).expect_exactly(
-            [{"table": "sessions", "pk": 2, "fields": None, "after": "__removed__"}]
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE sessions (id INTEGER PRIMARY KEY, user_id INTEGER, active INTEGER, admin_session INTEGER)"
+    )
+    conn.execute("INSERT INTO sessions VALUES (1, 100, 1, 0)")
+    conn.execute("INSERT INTO sessions VALUES (2, 101, 1, 1)")  # Admin session!
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE sessions (id INTEGER PRIMARY KEY, user_id INTEGER, active INTEGER, admin_session INTEGER)"
+    )
+    conn.execute("INSERT INTO sessions VALUES (1, 100, 1, 0)")
+    # Session 2 (admin session) is deleted
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # expect_only with whole-row spec passes
+    before.diff(after).expect_exactly(
+        [{"table": "sessions", "pk": 2, "fields": None, "after": "__removed__"}]
+    )
+
+    before.diff(after).expect_exactly(
+            [
+                {
+                    "table": "sessions",
+                    "pk": 2,
+                    "type": "delete",
+                },
+            ]
         )
 
-        before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "sessions",
-                        "pk": 2,
-                        "type": "delete",
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
 
 # ============================================================================
 # Tests for targeted query optimization edge cases
@@ -1901,575 +1612,487 @@ def test_deletion_with_bulk_fields_spec():
 # ============================================================================
 
 
-def test_targeted_empty_allowed_changes_no_changes():
+def test_targeted_empty_allowed_changes_no_changes(db_paths):
     """Test that empty allowed_changes with no actual changes passes (uses _expect_no_changes)."""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
+    before_db, after_db = db_paths
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
-        conn.commit()
-        conn.close()
-
-        # Same data in after database
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
-        conn.commit()
-        conn.close()
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
+    conn.commit()
+    conn.close()
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+    # Same data in after database
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")
+    conn.commit()
+    conn.close()
 
-        # Empty allowed_changes should pass when there are no changes
-        before.diff(after).expect_exactly([])
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    # Empty allowed_changes should pass when there are no changes
+    before.diff(after).expect_exactly([])
 
 
-def test_targeted_empty_allowed_changes_with_changes_fails():
+def test_targeted_empty_allowed_changes_with_changes_fails(db_paths):
     """Test that empty allowed_changes with actual changes fails."""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")  # New row!
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Empty allowed_changes should fail when there are changes
-        # The error message depends on the optimization path taken
-        with pytest.raises(AssertionError):
-            before.diff(after).expect_exactly([])
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice', 'active')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob', 'inactive')")  # New row!
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Empty allowed_changes should fail when there are changes
+    # The error message depends on the optimization path taken
+    with pytest.raises(AssertionError):
+        before.diff(after).expect_exactly([])
 
 
-def test_targeted_unmentioned_table_row_added_fails():
+def test_targeted_unmentioned_table_row_added_fails(db_paths):
     """Test that row added in an unmentioned table is detected by targeted optimization."""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
-        )
-        conn.execute(
-            "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice')")
-        conn.execute("INSERT INTO orders VALUES (1, 1)")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
-        )
-        conn.execute(
-            "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob')")  # Allowed change
-        conn.execute("INSERT INTO orders VALUES (1, 1)")
-        conn.execute("INSERT INTO orders VALUES (2, 2)")  # Sneaky unmentioned change!
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Only mention users table - orders change should be detected
-        with pytest.raises(AssertionError, match="orders"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 2,
-                        "type": "insert",
-                        "fields": [("id", 2), ("name", "Bob")],
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_targeted_unmentioned_table_row_deleted_fails():
-    """Test that row deleted in an unmentioned table is detected."""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
-        )
-        conn.execute(
-            "CREATE TABLE logs (id INTEGER PRIMARY KEY, message TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice')")
-        conn.execute("INSERT INTO logs VALUES (1, 'Log entry 1')")
-        conn.execute("INSERT INTO logs VALUES (2, 'Log entry 2')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
-        )
-        conn.execute(
-            "CREATE TABLE logs (id INTEGER PRIMARY KEY, message TEXT)"
-        )
-        conn.execute("INSERT INTO users VALUES (1, 'Alice Updated')")  # Allowed change
-        conn.execute("INSERT INTO logs VALUES (1, 'Log entry 1')")
-        # logs id=2 deleted - not mentioned!
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Only mention users table - logs deletion should be detected
-        with pytest.raises(AssertionError, match="logs"):
-            before.diff(after).expect_exactly(
-                [
-                    {
-                        "table": "users",
-                        "pk": 1,
-                        "type": "modify",
-                        "resulting_fields": [("name", "Alice Updated")],
-                        "no_other_changes": True,
-                    },
-                ]
-            )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_targeted_multiple_changes_same_table():
-    """Test targeted optimization with multiple changes to the same table."""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, quantity INTEGER)"
-        )
-        conn.execute("INSERT INTO items VALUES (1, 'Widget', 10)")
-        conn.execute("INSERT INTO items VALUES (2, 'Gadget', 20)")
-        conn.execute("INSERT INTO items VALUES (3, 'Gizmo', 30)")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, quantity INTEGER)"
-        )
-        conn.execute("INSERT INTO items VALUES (1, 'Widget Updated', 15)")  # Modified
-        conn.execute("INSERT INTO items VALUES (2, 'Gadget', 20)")  # Unchanged
-        # Item 3 deleted
-        conn.execute("INSERT INTO items VALUES (4, 'New Item', 40)")  # Added
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # All changes properly specified
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice')")
+    conn.execute("INSERT INTO orders VALUES (1, 1)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob')")  # Allowed change
+    conn.execute("INSERT INTO orders VALUES (1, 1)")
+    conn.execute("INSERT INTO orders VALUES (2, 2)")  # Sneaky unmentioned change!
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Only mention users table - orders change should be detected
+    with pytest.raises(AssertionError, match="orders"):
         before.diff(after).expect_exactly(
             [
                 {
-                    "table": "items",
-                    "pk": 1,
-                    "type": "modify",
-                    "resulting_fields": [("name", "Widget Updated"), ("quantity", 15)],
-                    "no_other_changes": True,
-                },
-                {
-                    "table": "items",
-                    "pk": 3,
-                    "type": "delete",
-                },
-                {
-                    "table": "items",
-                    "pk": 4,
+                    "table": "users",
+                    "pk": 2,
                     "type": "insert",
-                    "fields": [("id", 4), ("name", "New Item"), ("quantity", 40)],
+                    "fields": [("id", 2), ("name", "Bob")],
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-# Legacy spec tests removed - expect_exactly requires explicit type field
-
-
-def test_targeted_with_ignore_config():
-    """Test that ignore_config works correctly with targeted optimization."""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE audit (id INTEGER PRIMARY KEY, action TEXT, timestamp TEXT)"
-        )
-        conn.execute(
-            "CREATE TABLE data (id INTEGER PRIMARY KEY, value TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO audit VALUES (1, 'init', '2024-01-01')")
-        conn.execute("INSERT INTO data VALUES (1, 'original', '2024-01-01')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE audit (id INTEGER PRIMARY KEY, action TEXT, timestamp TEXT)"
-        )
-        conn.execute(
-            "CREATE TABLE data (id INTEGER PRIMARY KEY, value TEXT, updated_at TEXT)"
-        )
-        conn.execute("INSERT INTO audit VALUES (1, 'init', '2024-01-01')")
-        conn.execute("INSERT INTO audit VALUES (2, 'update', '2024-01-02')")  # Ignored table
-        conn.execute("INSERT INTO data VALUES (1, 'updated', '2024-01-02')")  # Changed
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Ignore the audit table entirely, and updated_at field in data
-        ignore_config = IgnoreConfig(
-            tables={"audit"},
-            table_fields={"data": {"updated_at"}},
-        )
+def test_targeted_unmentioned_table_row_deleted_fails(db_paths):
+    """Test that row deleted in an unmentioned table is detected."""
 
-        # Only need to specify the value change, audit table is ignored
-        before.diff(after, ignore_config).expect_exactly(
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE logs (id INTEGER PRIMARY KEY, message TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice')")
+    conn.execute("INSERT INTO logs VALUES (1, 'Log entry 1')")
+    conn.execute("INSERT INTO logs VALUES (2, 'Log entry 2')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE logs (id INTEGER PRIMARY KEY, message TEXT)"
+    )
+    conn.execute("INSERT INTO users VALUES (1, 'Alice Updated')")  # Allowed change
+    conn.execute("INSERT INTO logs VALUES (1, 'Log entry 1')")
+    # logs id=2 deleted - not mentioned!
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Only mention users table - logs deletion should be detected
+    with pytest.raises(AssertionError, match="logs"):
+        before.diff(after).expect_exactly(
             [
                 {
-                    "table": "data",
+                    "table": "users",
                     "pk": 1,
                     "type": "modify",
-                    "resulting_fields": [("value", "updated")],
+                    "resulting_fields": [("name", "Alice Updated")],
                     "no_other_changes": True,
                 },
             ]
         )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_targeted_string_vs_int_pk_coercion():
-    """Test that PK comparison works with string vs int coercion."""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
-        )
-        conn.execute("INSERT INTO items VALUES (1, 'Item 1')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
-        )
-        conn.execute("INSERT INTO items VALUES (1, 'Item 1')")
-        conn.execute("INSERT INTO items VALUES (2, 'Item 2')")
-        conn.execute("INSERT INTO items VALUES (3, 'Item 3')")
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
 
-        # Use string PKs - should still work due to coercion
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "items",
-                    "pk": "2",  # String PK
-                    "type": "insert",
-                    "fields": [("id", 2), ("name", "Item 2")],
-                },
-                {
-                    "table": "items",
-                    "pk": 3,  # Integer PK
-                    "type": "insert",
-                    "fields": [("id", 3), ("name", "Item 3")],
-                },
-            ]
-        )
-
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
-
-
-def test_targeted_modify_without_resulting_fields():
-    """Test that type: 'modify' without resulting_fields allows any modification."""
-
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE records (id INTEGER PRIMARY KEY, field_a TEXT, field_b TEXT, field_c TEXT)"
-        )
-        conn.execute("INSERT INTO records VALUES (1, 'a1', 'b1', 'c1')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE records (id INTEGER PRIMARY KEY, field_a TEXT, field_b TEXT, field_c TEXT)"
-        )
-        conn.execute("INSERT INTO records VALUES (1, 'a2', 'b2', 'c2')")  # All fields changed
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # type: "modify" without resulting_fields allows any modification
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "records",
-                    "pk": 1,
-                    "type": "modify",
-                    # No resulting_fields - allows any changes
-                },
-            ]
-        )
+def test_targeted_multiple_changes_same_table(db_paths):
+    """Test targeted optimization with multiple changes to the same table."""
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, quantity INTEGER)"
+    )
+    conn.execute("INSERT INTO items VALUES (1, 'Widget', 10)")
+    conn.execute("INSERT INTO items VALUES (2, 'Gadget', 20)")
+    conn.execute("INSERT INTO items VALUES (3, 'Gizmo', 30)")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, quantity INTEGER)"
+    )
+    conn.execute("INSERT INTO items VALUES (1, 'Widget Updated', 15)")  # Modified
+    conn.execute("INSERT INTO items VALUES (2, 'Gadget', 20)")  # Unchanged
+    # Item 3 deleted
+    conn.execute("INSERT INTO items VALUES (4, 'New Item', 40)")  # Added
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # All changes properly specified
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "items",
+                "pk": 1,
+                "type": "modify",
+                "resulting_fields": [("name", "Widget Updated"), ("quantity", 15)],
+                "no_other_changes": True,
+            },
+            {
+                "table": "items",
+                "pk": 3,
+                "type": "delete",
+            },
+            {
+                "table": "items",
+                "pk": 4,
+                "type": "insert",
+                "fields": [("id", 4), ("name", "New Item"), ("quantity", 40)],
+            },
+        ]
+    )
 
 
-def test_targeted_insert_without_fields():
-    """Test that type: 'insert' without fields allows insertion with any values."""
+# Legacy spec tests removed - expect_exactly requires explicit type field
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE entities (id INTEGER PRIMARY KEY, data TEXT, secret TEXT)"
-        )
-        conn.commit()
-        conn.close()
+def test_targeted_with_ignore_config(db_paths):
+    """Test that ignore_config works correctly with targeted optimization."""
 
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE entities (id INTEGER PRIMARY KEY, data TEXT, secret TEXT)"
-        )
-        conn.execute("INSERT INTO entities VALUES (1, 'any data', 'any secret')")
-        conn.commit()
-        conn.close()
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE audit (id INTEGER PRIMARY KEY, action TEXT, timestamp TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE data (id INTEGER PRIMARY KEY, value TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO audit VALUES (1, 'init', '2024-01-01')")
+    conn.execute("INSERT INTO data VALUES (1, 'original', '2024-01-01')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE audit (id INTEGER PRIMARY KEY, action TEXT, timestamp TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE data (id INTEGER PRIMARY KEY, value TEXT, updated_at TEXT)"
+    )
+    conn.execute("INSERT INTO audit VALUES (1, 'init', '2024-01-01')")
+    conn.execute("INSERT INTO audit VALUES (2, 'update', '2024-01-02')")  # Ignored table
+    conn.execute("INSERT INTO data VALUES (1, 'updated', '2024-01-02')")  # Changed
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Ignore the audit table entirely, and updated_at field in data
+    ignore_config = IgnoreConfig(
+        tables={"audit"},
+        table_fields={"data": {"updated_at"}},
+    )
+
+    # Only need to specify the value change, audit table is ignored
+    before.diff(after, ignore_config).expect_exactly(
+        [
+            {
+                "table": "data",
+                "pk": 1,
+                "type": "modify",
+                "resulting_fields": [("value", "updated")],
+                "no_other_changes": True,
+            },
+        ]
+    )
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
 
-        # type: "insert" without fields allows insertion with any values
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "entities",
-                    "pk": 1,
-                    "type": "insert",
-                    # No fields - allows any values
-                },
-            ]
-        )
+def test_targeted_string_vs_int_pk_coercion(db_paths):
+    """Test that PK comparison works with string vs int coercion."""
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    conn.execute("INSERT INTO items VALUES (1, 'Item 1')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    conn.execute("INSERT INTO items VALUES (1, 'Item 1')")
+    conn.execute("INSERT INTO items VALUES (2, 'Item 2')")
+    conn.execute("INSERT INTO items VALUES (3, 'Item 3')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Use string PKs - should still work due to coercion
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "items",
+                "pk": "2",  # String PK
+                "type": "insert",
+                "fields": [("id", 2), ("name", "Item 2")],
+            },
+            {
+                "table": "items",
+                "pk": 3,  # Integer PK
+                "type": "insert",
+                "fields": [("id", 3), ("name", "Item 3")],
+            },
+        ]
+    )
 
 
-def test_targeted_multiple_tables_all_specs():
-    """Test targeted optimization with multiple tables and all spec types."""
+def test_targeted_modify_without_resulting_fields(db_paths):
+    """Test that type: 'modify' without resulting_fields allows any modification."""
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
-
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
-        conn.execute("CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT)")
-        conn.execute("CREATE TABLE comments (id INTEGER PRIMARY KEY, body TEXT)")
-        conn.execute("INSERT INTO users VALUES (1, 'Alice')")
-        conn.execute("INSERT INTO posts VALUES (1, 'Post 1')")
-        conn.execute("INSERT INTO posts VALUES (2, 'Post 2')")
-        conn.execute("INSERT INTO comments VALUES (1, 'Comment 1')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
-        conn.execute("CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT)")
-        conn.execute("CREATE TABLE comments (id INTEGER PRIMARY KEY, body TEXT)")
-        conn.execute("INSERT INTO users VALUES (1, 'Alice')")
-        conn.execute("INSERT INTO users VALUES (2, 'Bob')")  # Added
-        conn.execute("INSERT INTO posts VALUES (1, 'Post 1 Updated')")  # Modified
-        # Post 2 deleted
-        conn.execute("INSERT INTO comments VALUES (1, 'Comment 1')")  # Unchanged
-        conn.commit()
-        conn.close()
-
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
-
-        # Multiple tables with different change types
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "users",
-                    "pk": 2,
-                    "type": "insert",
-                    "fields": [("id", 2), ("name", "Bob")],
-                },
-                {
-                    "table": "posts",
-                    "pk": 1,
-                    "type": "modify",
-                    "resulting_fields": [("title", "Post 1 Updated")],
-                    "no_other_changes": True,
-                },
-                {
-                    "table": "posts",
-                    "pk": 2,
-                    "type": "delete",
-                },
-            ]
-        )
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE records (id INTEGER PRIMARY KEY, field_a TEXT, field_b TEXT, field_c TEXT)"
+    )
+    conn.execute("INSERT INTO records VALUES (1, 'a1', 'b1', 'c1')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE records (id INTEGER PRIMARY KEY, field_a TEXT, field_b TEXT, field_c TEXT)"
+    )
+    conn.execute("INSERT INTO records VALUES (1, 'a2', 'b2', 'c2')")  # All fields changed
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # type: "modify" without resulting_fields allows any modification
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "records",
+                "pk": 1,
+                "type": "modify",
+                # No resulting_fields - allows any changes
+            },
+        ]
+    )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
 
+def test_targeted_insert_without_fields(db_paths):
+    """Test that type: 'insert' without fields allows insertion with any values."""
 
-def test_targeted_row_exists_both_sides_no_change():
-    """Test that specifying a row that exists but didn't change works correctly."""
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE entities (id INTEGER PRIMARY KEY, data TEXT, secret TEXT)"
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE entities (id INTEGER PRIMARY KEY, data TEXT, secret TEXT)"
+    )
+    conn.execute("INSERT INTO entities VALUES (1, 'any data', 'any secret')")
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # type: "insert" without fields allows insertion with any values
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "entities",
+                "pk": 1,
+                "type": "insert",
+                # No fields - allows any values
+            },
+        ]
+    )
 
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        before_db = f.name
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        after_db = f.name
 
-    try:
-        conn = sqlite3.connect(before_db)
-        conn.execute(
-            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
-        )
-        conn.execute("INSERT INTO items VALUES (1, 'Item 1')")
-        conn.execute("INSERT INTO items VALUES (2, 'Item 2')")
-        conn.commit()
-        conn.close()
-
-        conn = sqlite3.connect(after_db)
-        conn.execute(
-            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
-        )
-        conn.execute("INSERT INTO items VALUES (1, 'Item 1')")  # Unchanged
-        conn.execute("INSERT INTO items VALUES (2, 'Item 2 Updated')")  # Changed
-        conn.commit()
-        conn.close()
+def test_targeted_multiple_tables_all_specs(db_paths):
+    """Test targeted optimization with multiple tables and all spec types."""
 
-        before = DatabaseSnapshot(before_db)
-        after = DatabaseSnapshot(after_db)
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT)")
+    conn.execute("CREATE TABLE comments (id INTEGER PRIMARY KEY, body TEXT)")
+    conn.execute("INSERT INTO users VALUES (1, 'Alice')")
+    conn.execute("INSERT INTO posts VALUES (1, 'Post 1')")
+    conn.execute("INSERT INTO posts VALUES (2, 'Post 2')")
+    conn.execute("INSERT INTO comments VALUES (1, 'Comment 1')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute("CREATE TABLE posts (id INTEGER PRIMARY KEY, title TEXT)")
+    conn.execute("CREATE TABLE comments (id INTEGER PRIMARY KEY, body TEXT)")
+    conn.execute("INSERT INTO users VALUES (1, 'Alice')")
+    conn.execute("INSERT INTO users VALUES (2, 'Bob')")  # Added
+    conn.execute("INSERT INTO posts VALUES (1, 'Post 1 Updated')")  # Modified
+    # Post 2 deleted
+    conn.execute("INSERT INTO comments VALUES (1, 'Comment 1')")  # Unchanged
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Multiple tables with different change types
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "users",
+                "pk": 2,
+                "type": "insert",
+                "fields": [("id", 2), ("name", "Bob")],
+            },
+            {
+                "table": "posts",
+                "pk": 1,
+                "type": "modify",
+                "resulting_fields": [("title", "Post 1 Updated")],
+                "no_other_changes": True,
+            },
+            {
+                "table": "posts",
+                "pk": 2,
+                "type": "delete",
+            },
+        ]
+    )
 
-        # Specify the change correctly
-        before.diff(after).expect_exactly(
-            [
-                {
-                    "table": "items",
-                    "pk": 2,
-                    "type": "modify",
-                    "resulting_fields": [("name", "Item 2 Updated")],
-                    "no_other_changes": True,
-                },
-            ]
-        )
 
-    finally:
-        os.unlink(before_db)
-        os.unlink(after_db)
+def test_targeted_row_exists_both_sides_no_change(db_paths):
+    """Test that specifying a row that exists but didn't change works correctly."""
+
+    before_db, after_db = db_paths
+
+    conn = sqlite3.connect(before_db)
+    conn.execute(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    conn.execute("INSERT INTO items VALUES (1, 'Item 1')")
+    conn.execute("INSERT INTO items VALUES (2, 'Item 2')")
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(after_db)
+    conn.execute(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
+    )
+    conn.execute("INSERT INTO items VALUES (1, 'Item 1')")  # Unchanged
+    conn.execute("INSERT INTO items VALUES (2, 'Item 2 Updated')")  # Changed
+    conn.commit()
+    conn.close()
+
+    before = DatabaseSnapshot(before_db)
+    after = DatabaseSnapshot(after_db)
+
+    # Specify the change correctly
+    before.diff(after).expect_exactly(
+        [
+            {
+                "table": "items",
+                "pk": 2,
+                "type": "modify",
+                "resulting_fields": [("name", "Item 2 Updated")],
+                "no_other_changes": True,
+            },
+        ]
+    )
 
 
 # ============================================================================
@@ -2479,6 +2102,32 @@ def test_targeted_row_exists_both_sides_no_change():
 # ============================================================================
 
 
+logger = logging.getLogger(__name__)
+
+_SEPARATOR = "=" * 80
+
+
+def _log_error_message(title: str, error_msg: str) -> None:
+    """Log an error message for manual review (pytest --log-cli-level=DEBUG)."""
+    logger.debug(
+        "\n%s\nTEST: %s\n%s\n%s\n%s", _SEPARATOR, title, _SEPARATOR, error_msg, _SEPARATOR
+    )
+
+
+def _validation_error(diff: Dict[str, Any], allowed_changes: List[Dict[str, Any]]) -> str:
+    """Validate a mock diff against allowed_changes and return the expected failure message."""
+    mock = MockSnapshotDiff(diff)
+    with pytest.raises(DiffValidationError) as exc_info:
+        mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
+    return str(exc_info.value)
+
+
+def _assert_all_in(text: str, *literals: str) -> None:
+    """Assert that every literal occurs in text, reporting all missing ones at once."""
+    missing = [literal for literal in literals if literal not in text]
+    assert not missing, f"missing {missing} in:\n{text}"
+
+
 class TestErrorMessaging:
     """Test cases for error message generation."""
 
@@ -2505,21 +2154,16 @@ class TestErrorMessaging:
         }
         allowed_changes = []  # No changes allowed
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Unexpected insertion, no spec")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Unexpected insertion, no spec", error_msg)
 
-        assert "INSERTION" in error_msg
-        assert "issues" in error_msg
-        assert "123" in error_msg
-        assert "No changes were allowed" in error_msg
+        _assert_all_in(
+            error_msg,
+            "INSERTION",
+            "issues",
+            "123",
+            "No changes were allowed",
+        )
 
     def test_insertion_with_field_value_mismatch(self):
         """Test error when insertion spec has wrong field value."""
@@ -2556,20 +2200,10 @@ class TestErrorMessaging:
             }
         ]
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Insertion with field value mismatch", error_msg)
 
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Insertion with field value mismatch")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        assert "INSERTION" in error_msg
-        assert "status" in error_msg
-        assert "open" in error_msg
+        _assert_all_in(error_msg, "INSERTION", "status", "open")
         assert "closed" in error_msg or "expected" in error_msg
 
     def test_insertion_with_missing_field_in_spec(self):
@@ -2608,20 +2242,43 @@ class TestErrorMessaging:
             }
         ]
 
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Insertion with missing field in spec", error_msg)
+
+        _assert_all_in(error_msg, "INSERTION", "priority", "NOT_IN_FIELDS_SPEC")
+
+    def test_structured_errors_on_exception(self):
+        """Test that the raised error carries one record per rejected row."""
+        diff = {
+            "issues": {
+                "table_name": "issues",
+                "primary_key": ["id"],
+                "added_rows": [
+                    {"row_id": 123, "data": {"id": 123, "title": "Bug report", "priority": "high"}}
+                ],
+                "removed_rows": [{"row_id": 7, "data": {"id": 7, "title": "Old"}}],
+                "modified_rows": [],
+            }
+        }
+        allowed_changes = [
+            {
+                "table": "issues",
+                "pk": 123,
+                "type": "insert",
+                "fields": [("id", 123), ("title", "Bug report")],
+            }
+        ]
+
         mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
+        with pytest.raises(DiffValidationError) as exc_info:
             mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
 
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Insertion with missing field in spec")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        assert "INSERTION" in error_msg
-        assert "priority" in error_msg
-        assert "NOT_IN_FIELDS_SPEC" in error_msg
+        errors = exc_info.value.errors
+        assert [(e["type"], e["table"], e["row_id"]) for e in errors] == [
+            ("insertion", "issues", 123),
+            ("deletion", "issues", 7),
+        ]
+        assert errors[0]["unmatched_fields"] == [("priority", "high", "NOT_IN_FIELDS_SPEC")]
 
     def test_unexpected_modification_no_spec(self):
         """Test error when a row is modified but no spec allows it."""
@@ -2651,22 +2308,17 @@ class TestErrorMessaging:
         }
         allowed_changes = []
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Unexpected modification, no spec", error_msg)
 
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Unexpected modification, no spec")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        assert "MODIFICATION" in error_msg
-        assert "users" in error_msg
-        assert "last_login" in error_msg
-        assert "2024-01-01" in error_msg
-        assert "2024-01-15" in error_msg
+        _assert_all_in(
+            error_msg,
+            "MODIFICATION",
+            "users",
+            "last_login",
+            "2024-01-01",
+            "2024-01-15",
+        )
 
     def test_modification_with_wrong_resulting_field_value(self):
         """Test error when modification spec has wrong resulting field value."""
@@ -2700,19 +2352,10 @@ class TestErrorMessaging:
             }
         ]
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Modification with wrong resulting field value", error_msg)
 
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Modification with wrong resulting field value")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        assert "MODIFICATION" in error_msg
-        assert "status" in error_msg
+        _assert_all_in(error_msg, "MODIFICATION", "status")
         assert "suspended" in error_msg or "expected" in error_msg
 
     def test_modification_with_extra_changes_strict_mode(self):
@@ -2745,20 +2388,15 @@ class TestErrorMessaging:
             }
         ]
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Modification with extra changes (strict mode)")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Modification with extra changes (strict mode)", error_msg)
 
-        assert "MODIFICATION" in error_msg
-        assert "updated_at" in error_msg
-        assert "NOT_IN_RESULTING_FIELDS" in error_msg
+        _assert_all_in(
+            error_msg,
+            "MODIFICATION",
+            "updated_at",
+            "NOT_IN_RESULTING_FIELDS",
+        )
 
     def test_unexpected_deletion_no_spec(self):
         """Test error when a row is deleted but no spec allows it."""
@@ -2782,20 +2420,10 @@ class TestErrorMessaging:
         }
         allowed_changes = []
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Unexpected deletion, no spec")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Unexpected deletion, no spec", error_msg)
 
-        assert "DELETION" in error_msg
-        assert "logs" in error_msg
-        assert "789" in error_msg
+        _assert_all_in(error_msg, "DELETION", "logs", "789")
 
     def test_multiple_unexpected_changes(self):
         """Test error message with multiple unexpected changes."""
@@ -2821,20 +2449,11 @@ class TestErrorMessaging:
         }
         allowed_changes = []
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Multiple unexpected changes")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Multiple unexpected changes", error_msg)
 
         # Should show multiple changes
-        assert "1." in error_msg
-        assert "2." in error_msg
+        _assert_all_in(error_msg, "1.", "2.")
 
     def test_many_changes_truncation(self):
         """Test that error message truncates when there are many changes."""
@@ -2854,20 +2473,11 @@ class TestErrorMessaging:
         }
         allowed_changes = []
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Many changes truncation")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Many changes truncation", error_msg)
 
         # Should show truncation message
-        assert "... and" in error_msg
-        assert "more unexpected changes" in error_msg
+        _assert_all_in(error_msg, "... and", "more unexpected changes")
 
     def test_allowed_changes_display(self):
         """Test that allowed changes are displayed correctly in error."""
@@ -2898,20 +2508,10 @@ class TestErrorMessaging:
             },
         ]
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Allowed changes display")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Allowed changes display", error_msg)
 
-        assert "Allowed changes were:" in error_msg
-        assert "issues" in error_msg
-        assert "123" in error_msg
+        _assert_all_in(error_msg, "Allowed changes were:", "issues", "123")
 
     def test_successful_validation_no_error(self):
         """Test that validation passes when changes match spec."""
@@ -2943,12 +2543,6 @@ class TestErrorMessaging:
         result = mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
         assert result is mock
 
-        print("\n" + "=" * 80)
-        print("TEST: Successful validation (no error)")
-        print("=" * 80)
-        print("Validation passed - no AssertionError raised")
-        print("=" * 80)
-
     def test_ellipsis_wildcard_in_spec(self):
         """Test that ... (ellipsis) wildcard accepts any value."""
         diff = {
@@ -2987,206 +2581,219 @@ class TestErrorMessaging:
         result = mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
         assert result is mock
 
-        print("\n" + "=" * 80)
-        print("TEST: Ellipsis wildcard in spec")
-        print("=" * 80)
-        print("Validation passed with ... wildcards")
-        print("=" * 80)
-
-
-class TestComprehensiveErrorScenarios:
-    """
-    Comprehensive test covering all error scenarios:
-
-    | Type         | (a) Correct        | (b) Wrong Fields (multiple) | (c) Missing         | (d) Unexpected     |
-    |--------------|--------------------|-----------------------------|---------------------|---------------------|
-    | INSERTION    | Row 100 matches    | Row 101 has 3 wrong fields  | Row 102 not added   | Row 999 unexpected  |
-    | MODIFICATION | Row 300 matches    | Row 301 has 2 wrong fields  | Row 302 not modified| -                   |
-    | DELETION     | Row 200 matches    | -                           | Row 202 not deleted | Row 201 unexpected  |
-    """
 
-    def test_all_scenarios(self):
-        """Test comprehensive scenarios: 3 correct + 7 errors."""
-        diff = {
-            "issues": {
-                "table_name": "issues",
-                "primary_key": ["id"],
-                "added_rows": [
-                    # (a) CORRECT INSERTION - matches spec exactly
-                    {
-                        "row_id": 100,
-                        "data": {
-                            "id": 100,
-                            "title": "Correct new issue",
-                            "status": "open",
-                            "priority": "medium",
-                        },
+@pytest.fixture(scope="module")
+def comprehensive_diff_template():
+    """Diff shared by TestComprehensiveErrorScenarios: 3 correct changes + 7 errors."""
+    return {
+        "issues": {
+            "table_name": "issues",
+            "primary_key": ["id"],
+            "added_rows": [
+                # (a) CORRECT INSERTION - matches spec exactly
+                {
+                    "row_id": 100,
+                    "data": {
+                        "id": 100,
+                        "title": "Correct new issue",
+                        "status": "open",
+                        "priority": "medium",
                     },
-                    # (b) WRONG FIELDS INSERTION - multiple fields wrong
-                    {
-                        "row_id": 101,
-                        "data": {
-                            "id": 101,
-                            "title": "Wrong title here",  # Spec expects 'Expected title'
-                            "status": "closed",  # Spec expects 'open'
-                            "priority": "low",  # Spec expects 'high'
-                        },
+                },
+                # (b) WRONG FIELDS INSERTION - multiple fields wrong
+                {
+                    "row_id": 101,
+                    "data": {
+                        "id": 101,
+                        "title": "Wrong title here",  # Spec expects 'Expected title'
+                        "status": "closed",  # Spec expects 'open'
+                        "priority": "low",  # Spec expects 'high'
                     },
-                    # (c) MISSING INSERTION - row 102 NOT here (spec expects it)
-                    # (d) UNEXPECTED INSERTION - no spec for this
-                    {
-                        "row_id": 999,
-                        "data": {
-                            "id": 999,
-                            "title": "Surprise insert",
-                            "status": "new",
-                            "priority": "high",
-                        },
+                },
+                # (c) MISSING INSERTION - row 102 NOT here (spec expects it)
+                # (d) UNEXPECTED INSERTION - no spec for this
+                {
+                    "row_id": 999,
+                    "data": {
+                        "id": 999,
+                        "title": "Surprise insert",
+                        "status": "new",
+                        "priority": "high",
                     },
-                ],
-                "removed_rows": [
-                    # (a) CORRECT DELETION - matches spec
-                    {
-                        "row_id": 200,
-                        "data": {
-                            "id": 200,
-                            "title": "Correctly deleted issue",
-                            "status": "resolved",
-                        },
+                },
+            ],
+            "removed_rows": [
+                # (a) CORRECT DELETION - matches spec
+                {
+                    "row_id": 200,
+                    "data": {
+                        "id": 200,
+                        "title": "Correctly deleted issue",
+                        "status": "resolved",
                     },
-                    # (b) UNEXPECTED DELETION - deleted but no spec
-                    {
-                        "row_id": 201,
-                        "data": {
-                            "id": 201,
-                            "title": "Should not be deleted",
-                            "status": "active",
-                        },
+                },
+                # (b) UNEXPECTED DELETION - deleted but no spec
+                {
+                    "row_id": 201,
+                    "data": {
+                        "id": 201,
+                        "title": "Should not be deleted",
+                        "status": "active",
                     },
-                    # (c) MISSING DELETION - row 202 NOT here (spec expects delete)
-                ],
-                "modified_rows": [
-                    # (a) CORRECT MODIFICATION - matches spec
-                    {
-                        "row_id": 300,
-                        "changes": {
-                            "status": {"before": "open", "after": "in_progress"},
-                        },
-                        "data": {
-                            "id": 300,
-                            "title": "Correctly modified issue",
-                            "status": "in_progress",
-                        },
+                },
+                # (c) MISSING DELETION - row 202 NOT here (spec expects delete)
+            ],
+            "modified_rows": [
+                # (a) CORRECT MODIFICATION - matches spec
+                {
+                    "row_id": 300,
+                    "changes": {
+                        "status": {"before": "open", "after": "in_progress"},
                     },
-                    # (b) WRONG FIELDS MODIFICATION - multiple fields wrong
-                    {
-                        "row_id": 301,
-                        "changes": {
-                            "status": {"before": "open", "after": "closed"},
-                            "priority": {"before": "low", "after": "high"},
-                        },
-                        "data": {
-                            "id": 301,
-                            "title": "Wrong value modification",
-                            "status": "closed",  # Spec expects 'resolved'
-                            "priority": "high",  # Spec expects 'low'
-                        },
+                    "data": {
+                        "id": 300,
+                        "title": "Correctly modified issue",
+                        "status": "in_progress",
                     },
-                    # (c) MISSING MODIFICATION - row 302 NOT here (spec expects modify)
-                ],
-            }
+                },
+                # (b) WRONG FIELDS MODIFICATION - multiple fields wrong
+                {
+                    "row_id": 301,
+                    "changes": {
+                        "status": {"before": "open", "after": "closed"},
+                        "priority": {"before": "low", "after": "high"},
+                    },
+                    "data": {
+                        "id": 301,
+                        "title": "Wrong value modification",
+                        "status": "closed",  # Spec expects 'resolved'
+                        "priority": "high",  # Spec expects 'low'
+                    },
+                },
+                # (c) MISSING MODIFICATION - row 302 NOT here (spec expects modify)
+            ],
         }
+    }
+
+@pytest.fixture(scope="module")
+def comprehensive_changes_template():
+    """Spec list matched against comprehensive_diff_template."""
+    return [
+        # === INSERTIONS ===
+        # (a) CORRECT - row 100 matches
+        {
+            "table": "issues",
+            "pk": 100,
+            "type": "insert",
+            "fields": [
+                ("id", 100),
+                ("title", "Correct new issue"),
+                ("status", "open"),
+                ("priority", "medium"),
+            ],
+        },
+        # (b) WRONG FIELDS - 3 fields mismatch
+        {
+            "table": "issues",
+            "pk": 101,
+            "type": "insert",
+            "fields": [
+                ("id", 101),
+                ("title", "Expected title"),  # MISMATCH: actual is 'Wrong title here'
+                ("status", "open"),  # MISMATCH: actual is 'closed'
+                ("priority", "high"),  # MISMATCH: actual is 'low'
+            ],
+        },
+        # (c) MISSING - expects row 102, not added
+        {
+            "table": "issues",
+            "pk": 102,
+            "type": "insert",
+            "fields": [
+                ("id", 102),
+                ("title", "Expected but missing"),
+                ("status", "new"),
+                ("priority", "low"),
+            ],
+        },
+        # (d) NO SPEC for row 999 - it's unexpected
+
+        # === DELETIONS ===
+        # (a) CORRECT - row 200 matches
+        {"table": "issues", "pk": 200, "type": "delete"},
+        # (b) NO SPEC for row 201 - it's unexpected
+        # (c) MISSING - expects row 202 deleted
+        {"table": "issues", "pk": 202, "type": "delete"},
+
+        # === MODIFICATIONS ===
+        # (a) CORRECT - row 300 matches
+        {
+            "table": "issues",
+            "pk": 300,
+            "type": "modify",
+            "resulting_fields": [("status", "in_progress")],
+            "no_other_changes": True,
+        },
+        # (b) WRONG FIELDS - 2 fields mismatch
+        {
+            "table": "issues",
+            "pk": 301,
+            "type": "modify",
+            "resulting_fields": [
+                ("status", "resolved"),  # MISMATCH: actual is 'closed'
+                ("priority", "low"),  # MISMATCH: actual is 'high'
+            ],
+            "no_other_changes": True,
+        },
+        # (c) MISSING - expects row 302 modified
+        {
+            "table": "issues",
+            "pk": 302,
+            "type": "modify",
+            "resulting_fields": [("status", "done")],
+            "no_other_changes": True,
+        },
+    ]
+
+
+# The validators may normalize specs in place, so each test gets its own copy of
+# the module-scoped literals and cannot leak changes into later tests.
+
+
+@pytest.fixture
+def comprehensive_diff(comprehensive_diff_template):
+    return copy.deepcopy(comprehensive_diff_template)
+
+
+@pytest.fixture
+def comprehensive_changes(comprehensive_changes_template):
+    return copy.deepcopy(comprehensive_changes_template)
 
-        allowed_changes = [
-            # === INSERTIONS ===
-            # (a) CORRECT - row 100 matches
-            {
-                "table": "issues",
-                "pk": 100,
-                "type": "insert",
-                "fields": [
-                    ("id", 100),
-                    ("title", "Correct new issue"),
-                    ("status", "open"),
-                    ("priority", "medium"),
-                ],
-            },
-            # (b) WRONG FIELDS - 3 fields mismatch
-            {
-                "table": "issues",
-                "pk": 101,
-                "type": "insert",
-                "fields": [
-                    ("id", 101),
-                    ("title", "Expected title"),  # MISMATCH: actual is 'Wrong title here'
-                    ("status", "open"),  # MISMATCH: actual is 'closed'
-                    ("priority", "high"),  # MISMATCH: actual is 'low'
-                ],
-            },
-            # (c) MISSING - expects row 102, not added
-            {
-                "table": "issues",
-                "pk": 102,
-                "type": "insert",
-                "fields": [
-                    ("id", 102),
-                    ("title", "Expected but missing"),
-                    ("status", "new"),
-                    ("priority", "low"),
-                ],
-            },
-            # (d) NO SPEC for row 999 - it's unexpected
-
-            # === DELETIONS ===
-            # (a) CORRECT - row 200 matches
-            {"table": "issues", "pk": 200, "type": "delete"},
-            # (b) NO SPEC for row 201 - it's unexpected
-            # (c) MISSING - expects row 202 deleted
-            {"table": "issues", "pk": 202, "type": "delete"},
 
-            # === MODIFICATIONS ===
-            # (a) CORRECT - row 300 matches
-            {
-                "table": "issues",
-                "pk": 300,
-                "type": "modify",
-                "resulting_fields": [("status", "in_progress")],
-                "no_other_changes": True,
-            },
-            # (b) WRONG FIELDS - 2 fields mismatch
-            {
-                "table": "issues",
-                "pk": 301,
-                "type": "modify",
-                "resulting_fields": [
-                    ("status", "resolved"),  # MISMATCH: actual is 'closed'
-                    ("priority", "low"),  # MISMATCH: actual is 'high'
-                ],
-                "no_other_changes": True,
-            },
-            # (c) MISSING - expects row 302 modified
-            {
-                "table": "issues",
-                "pk": 302,
-                "type": "modify",
-                "resulting_fields": [("status", "done")],
-                "no_other_changes": True,
-            },
-        ]
+class TestComprehensiveErrorScenarios:
+    """
+    Comprehensive test covering all error scenarios:
 
-        mock = MockSnapshotDiff(diff)
+    | Type         | (a) Correct        | (b) Wrong Fields (multiple) | (c) Missing         | (d) Unexpected     |
+    |--------------|--------------------|-----------------------------|---------------------|---------------------|
+    | INSERTION    | Row 100 matches    | Row 101 has 3 wrong fields  | Row 102 not added   | Row 999 unexpected  |
+    | MODIFICATION | Row 300 matches    | Row 301 has 2 wrong fields  | Row 302 not modified| -                   |
+    | DELETION     | Row 200 matches    | -                           | Row 202 not deleted | Row 201 unexpected  |
+    """
+
+    def test_all_scenarios(self, comprehensive_diff, comprehensive_changes):
+        """Test comprehensive scenarios: 3 correct + 7 errors."""
+        mock = MockSnapshotDiff(comprehensive_diff)
         with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
+            mock._validate_diff_against_allowed_changes_v2(
+                comprehensive_diff, comprehensive_changes
+            )
 
         error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Comprehensive Error Scenarios (expect_only_v2)")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        _log_error_message("Comprehensive Error Scenarios (expect_only_v2)", error_msg)
 
         # Verify CORRECT changes (100, 200, 300) are NOT errors
-        unexpected_section = error_msg.split("Allowed changes were:")[0]
+        unexpected_section = error_msg.partition("Allowed changes were:")[0]
         assert "Row ID: 100" not in unexpected_section, "Row 100 (correct insert) should not be error"
         assert "Row ID: 200" not in unexpected_section, "Row 200 (correct delete) should not be error"
         assert "Row ID: 300" not in unexpected_section, "Row 300 (correct modify) should not be error"
@@ -3199,57 +2806,14 @@ class TestComprehensiveErrorScenarios:
         assert "201" in error_msg, "Row 201 (unexpected delete) should be error"
         assert "999" in error_msg, "Row 999 (unexpected insert) should be error"
 
-    def test_with_expect_exactly(self):
+    def test_with_expect_exactly(self, comprehensive_diff, comprehensive_changes):
         """Test the same scenarios with expect_exactly - should catch all 7 errors."""
-        diff = {
-            "issues": {
-                "table_name": "issues",
-                "primary_key": ["id"],
-                "added_rows": [
-                    {"row_id": 100, "data": {"id": 100, "title": "Correct new issue", "status": "open", "priority": "medium"}},
-                    {"row_id": 101, "data": {"id": 101, "title": "Wrong title here", "status": "closed", "priority": "low"}},
-                    {"row_id": 999, "data": {"id": 999, "title": "Surprise insert", "status": "new", "priority": "high"}},
-                ],
-                "removed_rows": [
-                    {"row_id": 200, "data": {"id": 200, "title": "Correctly deleted issue", "status": "resolved"}},
-                    {"row_id": 201, "data": {"id": 201, "title": "Should not be deleted", "status": "active"}},
-                ],
-                "modified_rows": [
-                    {"row_id": 300, "changes": {"status": {"before": "open", "after": "in_progress"}},
-                     "data": {"id": 300, "status": "in_progress"}},
-                    {"row_id": 301, "changes": {"status": {"before": "open", "after": "closed"}, "priority": {"before": "low", "after": "high"}},
-                     "data": {"id": 301, "status": "closed", "priority": "high"}},
-                ],
-            }
-        }
-
-        expected_changes = [
-            {"table": "issues", "pk": 100, "type": "insert",
-             "fields": [("id", 100), ("title", "Correct new issue"), ("status", "open"), ("priority", "medium")]},
-            {"table": "issues", "pk": 101, "type": "insert",
-             "fields": [("id", 101), ("title", "Expected title"), ("status", "open"), ("priority", "high")]},
-            {"table": "issues", "pk": 102, "type": "insert",
-             "fields": [("id", 102), ("title", "Expected but missing"), ("status", "new"), ("priority", "low")]},
-            {"table": "issues", "pk": 200, "type": "delete"},
-            {"table": "issues", "pk": 202, "type": "delete"},
-            {"table": "issues", "pk": 300, "type": "modify",
-             "resulting_fields": [("status", "in_progress")], "no_other_changes": True},
-            {"table": "issues", "pk": 301, "type": "modify",
-             "resulting_fields": [("status", "resolved"), ("priority", "low")], "no_other_changes": True},
-            {"table": "issues", "pk": 302, "type": "modify",
-             "resulting_fields": [("status", "done")], "no_other_changes": True},
-        ]
-
-        mock = MockSnapshotDiff(diff)
+        mock = MockSnapshotDiff(comprehensive_diff)
         with pytest.raises(AssertionError) as exc_info:
-            mock.expect_exactly(expected_changes)
+            mock.expect_exactly(comprehensive_changes)
 
         error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Comprehensive Error Scenarios with expect_exactly")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        _log_error_message("Comprehensive Error Scenarios with expect_exactly", error_msg)
 
         # Verify error count
         assert "7 error(s) detected" in error_msg
@@ -3418,11 +2982,7 @@ class TestComprehensiveErrorScenarios:
             mock.expect_exactly(expected_changes)
 
         error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Special Patterns (ellipsis, None, no_other_changes)")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        _log_error_message("Special Patterns (ellipsis, None, no_other_changes)", error_msg)
 
         # Should have 3 errors: 401 (wrong status), 403 (not NULL), 501 (extra change)
         assert "3 error(s) detected" in error_msg, f"Expected 3 errors, got: {error_msg}"
@@ -3591,15 +3151,10 @@ class TestMixedCorrectAndIncorrect:
         ]
 
         mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
+        with pytest.raises(DiffValidationError) as exc_info:
             mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
-
         error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Mixed correct and incorrect - all change types")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        _log_error_message("Mixed correct and incorrect - all change types", error_msg)
 
         # Verify CORRECT changes are NOT in error message (they should be matched)
         # Row 100 (correct addition) should NOT appear as an error
@@ -3619,11 +3174,13 @@ class TestMixedCorrectAndIncorrect:
         assert "301" in error_msg, "Row 301 (incorrect modification) should be in error"
         assert "updated_at" in error_msg, "updated_at field should be mentioned"
 
-        # Count the number of errors - should be exactly 3
-        # (101 insertion mismatch, 201 unexpected deletion, 301 modification mismatch)
-        lines_with_row_id = [l for l in error_msg.split('\n') if 'Row ID:' in l]
-        print(f"\nRows with errors: {len(lines_with_row_id)}")
-        print("Row IDs in error:", [l.strip() for l in lines_with_row_id])
+        # Exactly 3 errors, in validation order: 301 modification mismatch,
+        # 101 insertion mismatch, 201 unexpected deletion
+        assert [(e["type"], e["row_id"]) for e in exc_info.value.errors] == [
+            ("modification", 301),
+            ("insertion", 101),
+            ("deletion", 201),
+        ]
 
     def test_mixed_with_detailed_output(self):
         """
@@ -3697,20 +3254,12 @@ class TestMixedCorrectAndIncorrect:
             },
         ]
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock._validate_diff_against_allowed_changes_v2(diff, allowed_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Mixed with detailed output")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        error_msg = _validation_error(diff, allowed_changes)
+        _log_error_message("Mixed with detailed output", error_msg)
 
         # Correct ones should NOT appear in the "unexpected changes" section
         # (They may appear in "Allowed changes were:" section which is OK)
-        unexpected_section = error_msg.split("Allowed changes were:")[0]
+        unexpected_section = error_msg.partition("Allowed changes were:")[0]
         assert "task-001" not in unexpected_section, "task-001 (correct insert) should not be in unexpected section"
         assert "task-003" not in unexpected_section, "task-003 (correct modify) should not be in unexpected section"
 
@@ -3721,18 +3270,104 @@ class TestMixedCorrectAndIncorrect:
         # Should mention the 'done' field issue
         assert "done" in error_msg
 
-        print("\n--- Analysis ---")
-        print(f"task-001 in error: {'task-001' in error_msg} (should be False)")
-        print(f"task-002 in error: {'task-002' in error_msg} (should be True)")
-        print(f"task-003 in error: {'task-003' in error_msg} (should be False)")
-        print(f"task-004 in error: {'task-004' in error_msg} (should be True)")
-
 
 # ============================================================================
 # Mock-based tests for expect_exactly function
 # ============================================================================
 
 
+def _single_table_mock(
+    table: str, added=(), removed=(), modified=()
+) -> MockSnapshotDiff:
+    """MockSnapshotDiff over a single ``id``-keyed table with the given row changes."""
+    return MockSnapshotDiff(
+        {
+            table: {
+                "table_name": table,
+                "primary_key": ["id"],
+                "added_rows": list(added),
+                "removed_rows": list(removed),
+                "modified_rows": list(modified),
+            }
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def expect_exactly_comprehensive_error():
+    """
+    expect_exactly failure message for a diff covering every error category:
+    - 3 correct (should pass)
+    - 2 wrong field values + 1 unexpected delete (should fail)
+    - 3 missing changes (should fail)
+    """
+    diff = {
+        "issues": {
+            "table_name": "issues",
+            "primary_key": ["id"],
+            "added_rows": [
+                # CORRECT insert
+                {"row_id": 100, "data": {"id": 100, "title": "Correct", "status": "open"}},
+                # WRONG FIELD insert - status is 'closed' not 'open'
+                {"row_id": 101, "data": {"id": 101, "title": "Wrong", "status": "closed"}},
+                # Row 102 NOT added (missing insert)
+            ],
+            "removed_rows": [
+                # CORRECT delete
+                {"row_id": 200, "data": {"id": 200, "title": "Deleted"}},
+                # UNEXPECTED delete - no spec for this
+                {"row_id": 201, "data": {"id": 201, "title": "Unexpected delete"}},
+                # Row 202 NOT deleted (missing delete)
+            ],
+            "modified_rows": [
+                # CORRECT modify
+                {"row_id": 300, "changes": {"status": {"before": "open", "after": "closed"}},
+                 "data": {"id": 300, "status": "closed"}},
+                # WRONG FIELD modify - status is 'closed' not 'resolved'
+                {"row_id": 301, "changes": {"status": {"before": "open", "after": "closed"}},
+                 "data": {"id": 301, "status": "closed"}},
+                # Row 302 NOT modified (missing modify)
+            ],
+        }
+    }
+
+    expected_changes = [
+        # CORRECT insert
+        {"table": "issues", "pk": 100, "type": "insert",
+         "fields": [("id", 100), ("title", "Correct"), ("status", "open")]},
+        # WRONG FIELD insert - expects 'open' but got 'closed'
+        {"table": "issues", "pk": 101, "type": "insert",
+         "fields": [("id", 101), ("title", "Wrong"), ("status", "open")]},
+        # MISSING insert
+        {"table": "issues", "pk": 102, "type": "insert",
+         "fields": [("id", 102), ("title", "Missing"), ("status", "new")]},
+
+        # CORRECT delete
+        {"table": "issues", "pk": 200, "type": "delete"},
+        # No spec for 201 - it's unexpected
+        # MISSING delete
+        {"table": "issues", "pk": 202, "type": "delete"},
+
+        # CORRECT modify
+        {"table": "issues", "pk": 300, "type": "modify",
+         "resulting_fields": [("status", "closed")], "no_other_changes": True},
+        # WRONG FIELD modify - expects 'resolved' but got 'closed'
+        {"table": "issues", "pk": 301, "type": "modify",
+         "resulting_fields": [("status", "resolved")], "no_other_changes": True},
+        # MISSING modify
+        {"table": "issues", "pk": 302, "type": "modify",
+         "resulting_fields": [("status", "done")], "no_other_changes": True},
+    ]
+
+    mock = MockSnapshotDiff(diff)
+    with pytest.raises(AssertionError) as exc_info:
+        mock.expect_exactly(expected_changes)
+
+    error_msg = str(exc_info.value)
+    _log_error_message("Comprehensive - All Error Types", error_msg)
+    return error_msg
+
+
 class TestExpectExactlyMock:
     """
     Test cases for the expect_exactly function using mock diffs.
@@ -3744,17 +3379,12 @@ class TestExpectExactlyMock:
 
     def test_all_specs_satisfied_passes(self):
         """When all specs are satisfied exactly, should pass."""
-        diff = {
-            "users": {
-                "table_name": "users",
-                "primary_key": ["id"],
-                "added_rows": [
-                    {"row_id": 1, "data": {"id": 1, "name": "Alice"}},
-                ],
-                "removed_rows": [],
-                "modified_rows": [],
-            }
-        }
+        mock = _single_table_mock(
+            "users",
+            added=[
+                {"row_id": 1, "data": {"id": 1, "name": "Alice"}},
+            ],
+        )
         expected_changes = [
             {
                 "table": "users",
@@ -3764,161 +3394,77 @@ class TestExpectExactlyMock:
             }
         ]
 
-        mock = MockSnapshotDiff(diff)
         # Should pass - spec matches exactly
         result = mock.expect_exactly(expected_changes)
         assert result is mock
 
-        print("\n" + "=" * 80)
-        print("TEST: All specs satisfied - PASSED")
-        print("=" * 80)
-
-    def test_missing_insert_fails(self):
-        """When spec expects insert but row wasn't added, should fail."""
-        diff = {
-            "users": {
-                "table_name": "users",
-                "primary_key": ["id"],
-                "added_rows": [],  # No rows added
-                "removed_rows": [],
-                "modified_rows": [],
-            }
-        }
-        expected_changes = [
-            {
-                "table": "users",
-                "pk": 100,
-                "type": "insert",
-                "fields": [("id", 100), ("name", "Expected but missing")],
-            }
-        ]
-
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock.expect_exactly(expected_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Missing insert")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        assert "MISSING" in error_msg
-        assert "insert" in error_msg.lower()
-        assert "100" in error_msg
-
-    def test_missing_delete_fails(self):
-        """When spec expects delete but row still exists, should fail."""
-        diff = {
-            "users": {
-                "table_name": "users",
-                "primary_key": ["id"],
-                "added_rows": [],
-                "removed_rows": [],  # No rows deleted
-                "modified_rows": [],
-            }
-        }
-        expected_changes = [
-            {
-                "table": "users",
-                "pk": 200,
-                "type": "delete",
-            }
-        ]
-
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
-            mock.expect_exactly(expected_changes)
-
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Missing delete")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        assert "MISSING" in error_msg
-        assert "delete" in error_msg.lower()
-        assert "200" in error_msg
-
-    def test_missing_modify_fails(self):
-        """When spec expects modify but row wasn't changed, should fail."""
-        diff = {
-            "users": {
-                "table_name": "users",
-                "primary_key": ["id"],
-                "added_rows": [],
-                "removed_rows": [],
-                "modified_rows": [],  # No rows modified
-            }
-        }
-        expected_changes = [
-            {
-                "table": "users",
-                "pk": 300,
-                "type": "modify",
-                "resulting_fields": [("status", "active")],
-                "no_other_changes": True,
-            }
-        ]
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            pytest.param(
+                {
+                    "table": "users",
+                    "pk": 100,
+                    "type": "insert",
+                    "fields": [("id", 100), ("name", "Expected but missing")],
+                },
+                id="insert",
+            ),
+            pytest.param(
+                {
+                    "table": "users",
+                    "pk": 200,
+                    "type": "delete",
+                },
+                id="delete",
+            ),
+            pytest.param(
+                {
+                    "table": "users",
+                    "pk": 300,
+                    "type": "modify",
+                    "resulting_fields": [("status", "active")],
+                    "no_other_changes": True,
+                },
+                id="modify",
+            ),
+        ],
+    )
+    def test_missing_change_fails(self, spec):
+        """When a spec expects a change but the row wasn't touched, should fail."""
+        mock = _single_table_mock("users")
 
-        mock = MockSnapshotDiff(diff)
         with pytest.raises(AssertionError) as exc_info:
-            mock.expect_exactly(expected_changes)
+            mock.expect_exactly([spec])
 
         error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Missing modify")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
+        _log_error_message(f"Missing {spec['type']}", error_msg)
 
         assert "MISSING" in error_msg
-        assert "modify" in error_msg.lower()
-        assert "300" in error_msg
+        assert spec["type"] in error_msg.lower()
+        assert str(spec["pk"]) in error_msg
 
     def test_unexpected_change_still_fails(self):
         """Unexpected changes should still be caught (like expect_only_v2)."""
-        diff = {
-            "users": {
-                "table_name": "users",
-                "primary_key": ["id"],
-                "added_rows": [
-                    {"row_id": 999, "data": {"id": 999, "name": "Unexpected"}},
-                ],
-                "removed_rows": [],
-                "modified_rows": [],
-            }
-        }
+        mock = _single_table_mock(
+            "users",
+            added=[
+                {"row_id": 999, "data": {"id": 999, "name": "Unexpected"}},
+            ],
+        )
         expected_changes = []  # No changes expected
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
+        with pytest.raises(AssertionError, match="UNEXPECTED|Unexpected"):
             mock.expect_exactly(expected_changes)
 
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Unexpected change")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        assert "UNEXPECTED" in error_msg or "Unexpected" in error_msg
-
     def test_wrong_field_value_fails(self):
         """When change happens but field value doesn't match spec, should fail."""
-        diff = {
-            "users": {
-                "table_name": "users",
-                "primary_key": ["id"],
-                "added_rows": [
-                    {"row_id": 1, "data": {"id": 1, "name": "Alice", "role": "admin"}},
-                ],
-                "removed_rows": [],
-                "modified_rows": [],
-            }
-        }
+        mock = _single_table_mock(
+            "users",
+            added=[
+                {"row_id": 1, "data": {"id": 1, "name": "Alice", "role": "admin"}},
+            ],
+        )
         expected_changes = [
             {
                 "table": "users",
@@ -3928,151 +3474,124 @@ class TestExpectExactlyMock:
             }
         ]
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
+        with pytest.raises(AssertionError, match="role|UNEXPECTED"):
             mock.expect_exactly(expected_changes)
 
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Wrong field value")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        assert "role" in error_msg or "UNEXPECTED" in error_msg
-
-    def test_comprehensive_all_errors(self):
-        """
-        Comprehensive test with all 6 error types:
-        - 3 correct (should pass)
-        - 3 wrong field values (should fail)
-        - 3 missing changes (should fail)
-        """
-        diff = {
-            "issues": {
-                "table_name": "issues",
-                "primary_key": ["id"],
-                "added_rows": [
-                    # CORRECT insert
-                    {"row_id": 100, "data": {"id": 100, "title": "Correct", "status": "open"}},
-                    # WRONG FIELD insert - status is 'closed' not 'open'
-                    {"row_id": 101, "data": {"id": 101, "title": "Wrong", "status": "closed"}},
-                    # Row 102 NOT added (missing insert)
-                ],
-                "removed_rows": [
-                    # CORRECT delete
-                    {"row_id": 200, "data": {"id": 200, "title": "Deleted"}},
-                    # UNEXPECTED delete - no spec for this
-                    {"row_id": 201, "data": {"id": 201, "title": "Unexpected delete"}},
-                    # Row 202 NOT deleted (missing delete)
-                ],
-                "modified_rows": [
-                    # CORRECT modify
-                    {"row_id": 300, "changes": {"status": {"before": "open", "after": "closed"}},
-                     "data": {"id": 300, "status": "closed"}},
-                    # WRONG FIELD modify - status is 'closed' not 'resolved'
-                    {"row_id": 301, "changes": {"status": {"before": "open", "after": "closed"}},
-                     "data": {"id": 301, "status": "closed"}},
-                    # Row 302 NOT modified (missing modify)
-                ],
-            }
-        }
-
+    def test_structured_errors_by_category(self):
+        """The raised ExpectExactlyError splits the failing rows by category."""
+        mock = _single_table_mock(
+            "users",
+            added=[
+                {"row_id": 1, "data": {"id": 1, "name": "Alice", "role": "admin"}},
+                {"row_id": 999, "data": {"id": 999, "name": "Unexpected"}},
+            ],
+        )
         expected_changes = [
-            # CORRECT insert
-            {"table": "issues", "pk": 100, "type": "insert",
-             "fields": [("id", 100), ("title", "Correct"), ("status", "open")]},
-            # WRONG FIELD insert - expects 'open' but got 'closed'
-            {"table": "issues", "pk": 101, "type": "insert",
-             "fields": [("id", 101), ("title", "Wrong"), ("status", "open")]},
-            # MISSING insert
-            {"table": "issues", "pk": 102, "type": "insert",
-             "fields": [("id", 102), ("title", "Missing"), ("status", "new")]},
-
-            # CORRECT delete
-            {"table": "issues", "pk": 200, "type": "delete"},
-            # No spec for 201 - it's unexpected
-            # MISSING delete
-            {"table": "issues", "pk": 202, "type": "delete"},
-
-            # CORRECT modify
-            {"table": "issues", "pk": 300, "type": "modify",
-             "resulting_fields": [("status", "closed")], "no_other_changes": True},
-            # WRONG FIELD modify - expects 'resolved' but got 'closed'
-            {"table": "issues", "pk": 301, "type": "modify",
-             "resulting_fields": [("status", "resolved")], "no_other_changes": True},
-            # MISSING modify
-            {"table": "issues", "pk": 302, "type": "modify",
-             "resulting_fields": [("status", "done")], "no_other_changes": True},
+            {
+                "table": "users",
+                "pk": 1,
+                "type": "insert",
+                "fields": [("id", 1), ("name", "Alice"), ("role", "user")],
+            },
+            {
+                "table": "users",
+                "pk": 200,
+                "type": "delete",
+            },
         ]
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(AssertionError) as exc_info:
+        with pytest.raises(ExpectExactlyError) as exc_info:
             mock.expect_exactly(expected_changes)
 
-        error_msg = str(exc_info.value)
-        print("\n" + "=" * 80)
-        print("TEST: Comprehensive - All Error Types")
-        print("=" * 80)
-        print(error_msg)
-        print("=" * 80)
-
-        # Should detect MISSING changes
-        assert "MISSING" in error_msg, "Should report missing changes"
-        assert "102" in error_msg, "Should mention missing insert pk=102"
-        assert "202" in error_msg, "Should mention missing delete pk=202"
-        assert "302" in error_msg, "Should mention missing modify pk=302"
-
-        # Should detect UNEXPECTED changes
-        assert "201" in error_msg, "Should mention unexpected delete pk=201"
-
-        # Should detect WRONG FIELD values
-        assert "101" in error_msg, "Should mention wrong field insert pk=101"
-        assert "301" in error_msg, "Should mention wrong field modify pk=301"
-
-        print("\n--- Error Categories Detected ---")
-        print(f"Missing changes (102, 202, 302): {'102' in error_msg and '202' in error_msg and '302' in error_msg}")
-        print(f"Unexpected change (201): {'201' in error_msg}")
-        print(f"Wrong field values (101, 301): {'101' in error_msg and '301' in error_msg}")
+        error = exc_info.value
+        assert [wf["pk"] for wf in error.wrong_fields] == [1]
+        assert error.wrong_fields[0]["mismatches"] == [
+            ("role", "user", "admin", "value mismatch")
+        ]
+        assert [uc["pk"] for uc in error.unexpected] == [999]
+        assert [mc["pk"] for mc in error.missing] == [200]
+        assert error.matched_specs == []
+        assert [
+            (e["category"], e["spec_type"], e["type"], e["row_id"]) for e in error.errors
+        ] == [
+            ("wrong_fields", "insert", "insertion", 1),
+            ("unexpected", "insert", "insertion", 999),
+            ("missing", "delete", "deletion", 200),
+        ]
+
+    @pytest.mark.parametrize(
+        "validate",
+        [
+            lambda mock, specs: mock.expect_exactly(specs),
+            lambda mock, specs: mock._validate_diff_against_allowed_changes_v2(
+                mock._collect(), specs
+            ),
+        ],
+        ids=["expect_exactly", "expect_only_v2"],
+    )
+    def test_structured_errors_share_the_record_shape(self, validate):
+        """Both validators' errors can be read through the DiffValidationError schema."""
+        mock = _single_table_mock(
+            "users",
+            added=[{"row_id": 999, "data": {"id": 999, "name": "Unexpected"}}],
+            removed=[{"row_id": 7, "data": {"id": 7, "name": "Old"}}],
+        )
+        expected_changes = [{"table": "users", "pk": 7, "type": "delete"}]
+
+        with pytest.raises(DiffValidationError) as exc_info:
+            validate(mock, expected_changes)
+
+        assert [
+            (e["type"], e["table"], e["row_id"], e["field"])
+            for e in exc_info.value.errors
+        ] == [("insertion", "users", 999, None)]
+
+    @pytest.mark.parametrize(
+        "needle,reason",
+        [
+            # Should detect MISSING changes
+            ("MISSING", "Should report missing changes"),
+            ("102", "Should mention missing insert pk=102"),
+            ("202", "Should mention missing delete pk=202"),
+            ("302", "Should mention missing modify pk=302"),
+            # Should detect UNEXPECTED changes
+            ("201", "Should mention unexpected delete pk=201"),
+            # Should detect WRONG FIELD values
+            ("101", "Should mention wrong field insert pk=101"),
+            ("301", "Should mention wrong field modify pk=301"),
+            # Should pair the unexpected delete with the missing one
+            (
+                "DELETE row 201 might be intended as row 202",
+                "Should hint that delete pk=201 was meant for pk=202",
+            ),
+        ],
+    )
+    def test_comprehensive_all_errors(
+        self, expect_exactly_comprehensive_error, needle, reason
+    ):
+        """Every error category in the comprehensive diff is reported."""
+        assert needle in expect_exactly_comprehensive_error, reason
 
     def test_empty_diff_empty_spec_passes(self):
         """Empty diff with empty specs should pass."""
-        diff = {
-            "users": {
-                "table_name": "users",
-                "primary_key": ["id"],
-                "added_rows": [],
-                "removed_rows": [],
-                "modified_rows": [],
-            }
-        }
+        mock = _single_table_mock("users")
         expected_changes = []
 
-        mock = MockSnapshotDiff(diff)
         result = mock.expect_exactly(expected_changes)
         assert result is mock
 
-        print("\n" + "=" * 80)
-        print("TEST: Empty diff, empty spec - PASSED")
-        print("=" * 80)
-
     def test_no_other_changes_required(self):
         """Modify specs with resulting_fields must have no_other_changes."""
-        diff = {
-            "issues": {
-                "table_name": "issues",
-                "primary_key": ["id"],
-                "added_rows": [],
-                "removed_rows": [],
-                "modified_rows": [
-                    {
-                        "row_id": 100,
-                        "changes": {"status": {"before": "open", "after": "closed"}},
-                        "data": {"id": 100, "status": "closed"},
-                    }
-                ],
-            }
-        }
+        mock = _single_table_mock(
+            "issues",
+            modified=[
+                {
+                    "row_id": 100,
+                    "changes": {"status": {"before": "open", "after": "closed"}},
+                    "data": {"id": 100, "status": "closed"},
+                }
+            ],
+        )
 
         # Missing no_other_changes should raise ValueError
         expected_changes = [
@@ -4085,7 +3604,6 @@ class TestExpectExactlyMock:
             }
         ]
 
-        mock = MockSnapshotDiff(diff)
         with pytest.raises(ValueError) as exc_info:
             mock.expect_exactly(expected_changes)
 
@@ -4093,28 +3611,20 @@ class TestExpectExactlyMock:
         assert "no_other_changes" in error_msg
         assert "missing required" in error_msg.lower()
 
-        print("\n" + "=" * 80)
-        print("TEST: no_other_changes required - ValueError raised correctly")
-        print(f"Error: {error_msg}")
-        print("=" * 80)
+        _log_error_message("no_other_changes required - ValueError raised correctly", error_msg)
 
     def test_no_other_changes_must_be_boolean(self):
         """no_other_changes must be a boolean, not a string or other type."""
-        diff = {
-            "issues": {
-                "table_name": "issues",
-                "primary_key": ["id"],
-                "added_rows": [],
-                "removed_rows": [],
-                "modified_rows": [
-                    {
-                        "row_id": 100,
-                        "changes": {"status": {"before": "open", "after": "closed"}},
-                        "data": {"id": 100, "status": "closed"},
-                    }
-                ],
-            }
-        }
+        mock = _single_table_mock(
+            "issues",
+            modified=[
+                {
+                    "row_id": 100,
+                    "changes": {"status": {"before": "open", "after": "closed"}},
+                    "data": {"id": 100, "status": "closed"},
+                }
+            ],
+        )
 
         # no_other_changes as string should raise ValueError
         expected_changes = [
@@ -4127,18 +3637,9 @@ class TestExpectExactlyMock:
             }
         ]
 
-        mock = MockSnapshotDiff(diff)
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="(?i)boolean"):
             mock.expect_exactly(expected_changes)
 
-        error_msg = str(exc_info.value)
-        assert "boolean" in error_msg.lower()
-
-        print("\n" + "=" * 80)
-        print("TEST: no_other_changes must be boolean - ValueError raised correctly")
-        print(f"Error: {error_msg}")
-        print("=" * 80)
-
 
 # ============================================================================
 # Run tests directly
@@ -0,0 +1,120 @@
+"""Regression tests for the lazy top-level ``fleet`` namespace.
+
+``fleet/__init__.py`` resolves its public names on first access, so a bare
+``import fleet`` (or importing a light submodule) must not drag in the HTTP
+clients or the pydantic model layer. Each check runs in a fresh interpreter
+so earlier imports in the test session cannot mask a regression.
+"""
+
+import os
+import subprocess
+import sys
+from typing import List, Set
+
+import pytest
+
+import fleet
+
+# Modules that must only load once the corresponding public name is used.
+EAGER_DENYLIST = {
+    "httpx",
+    "aiohttp",
+    "pydantic",
+    "playwright",
+    "fleet.client",
+    "fleet._async.client",
+    "fleet.models",
+    "fleet.tasks",
+    "fleet.judge",
+}
+
+# Ceiling for the summed `-X importtime` self cost of `fleet*` modules during
+# `import fleet`. Only the package's own modules count, so third-party import
+# cost and a slow runner cannot push it over; the lazy namespace sits around
+# 1ms, while eagerly building the client and model layer is far above this.
+MAX_FLEET_SELF_US = 50_000
+REPEATS = 5
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def _loaded_modules(statement: str) -> Set[str]:
+    """Run `statement` in a fresh interpreter and return the loaded module names."""
+    proc = _run(["-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"])
+    return set(proc.stdout.split())
+
+
+def _fleet_self_us() -> int:
+    """Microseconds spent in `fleet` modules' own bodies during `import fleet`."""
+    proc = _run(["-X", "importtime", "-c", "import fleet"])
+    total = 0
+    for line in proc.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <indented name>"
+        if not line.startswith("import time:"):
+            continue
+        self_us, _cumulative, name = (
+            part.strip() for part in line.split(":", 1)[1].split("|")
+        )
+        if name == "fleet" or name.startswith("fleet."):
+            total += int(self_us)
+    if not total:
+        raise AssertionError("`fleet` missing from -X importtime output")
+    return total
+
+
+def test_import_fleet_does_not_load_client_stack():
+    modules = _loaded_modules("import fleet")
+
+    assert "fleet" in modules
+    assert EAGER_DENYLIST.isdisjoint(modules), sorted(EAGER_DENYLIST & modules)
+
+
+def test_import_verifiers_db_does_not_load_client_stack():
+    modules = _loaded_modules("import fleet.verifiers.db")
+
+    assert "fleet.verifiers.db" in modules
+    assert {"httpx", "aiohttp", "fleet.client", "fleet._async.client"}.isdisjoint(
+        modules
+    )
+
+
+@pytest.mark.parametrize(
+    "module", ["fleet.resources.sqlite", "fleet._async.resources.sqlite"]
+)
+def test_resource_module_imports_standalone(module):
+    # Without fleet/__init__ loading the client eagerly, these must still
+    # resolve their import cycle with fleet.instance on their own.
+    assert module in _loaded_modules(f"import {module}")
+
+
+@pytest.mark.parametrize(
+    "name,module",
+    [
+        ("Fleet", "fleet.client"),
+        ("AsyncFleet", "fleet._async.client"),
+        ("Task", "fleet._async.tasks"),
+    ],
+)
+def test_public_name_loads_its_module_on_access(name, module):
+    modules = _loaded_modules(f"import fleet\nfleet.{name}")
+
+    assert module in modules
+
+
+@pytest.mark.parametrize("name", fleet.__all__)
+def test_public_name_resolves(name):
+    assert getattr(fleet, name) is not None
+
+
+@pytest.mark.skipif(
+    not os.environ.get("FLEET_IMPORT_BUDGET"),
+    reason="timing check; set FLEET_IMPORT_BUDGET=1 to run",
+)
+def test_import_fleet_self_time_within_budget():
+    samples = [_fleet_self_us() for _ in range(REPEATS)]
+
+    assert min(samples) < MAX_FLEET_SELF_US, samples
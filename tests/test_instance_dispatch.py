@@ -9,6 +9,35 @@ from fleet.client import Fleet
 from fleet._async.client import AsyncFleet
 
 
+@pytest.fixture
+def async_fleet_client():
+    """Create an AsyncFleet client with mocked HTTP client.
+
+    Shared by the async test classes so the client is built in one place. It
+    awaits nothing, so it is a plain fixture: an async one would run on its own
+    per-test loop instead of the class loop the tests use.
+    """
+    with patch("fleet._async.client.default_httpx_client") as mock_client:
+        mock_client.return_value = AsyncMock()
+        client = AsyncFleet(api_key="test_key")
+        # Mock the internal client's request method
+        client.client.request = AsyncMock()
+        return client
+
+
+@pytest.fixture
+def close_after_test():
+    """Register in-memory envs to close once the test ends, even if it fails.
+
+    Named :memory: databases are process-wide shared-cache URIs, so an env left
+    open would leak its rows into later tests that reuse the same name.
+    """
+    envs = []
+    yield envs.append
+    for env in envs:
+        env._instance.close()
+
+
 class TestFleetInstanceDispatch:
     """Test Fleet.instance() dispatching logic."""
 
@@ -234,12 +263,13 @@ class TestFleetInstanceDispatch:
         assert result.success is True
         assert result.rows == [[1, 'hello']]
 
-    def test_memory_namespace_syntax(self, fleet_client):
+    def test_memory_namespace_syntax(self, fleet_client, close_after_test):
         """Test that :memory:namespace syntax creates isolated databases."""
         env = fleet_client.instance({
             "current": ":memory:current",
             "seed": ":memory:seed"
         })
+        close_after_test(env)
 
         current = env.db("current")
         seed = env.db("seed")
@@ -272,11 +302,12 @@ class TestFleetInstanceDispatch:
         assert result.success is True
         assert result.rows is None or len(result.rows) == 0
 
-    def test_memory_data_sharing(self, fleet_client):
+    def test_memory_data_sharing(self, fleet_client, close_after_test):
         """Test that multiple db() calls to same namespace share data."""
         env = fleet_client.instance({
             "current": ":memory:shared"
         })
+        close_after_test(env)
 
         # Create table and insert data via first connection
         db1 = env.db("current")
@@ -297,11 +328,12 @@ class TestFleetInstanceDispatch:
         assert result.success is True
         assert result.rows == [[1, 'shared_data'], [2, 'more_data']]
 
-    def test_memory_data_persists(self, fleet_client):
+    def test_memory_data_persists(self, fleet_client, close_after_test):
         """Test that memory data persists while env is alive."""
         env = fleet_client.instance({
             "current": ":memory:persistent"
         })
+        close_after_test(env)
 
         # Create and populate database
         db = env.db("current")
@@ -340,20 +372,10 @@ class TestFleetInstanceDispatch:
         assert len(env._instance._memory_anchors) == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="class")
 class TestAsyncFleetInstanceDispatch:
     """Test AsyncFleet.instance() dispatching logic."""
 
-    @pytest.fixture
-    async def async_fleet_client(self):
-        """Create an AsyncFleet client with mocked HTTP client."""
-        with patch("fleet._async.client.default_httpx_client") as mock_client:
-            mock_client.return_value = AsyncMock()
-            client = AsyncFleet(api_key="test_key")
-            # Mock the internal client's request method
-            client.client.request = AsyncMock()
-            return client
-
     @pytest.fixture
     def temp_db_files(self):
         """Create temporary SQLite database files."""
@@ -468,19 +490,10 @@ class TestAsyncFleetInstanceDispatch:
         assert not hasattr(db2, "_custom_attribute")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="class")
 class TestAsyncFleetInMemoryTests:
     """Test AsyncFleet in-memory functionality."""
 
-    @pytest.fixture
-    async def async_fleet_client(self):
-        """Create an AsyncFleet client with mocked HTTP client."""
-        with patch("fleet._async.client.default_httpx_client") as mock_client:
-            mock_client.return_value = AsyncMock()
-            client = AsyncFleet(api_key="test_key")
-            client.client.request = AsyncMock()
-            return client
-
     async def test_memory_basic_syntax(self, async_fleet_client):
         """Test that :memory: syntax works in async."""
         env = await async_fleet_client.instance({
@@ -502,12 +515,13 @@ class TestAsyncFleetInMemoryTests:
         assert result.success is True
         assert result.rows == [[1, 'hello']]
 
-    async def test_memory_namespace_syntax(self, async_fleet_client):
+    async def test_memory_namespace_syntax(self, async_fleet_client, close_after_test):
         """Test that :memory:namespace syntax creates isolated databases in async."""
         env = await async_fleet_client.instance({
             "current": ":memory:current",
             "seed": ":memory:seed"
         })
+        close_after_test(env)
 
         current = env.db("current")
         seed = env.db("seed")
@@ -535,11 +549,12 @@ class TestAsyncFleetInMemoryTests:
         assert result.success is True
         assert result.rows is None or len(result.rows) == 0
 
-    async def test_memory_data_sharing(self, async_fleet_client):
+    async def test_memory_data_sharing(self, async_fleet_client, close_after_test):
         """Test that multiple db() calls to same namespace share data in async."""
         env = await async_fleet_client.instance({
             "current": ":memory:shared"
         })
+        close_after_test(env)
 
         # Create table and insert data via first connection
         db1 = env.db("current")
@@ -560,11 +575,12 @@ class TestAsyncFleetInMemoryTests:
         assert result.success is True
         assert result.rows == [[1, 'shared_data'], [2, 'more_data']]
 
-    async def test_memory_data_persists(self, async_fleet_client):
+    async def test_memory_data_persists(self, async_fleet_client, close_after_test):
         """Test that memory data persists while env is alive in async."""
         env = await async_fleet_client.instance({
             "current": ":memory:persistent"
         })
+        close_after_test(env)
 
         # Create and populate database
         db = env.db("current")
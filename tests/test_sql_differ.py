@@ -0,0 +1,189 @@
+"""
+Tests for SQLiteDiffer's in-SQLite EXCEPT fast path.
+
+diff_table only pulls rows that differ into Python when both sides share a
+schema and a unique key; otherwise it loads whole tables. Both paths must
+produce the same diff.
+"""
+
+import sqlite3
+import pytest
+from fleet.verifiers.sql_differ import SQLiteDiffer
+
+
+def _make_db(path: str, script: str) -> str:
+    conn = sqlite3.connect(path)
+    conn.executescript(script)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _normalized(result: dict) -> dict:
+    """Diff result with row lists in a stable order."""
+    normalized = dict(result)
+    for key in ("added_rows", "removed_rows", "modified_rows"):
+        normalized[key] = sorted(result[key], key=lambda row: repr(row["row_id"]))
+    return normalized
+
+
+@pytest.fixture
+def differ(tmp_path):
+    before = _make_db(
+        str(tmp_path / "before.db"),
+        """
+        CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT);
+        INSERT INTO users VALUES (1, 'Alice', 'active');
+        INSERT INTO users VALUES (2, 'Bob', 'active');
+        INSERT INTO users VALUES (3, 'Carol', 'active');
+        INSERT INTO users VALUES (4, 'Dave', NULL);
+        """,
+    )
+    after = _make_db(
+        str(tmp_path / "after.db"),
+        """
+        CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, status TEXT);
+        INSERT INTO users VALUES (1, 'Alice', 'active');
+        INSERT INTO users VALUES (2, 'Bob', 'suspended');
+        INSERT INTO users VALUES (4, 'Dave', NULL);
+        INSERT INTO users VALUES (5, 'Eve', 'active');
+        """,
+    )
+    return SQLiteDiffer(before, after)
+
+
+def test_fast_path_reports_only_changed_rows(differ):
+    before_rows, after_rows, unchanged = differ.get_changed_table_data("users", ["id"])
+
+    assert sorted(before_rows) == [2, 3]
+    assert sorted(after_rows) == [2, 5]
+    assert unchanged == 2
+
+
+def test_fast_path_matches_full_table_diff(differ, monkeypatch):
+    fast = differ.diff_table("users")
+    monkeypatch.setattr(differ, "get_changed_table_data", lambda *args: None)
+    full = differ.diff_table("users")
+
+    assert _normalized(fast) == _normalized(full)
+    assert fast["unchanged_count"] == 2
+    assert fast["total_changes"] == 3
+
+
+def test_schema_change_falls_back_to_full_diff(tmp_path):
+    before = _make_db(
+        str(tmp_path / "before.db"),
+        "CREATE TABLE t (id INTEGER PRIMARY KEY, a TEXT);"
+        "INSERT INTO t VALUES (1, 'x');",
+    )
+    after = _make_db(
+        str(tmp_path / "after.db"),
+        "CREATE TABLE t (id INTEGER PRIMARY KEY, a TEXT, b TEXT);"
+        "INSERT INTO t VALUES (1, 'x', 'y');",
+    )
+    differ = SQLiteDiffer(before, after)
+
+    assert differ.get_changed_table_data("t", ["id"]) is None
+    result = differ.diff_table("t")
+    assert [row["row_id"] for row in result["modified_rows"]] == [1]
+    assert result["modified_rows"][0]["changes"] == {
+        "b": {"before": None, "after": "y"}
+    }
+
+
+def test_undeclared_key_falls_back_to_full_diff(tmp_path):
+    # "id" is only a fallback key here, so it may repeat; EXCEPT cannot be used
+    before = _make_db(
+        str(tmp_path / "before.db"),
+        "CREATE TABLE t (id INTEGER, a TEXT); INSERT INTO t VALUES (1, 'x');",
+    )
+    after = _make_db(
+        str(tmp_path / "after.db"),
+        "CREATE TABLE t (id INTEGER, a TEXT); INSERT INTO t VALUES (1, 'z');",
+    )
+    differ = SQLiteDiffer(before, after)
+
+    assert differ.get_changed_table_data("t", ["id"]) is None
+    assert [row["row_id"] for row in differ.diff_table("t")["modified_rows"]] == [1]
+
+
+def test_nocase_column_change_is_still_detected(tmp_path):
+    # EXCEPT would compare with NOCASE and hide this change
+    before = _make_db(
+        str(tmp_path / "before.db"),
+        "CREATE TABLE t (id INTEGER PRIMARY KEY, a TEXT COLLATE NOCASE);"
+        "INSERT INTO t VALUES (1, 'abc');",
+    )
+    after = _make_db(
+        str(tmp_path / "after.db"),
+        "CREATE TABLE t (id INTEGER PRIMARY KEY, a TEXT COLLATE NOCASE);"
+        "INSERT INTO t VALUES (1, 'ABC');",
+    )
+    differ = SQLiteDiffer(before, after)
+
+    result = differ.diff_table("t")
+    assert result["modified_rows"][0]["changes"] == {
+        "a": {"before": "abc", "after": "ABC"}
+    }
+
+
+def test_collate_in_literals_and_names_keeps_fast_path(tmp_path):
+    script = (
+        'CREATE TABLE t (id INTEGER PRIMARY KEY, "collate_mode" TEXT,'
+        " note TEXT DEFAULT 'no COLLATE here');"
+    )
+    before = _make_db(
+        str(tmp_path / "before.db"), script + "INSERT INTO t VALUES (1, 'a', 'x');"
+    )
+    after = _make_db(
+        str(tmp_path / "after.db"), script + "INSERT INTO t VALUES (1, 'b', 'x');"
+    )
+    differ = SQLiteDiffer(before, after)
+
+    assert differ._declares_collation("t") is False
+    before_rows, after_rows, _ = differ.get_changed_table_data("t", ["id"])
+    assert list(before_rows) == list(after_rows) == [1]
+
+
+def test_quoted_key_column_is_escaped(tmp_path):
+    script = 'CREATE TABLE t ("my""id" INTEGER PRIMARY KEY, a TEXT);'
+    before = _make_db(
+        str(tmp_path / "before.db"),
+        script + "INSERT INTO t VALUES (1, 'x'); INSERT INTO t VALUES (2, 'y');",
+    )
+    after = _make_db(
+        str(tmp_path / "after.db"),
+        script + "INSERT INTO t VALUES (1, 'x'); INSERT INTO t VALUES (2, 'z');",
+    )
+    differ = SQLiteDiffer(before, after)
+
+    before_rows, after_rows, unchanged = differ.get_changed_table_data("t", ['my"id'])
+    assert list(before_rows) == list(after_rows) == [2]
+    assert unchanged == 1
+
+
+def test_shared_memory_databases_use_fast_path():
+    before_uri = "file:sql_differ_before?mode=memory&cache=shared"
+    after_uri = "file:sql_differ_after?mode=memory&cache=shared"
+    # Shared memory databases only live while a connection is open
+    before_conn = sqlite3.connect(before_uri, uri=True)
+    after_conn = sqlite3.connect(after_uri, uri=True)
+    try:
+        before_conn.executescript(
+            "CREATE TABLE t (id INTEGER PRIMARY KEY, a TEXT);"
+            "INSERT INTO t VALUES (1, 'x');"
+        )
+        after_conn.executescript(
+            "CREATE TABLE t (id INTEGER PRIMARY KEY, a TEXT);"
+            "INSERT INTO t VALUES (1, 'y');"
+        )
+        differ = SQLiteDiffer(before_uri, after_uri)
+
+        assert differ.get_changed_table_data("t", ["id"]) is not None
+        result = differ.diff_table("t")
+        assert result["modified_rows"][0]["changes"] == {
+            "a": {"before": "x", "after": "y"}
+        }
+    finally:
+        before_conn.close()
+        after_conn.close()
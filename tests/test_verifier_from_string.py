@@ -27,30 +27,21 @@ def my_verifier(env):
         assert verifier.key == "test-key"
         assert verifier.func.__name__ == "my_verifier"
 
-    def test_verifier_with_from_fleet_import_verifier(self):
-        """Test the bug case: 'from fleet import verifier' should not be selected."""
-        code = """
-from fleet import verifier
-
-def my_actual_verifier(env):
-    return 1.0
-"""
-        verifier = sync_verifier_from_string(
-            verifier_func=code,
-            verifier_id="test-verifier",
-            verifier_key="test-key",
-            sha256="test-sha",
-        )
-        assert verifier is not None
-        # The function name should be 'my_actual_verifier', not 'verifier'
-        assert verifier.func.__name__ == "my_actual_verifier"
-
-    def test_verifier_with_from_fleet_verifiers_import_verifier(self):
-        """Test bug case: 'from fleet.verifiers import verifier'."""
-        code = """
-from fleet.verifiers import verifier
-
-def check_something(env):
+    @pytest.mark.parametrize(
+        "import_line,func_name",
+        [
+            ("from fleet import verifier", "my_actual_verifier"),
+            ("from fleet.verifiers import verifier", "check_something"),
+            ("from fleet.verifiers.verifier import verifier", "validate_task"),
+        ],
+        ids=["fleet", "fleet.verifiers", "fleet.verifiers.verifier"],
+    )
+    def test_verifier_with_imported_verifier_name(self, import_line, func_name):
+        """Test the bug case: an imported 'verifier' should not be selected."""
+        code = f"""
+{import_line}
+
+def {func_name}(env):
     return 1.0
 """
         verifier = sync_verifier_from_string(
@@ -60,24 +51,8 @@ def check_something(env):
             sha256="test-sha",
         )
         assert verifier is not None
-        assert verifier.func.__name__ == "check_something"
-
-    def test_verifier_with_from_fleet_verifiers_verifier_import_verifier(self):
-        """Test bug case: 'from fleet.verifiers.verifier import verifier'."""
-        code = """
-from fleet.verifiers.verifier import verifier
-
-def validate_task(env):
-    return 0.5
-"""
-        verifier = sync_verifier_from_string(
-            verifier_func=code,
-            verifier_id="test-verifier",
-            verifier_key="test-key",
-            sha256="test-sha",
-        )
-        assert verifier is not None
-        assert verifier.func.__name__ == "validate_task"
+        # The function name should be the defined function, not 'verifier'
+        assert verifier.func.__name__ == func_name
 
     def test_verifier_with_multiple_imports(self):
         """Test verifier with multiple import statements."""
@@ -150,34 +125,6 @@ def my_verifier(env):
         assert verifier is not None
         assert verifier.func.__name__ == "my_verifier"
 
-    def test_no_function_defined_raises_error(self):
-        """Test that code with no function raises ValueError."""
-        code = """
-x = 1
-y = 2
-"""
-        with pytest.raises(ValueError, match="No function found in verifier code"):
-            sync_verifier_from_string(
-                verifier_func=code,
-                verifier_id="test-verifier",
-                verifier_key="test-key",
-                sha256="test-sha",
-            )
-
-    def test_only_imports_no_function_raises_error(self):
-        """Test that code with only imports and no function raises ValueError."""
-        code = """
-from fleet import verifier
-import json
-"""
-        with pytest.raises(ValueError, match="No function found in verifier code"):
-            sync_verifier_from_string(
-                verifier_func=code,
-                verifier_id="test-verifier",
-                verifier_key="test-key",
-                sha256="test-sha",
-            )
-
     def test_verifier_with_multiple_functions(self):
         """Test that first user-defined function is selected when multiple exist."""
         code = """
@@ -305,33 +252,35 @@ def sync_verifier_in_async_module(env):
         assert verifier is not None
         assert verifier.func.__name__ == "sync_verifier_in_async_module"
 
-    def test_async_no_function_defined_raises_error(self):
-        """Test that async code with no function raises ValueError."""
-        code = """
+
+@pytest.mark.parametrize(
+    "verifier_from_string",
+    [sync_verifier_from_string, async_verifier_from_string],
+    ids=["sync", "async"],
+)
+@pytest.mark.parametrize(
+    "code",
+    [
+        """
 x = 1
 y = 2
-"""
-        with pytest.raises(ValueError, match="No function found in verifier code"):
-            async_verifier_from_string(
-                verifier_func=code,
-                verifier_id="test-verifier",
-                verifier_key="test-key",
-                sha256="test-sha",
-            )
-
-    def test_async_only_imports_raises_error(self):
-        """Test that async code with only imports raises ValueError."""
-        code = """
+""",
+        """
 from fleet import verifier
-import asyncio
-"""
-        with pytest.raises(ValueError, match="No function found in verifier code"):
-            async_verifier_from_string(
-                verifier_func=code,
-                verifier_id="test-verifier",
-                verifier_key="test-key",
-                sha256="test-sha",
-            )
+import json
+""",
+    ],
+    ids=["no-function", "only-imports"],
+)
+def test_no_function_defined_raises_error(verifier_from_string, code):
+    """Test that code without a user-defined function raises ValueError."""
+    with pytest.raises(ValueError, match="No function found in verifier code"):
+        verifier_from_string(
+            verifier_func=code,
+            verifier_id="test-verifier",
+            verifier_key="test-key",
+            sha256="test-sha",
+        )
 
 
 class TestRealWorldScenarios:
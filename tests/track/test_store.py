@@ -7,8 +7,20 @@ from pathlib import Path
 import httpx
 import pytest
 
+from fleet.track.api import TrackAPIClient
 from fleet.track.paths import TrackPaths
-from fleet.track.store import LocalSessionStore, Session
+from fleet.track.store import (
+    ChainedSessionStore,
+    DEFAULT_PAGE_LIMIT,
+    LocalSessionStore,
+    MAX_PAGE_LIMIT,
+    NativeFilesSessionStore,
+    RemoteSessionStore,
+    Session,
+    _decode_cursor,
+    _encode_cursor,
+    _sort_key,
+)
 from fleet.track.unified import (
     AssistantMessage,
     UserMessage,
@@ -345,8 +357,6 @@ def test_cursor_format_pinned():
     broken wire compat with the server's `_encode_cursor` (see
     theseus:orchestrator/public_api/track.py). Update both sides
     together or paged scripts will paginate against the wrong rows."""
-    from fleet.track.store import _encode_cursor, _decode_cursor
-
     cursor = _encode_cursor("2026-04-30T00:00:00Z", "abc12345")
     # base64url(json({"la":"2026-04-30T00:00:00Z","id":"abc12345"})), no padding.
     assert cursor == "eyJsYSI6IjIwMjYtMDQtMzBUMDA6MDA6MDBaIiwiaWQiOiJhYmMxMjM0NSJ9"
@@ -355,16 +365,12 @@ def test_cursor_format_pinned():
 
 
 def test_cursor_with_null_last_active_round_trips():
-    from fleet.track.store import _encode_cursor, _decode_cursor
-
     cursor = _encode_cursor(None, "deadbeef")
     decoded = _decode_cursor(cursor)
     assert decoded == {"la": None, "id": "deadbeef"}
 
 
 def test_cursor_decode_rejects_garbage():
-    from fleet.track.store import _decode_cursor
-
     with pytest.raises(ValueError):
         _decode_cursor("not-base64!!")
 
@@ -373,7 +379,6 @@ def test_cursor_decode_rejects_missing_keys():
     """A cursor that decodes to JSON but lacks `la`/`id` is wire garbage."""
     import base64
     import json as j
-    from fleet.track.store import _decode_cursor
 
     raw = j.dumps({"foo": "bar"}, separators=(",", ":"))
     cursor = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
@@ -382,8 +387,6 @@ def test_cursor_decode_rejects_missing_keys():
 
 
 def test_cursor_decode_empty_returns_none():
-    from fleet.track.store import _decode_cursor
-
     assert _decode_cursor(None) is None
     assert _decode_cursor("") is None
 
@@ -500,8 +503,6 @@ def test_page_filters_apply_before_cursor(tmp_path: Path):
 def test_page_clamps_limit_to_max(tmp_path: Path):
     """`limit` over MAX_PAGE_LIMIT must be clamped, not used as-is —
     matches the server's `Query(le=200)` constraint."""
-    from fleet.track.store import MAX_PAGE_LIMIT
-
     store = _store(tmp_path)
     # Seed MAX+1 sessions; ask for MAX*10 — should still get exactly MAX
     # in the page.
@@ -524,8 +525,6 @@ def test_page_invalid_cursor_raises_value_error(tmp_path: Path):
 def test_list_uses_default_page_limit(tmp_path: Path):
     """`list()` without an explicit limit must return up to DEFAULT_PAGE_LIMIT
     rows — verifying the delegation to page() didn't regress."""
-    from fleet.track.store import DEFAULT_PAGE_LIMIT
-
     store = _store(tmp_path)
     for i in range(DEFAULT_PAGE_LIMIT + 5):
         store.create(
@@ -615,8 +614,6 @@ def test_chained_page_eager_merge_paginates(tmp_path: Path):
     and paginates the merged view via cursor. Means the picker's
     default `--source auto` honors page-size and paging just like a
     single backend."""
-    from fleet.track.store import ChainedSessionStore, NativeFilesSessionStore
-
     local = _store(tmp_path)
     for i in range(3):
         local.create(
@@ -642,8 +639,6 @@ def test_chained_page_eager_merge_paginates(tmp_path: Path):
 def test_chained_page_dedupes_by_id(tmp_path: Path):
     """When a session appears in multiple backing stores (e.g. native
     and stub both have the same id), chained.page() emits it once."""
-    from fleet.track.store import ChainedSessionStore
-
     local_a = _store(tmp_path)
     local_b = LocalSessionStore(TrackPaths.under(tmp_path), name="other-store")
     for store in (local_a, local_b):
@@ -661,8 +656,6 @@ def test_chained_page_dedupes_by_id(tmp_path: Path):
 def test_chained_page_query_filter(tmp_path: Path):
     """Query filter applies before merging — and stays valid across
     backing stores."""
-    from fleet.track.store import ChainedSessionStore, NativeFilesSessionStore
-
     local = _store(tmp_path)
     local.create(
         _session(id="keep", metadata={"title": "match-me"}),
@@ -696,8 +689,6 @@ class _FakeAuthorityStore:
 
     def __init__(self, sessions: list[Session]) -> None:
         # Pre-sorted (last_active DESC, id DESC), like a real impl.
-        from fleet.track.store import _sort_key
-
         self._sessions = sorted(sessions, key=_sort_key, reverse=True)
 
     def list(self, **kwargs) -> list[Session]:
@@ -739,8 +730,6 @@ def test_chained_delegates_paging_when_authority_present(tmp_path: Path):
     straight through. Local rows that fall in the page's window
     overlay; rows OUTSIDE the window must NOT show up (they belong to
     other authority pages)."""
-    from fleet.track.store import ChainedSessionStore
-
     # Authority owns 4 rows. We'll page in chunks of 2.
     auth = _FakeAuthorityStore(
         [
@@ -782,8 +771,6 @@ def test_chained_authority_cursor_is_passthrough(tmp_path: Path):
     """The authority's cursors are returned verbatim — they're not
     rewrapped or merged with local cursors. Round-trip a cursor and
     confirm it walks the authority's pages unchanged."""
-    from fleet.track.store import ChainedSessionStore
-
     auth = _FakeAuthorityStore(
         [
             _session(id=f"r{i}", last_active=f"2026-05-{i:02d}T00:00:00Z")
@@ -807,8 +794,6 @@ def test_chained_local_only_uses_eager_merge(tmp_path: Path):
     """Sanity: when no backing store opts into authoritative paging,
     the legacy eager-merge path is used (existing tests already
     cover correctness; here we just confirm the dispatch picks it)."""
-    from fleet.track.store import ChainedSessionStore
-
     local_a = _store(tmp_path)
     local_b = LocalSessionStore(TrackPaths.under(tmp_path), name="b")
     local_a.create(_session(id="a"), [_msg("x")])
@@ -825,8 +810,6 @@ def test_chained_local_only_uses_eager_merge(tmp_path: Path):
 
 
 def _remote_api(handler):
-    from fleet.track.api import TrackAPIClient
-
     return TrackAPIClient(
         client=httpx.Client(
             transport=httpx.MockTransport(handler),
@@ -837,8 +820,6 @@ def _remote_api(handler):
 
 
 def test_remote_store_pages_with_query_and_origin_device():
-    from fleet.track.store import RemoteSessionStore
-
     captured: dict = {}
 
     def handler(req: httpx.Request) -> httpx.Response:
@@ -888,8 +869,6 @@ def test_remote_store_pages_with_query_and_origin_device():
 
 
 def test_remote_store_fetches_content_and_parses_events():
-    from fleet.track.store import RemoteSessionStore
-
     sid = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
     native = (
         '{"type":"session_meta","timestamp":"2026-05-05T00:00:00Z",'
@@ -925,8 +904,6 @@ def test_remote_store_fetches_content_and_parses_events():
 
 
 def test_remote_store_get_resolves_unique_prefix_across_pages():
-    from fleet.track.store import RemoteSessionStore
-
     sid = "abcdef01-2345-6789-abcd-ef0123456789"
     calls: list[str] = []
 
@@ -976,8 +953,6 @@ def test_remote_store_get_resolves_unique_prefix_across_pages():
 
 
 def test_remote_store_get_ambiguous_prefix_raises():
-    from fleet.track.store import RemoteSessionStore
-
     def handler(req: httpx.Request) -> httpx.Response:
         if req.url.path == "/v1/track/sessions/abcdef01":
             return httpx.Response(404, json={"detail": "not found"})